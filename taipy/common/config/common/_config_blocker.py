@@ -20,6 +20,7 @@ class _ConfigBlocker:
 
     __logger = _TaipyLogger._get_logger()
     __block_config_update = False
+    __revision = 0
 
     @classmethod
     def _block(cls):
@@ -33,6 +34,11 @@ class _ConfigBlocker:
             cls.__logger.debug("Unblocking configuration update.")
             cls.__block_config_update = False
 
+    @classmethod
+    def _get_revision(cls) -> int:
+        """Return the number of configuration updates, which changes whenever the configuration may have changed."""
+        return cls.__revision
+
     @classmethod
     def _check(cls):
         def inner(f):
@@ -46,7 +52,10 @@ class _ConfigBlocker:
                     cls.__logger.error(f"ConfigurationUpdateBlocked: {error_message}")
                     raise ConfigurationUpdateBlocked(error_message)
 
-                return f(*args, **kwargs)
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    cls.__revision += 1
 
             return _check_if_is_blocking
 
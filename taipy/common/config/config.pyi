@@ -405,7 +405,14 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                If the *"handoff"* property is True, the data written by a job is handed off to the jobs
+                reading it through shared memory, and written to the storage asynchronously. If the
+                *"transient"* property is also True, the data is not written to the storage at all: it is
+                only available to the jobs of the same submission.<br/>
+                If the *"fingerprint"* property is True, a hash of the written data is recorded on each
+                write. The skippable tasks reading the data node are then skipped when the data is the one
+                they last ran with, even if it was written again since.
 
         Returns:
             The new data node configuration.
@@ -900,7 +907,13 @@ class Config:
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                The *"priority"* property is an integer ordering the jobs of the same submission
+                priority, 0 by default. The *"resources"* property is a dictionary of the amounts of
+                the resources declared in the job execution configuration the task needs to run,
+                e.g. `{"cpu": 4, "mem_gb": 8}`. In *"standalone"* mode, the *"executor"* property
+                selects where the task jobs run: *"process"* (the default) for a worker process, or
+                *"thread"* for a worker thread of the orchestrator process, which suits I/O-bound tasks.
 
         Returns:
             The new task configuration.
@@ -946,14 +959,25 @@ class Config:
 
         Parameters:
             mode (Optional[str]): The job execution mode.
-                Possible values are: *"standalone"* or *"development"*.
+                Possible values are: *"standalone"*, *"remote"* or *"development"*.
             max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* mode.
                 This indicates the maximum number of jobs able to run in parallel.<br/>
                 The default value is 2.<br/>
                 A string can be provided to dynamically set the value using an environment
                 variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
                 `&lt;env_var&gt;` is the name of an environment variable.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                The *"resources"* property is a dictionary of the amounts of resources the
+                *"standalone"* workers share, e.g. `{"cpu": 8, "mem_gb": 16}`. A job only starts
+                when the resources its task declares are available.<br/>
+                The *"max_nb_of_threads"* property is the maximum number of jobs of tasks configured
+                with the *"thread"* executor able to run in parallel. The default value is 4.<br/>
+                In *"remote"* mode, the *"address"* property is the *"host:port"* or *"unix:path"*
+                address the worker agents started with `taipy worker --connect <address>` connect to,
+                "localhost:5755" by default. The *"authkey"* property, required in *"remote"* mode, is the
+                key the dispatcher and the agents authenticate each other with, and the
+                *"heartbeat_interval"* property is the number of seconds between the heartbeats of the
+                agents, 5 by default.
 
         Returns:
             The new job execution configuration.
@@ -970,6 +994,11 @@ class Config:
         mode: Optional[str] = None,
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
+        entity_cache: Optional[bool] = None,
+        entity_cache_max_size: Optional[int] = None,
+        retention_max_age: Optional[int] = None,
+        retention_max_count: Optional[int] = None,
+        retention_interval: Optional[int] = None,
         **properties,
     ) -> "CoreSection":
         """Configure the Orchestrator service.
@@ -984,9 +1013,18 @@ class Config:
                 used in conjunction with the *root_folder* attribute. That means the storage path is
                 <root_folder><storage_folder> (The default path is "./taipy/.taipy/").
             repository_type (Optional[str]): The type of the repository to be used to store Taipy data.
+                Possible values are *"filesystem"*, *"sql"* or *"journal"*. With *"journal"*, jobs and
+                submissions are stored in append-only journals while other entities are stored as files.
                 The default value is "filesystem".
             repository_properties (Optional[Dict[str, Union[str, int]]]): A dictionary of additional properties
-                to be used by the repository.
+                to be used by the repository. With the *"filesystem"* repository type, setting the
+                *"filesystem_layout"* property to *"sharded"* spreads the entity files over hash-named sub-folders.
+                Setting the *"serializer"* property to *"orjson"* encodes and decodes the entities with the
+                orjson package, if installed, instead of the standard json module.
+                Setting the *"filesystem_fsync"* property to True flushes every entity file written by the
+                *"filesystem"* repository to the disk.
+                Setting the *"collect_stats"* property to True collects statistics on the operations of the
+                *"filesystem"* repository (see `tp.get_repository_stats()`).
             read_entity_retry (Optional[int]): Number of retries to read an entity from the repository
                 before return failure. The default value is 3.
             mode (Optional[str]): Indicates the mode of the version management system.
@@ -998,6 +1036,18 @@ class Config:
                  In development mode, the version number is ignored.
             force (Optional[bool]): If True, Taipy will override a version even if the configuration
                 has changed and run the application.
+            entity_cache (Optional[bool]): If True, the entities loaded from the repository are kept in an
+                in-process cache, so reloading an unchanged entity does not read the repository again.
+                The default value is True.
+            entity_cache_max_size (Optional[int]): Maximum number of entities of each type kept in the entity
+                cache. The least recently used entities are evicted first. The default value is 10000.
+            retention_max_age (Optional[int]): Age, in seconds, after which finished jobs and submissions are
+                moved to a compressed archive while the Orchestrator service runs. The default value is None.
+            retention_max_count (Optional[int]): Number of finished jobs of each task, and of finished submissions
+                of each entity, kept in the repository while the Orchestrator service runs. The older ones are
+                moved to a compressed archive. The default value is None.
+            retention_interval (Optional[int]): Interval, in seconds, between two applications of the retention
+                policy. The default value is 60.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
                 behavior of the `Orchestrator^` service.
 
@@ -0,0 +1,72 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import sys
+
+from taipy.common._cli._base_cli._abstract_cli import _AbstractCLI
+from taipy.common._cli._base_cli._taipy_parser import _TaipyParser
+
+from .._orchestrator._dispatcher._remote_worker_agent import _RemoteWorkerAgent
+
+
+class _WorkerCLI(_AbstractCLI):
+    """Command-line interface starting a worker agent of the *"remote"* job execution mode."""
+
+    _COMMAND_NAME = "worker"
+    _ARGUMENTS = ["--connect", "--capacity", "--authkey", "--name"]
+    _AUTHKEY_ENV_VARIABLE = "TAIPY_WORKER_AUTHKEY"
+
+    @classmethod
+    def create_parser(cls):
+        worker_parser = _TaipyParser._add_subparser(
+            cls._COMMAND_NAME,
+            help="Start a worker agent running the jobs of a Taipy application in remote job execution mode.",
+        )
+        worker_parser.add_argument(
+            "--connect",
+            required=True,
+            help="The 'host:port' or 'unix:path' address of the job dispatcher to connect to.",
+        )
+        worker_parser.add_argument(
+            "--capacity",
+            type=int,
+            help="The number of jobs the worker runs in parallel. Defaults to the number of CPUs.",
+        )
+        worker_parser.add_argument(
+            "--authkey",
+            help=f"The key to authenticate with the job dispatcher. Required, it defaults to the "
+            f"{cls._AUTHKEY_ENV_VARIABLE} environment variable.",
+        )
+        worker_parser.add_argument(
+            "--name",
+            help="The name of the worker in the logs of the job dispatcher. Defaults to the host name and the pid.",
+        )
+
+    @classmethod
+    def handle_command(cls):
+        args = cls._parse_arguments()
+        if not args:
+            return
+
+        authkey = args.authkey or os.environ.get(cls._AUTHKEY_ENV_VARIABLE)
+        if not authkey:
+            cls._logger.error(
+                f"An authentication key is required: use --authkey or the {cls._AUTHKEY_ENV_VARIABLE} environment "
+                "variable."
+            )
+            sys.exit(1)
+        agent = _RemoteWorkerAgent(args.connect, capacity=args.capacity, authkey=authkey, name=args.name)
+        try:
+            agent.run()
+        except KeyboardInterrupt:
+            agent.stop()
+        sys.exit(0)
@@ -9,7 +9,8 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import List
+import threading
+from typing import List, Optional
 
 from .._entity._reload import _get_manager
 from ..notification import Notifier
@@ -18,17 +19,23 @@ from ..notification import Notifier
 class _Entity:
     _ID_PREFIX: str
     _MANAGER_NAME: str
-    _is_in_context = False
+    # The thread running the `with` block of the entity, if any.
+    _context_thread_id: Optional[int] = None
     _in_context_attributes_changed_collector: List
 
+    @property
+    def _is_in_context(self) -> bool:
+        # A cached entity is shared between threads: only the saves of the thread of the context are deferred.
+        return self._context_thread_id is not None and self._context_thread_id == threading.get_ident()
+
     def __enter__(self):
-        self._is_in_context = True
+        self._context_thread_id = threading.get_ident()
         self._in_context_attributes_changed_collector = []
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
         # If multiple entities is in context, the last to enter will be the first to exit
-        self._is_in_context = False
+        self._context_thread_id = None
         if hasattr(self, "_properties"):
             for to_delete_key in self._properties._pending_deletions:
                 self._properties.data.pop(to_delete_key, None)
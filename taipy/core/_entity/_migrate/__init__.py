@@ -9,5 +9,10 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from ._migrate_fs import _migrate_fs_entities, _remove_backup_file_entities, _restore_migrate_file_entities
+from ._migrate_fs import (
+    _migrate_fs_entities,
+    _migrate_fs_layout,
+    _remove_backup_file_entities,
+    _restore_migrate_file_entities,
+)
 from ._migrate_mongo import _migrate_mongo_entities, _remove_backup_mongo_entities, _restore_migrate_mongo_entities
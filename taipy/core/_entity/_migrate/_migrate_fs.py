@@ -11,11 +11,14 @@
 
 import json
 import os
+import pathlib
 import shutil
 from typing import Dict
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
+from ..._repository._filesystem_layout import _LAYOUTS, _relocate_files
+from ..._repository._filesystem_repository import _FileSystemRepository
 from ._utils import _migrate
 
 __logger = _TaipyLogger._get_logger()
@@ -97,15 +100,8 @@ def _migrate_fs_entities(path: str, backup: bool = True) -> bool:
         __logger.error(f"Folder '{path}' does not exist.")
         return False
 
-    if backup:
-        backup_path = path.rstrip("\\/") + "_backup"
-        try:
-            shutil.copytree(path, backup_path)
-        except FileExistsError:
-            __logger.warning(f"The backup folder '{backup_path}' already exists. Migration canceled.")
-            return False
-        else:
-            __logger.info(f"Backed up entities from '{path}' to '{backup_path}' folder before migration.")
+    if backup and not __backup_file_entities(path):
+        return False
 
     __logger.info(f"Starting entity migration from '{path}' folder.")
 
@@ -115,3 +111,49 @@ def _migrate_fs_entities(path: str, backup: bool = True) -> bool:
 
     __logger.info("Migration finished")
     return True
+
+
+def _migrate_fs_layout(path: str, layout: str, backup: bool = True) -> bool:
+    """Move the entity files of a filesystem repository to the given layout.
+
+    Args:
+        path (str): The path to the folder containing the entities.
+        layout (str): The layout to move the entity files to: "flat" or "sharded".
+        backup (bool, optional): Whether to backup the entities before moving them. Defaults to True.
+
+    Returns:
+        bool: True if the migration was successful, False otherwise.
+    """
+    if layout not in _LAYOUTS:
+        __logger.error(f"Unknown filesystem layout '{layout}'. Possible values are {', '.join(_LAYOUTS)}.")
+        return False
+
+    if not os.path.isdir(path):
+        __logger.error(f"Folder '{path}' does not exist.")
+        return False
+
+    if backup and not __backup_file_entities(path):
+        return False
+
+    __logger.info(f"Starting to move the entity files of '{path}' folder to the {layout} layout.")
+
+    moved = 0
+    for folder in sorted(pathlib.Path(path).iterdir()):
+        if folder.is_dir() and not folder.name.startswith("."):
+            moved += _relocate_files(folder, _LAYOUTS[layout])
+    # The secondary indexes are rebuilt from the new layout when first used.
+    shutil.rmtree(pathlib.Path(path) / _FileSystemRepository._INDEX_DIR_NAME, ignore_errors=True)
+
+    __logger.info(f'Moved {moved} entity files. Set the filesystem_layout repository property to "{layout}".')
+    return True
+
+
+def __backup_file_entities(path: str) -> bool:
+    backup_path = path.rstrip("\\/") + "_backup"
+    try:
+        shutil.copytree(path, backup_path)
+    except FileExistsError:
+        __logger.warning(f"The backup folder '{backup_path}' already exists. Migration canceled.")
+        return False
+    __logger.info(f"Backed up entities from '{path}' to '{backup_path}' folder before migration.")
+    return True
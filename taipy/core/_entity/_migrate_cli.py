@@ -18,6 +18,7 @@ from taipy.common.config import Config
 
 from ._migrate import (
     _migrate_fs_entities,
+    _migrate_fs_layout,
     _migrate_mongo_entities,
     _remove_backup_file_entities,
     _remove_backup_mongo_entities,
@@ -28,7 +29,7 @@ from ._migrate import (
 
 class _MigrateCLI(_AbstractCLI):
     _COMMAND_NAME = "migrate"
-    _ARGUMENTS = ["--repository-type", "--skip-backup", "--restore", "--remove-backup"]
+    _ARGUMENTS = ["--repository-type", "--skip-backup", "--restore", "--remove-backup", "--layout"]
 
     @classmethod
     def create_parser(cls):
@@ -59,6 +60,11 @@ class _MigrateCLI(_AbstractCLI):
             action="store_true",
             help="Remove the backup of entities. Only use this option if the migration was successful.",
         )
+        migrate_parser.add_argument(
+            "--layout",
+            choices=["flat", "sharded"],
+            help="Move the entity files of a filesystem repository to the given layout instead of migrating them.",
+        )
 
     @classmethod
     def handle_command(cls):
@@ -80,6 +86,8 @@ class _MigrateCLI(_AbstractCLI):
             cls.__handle_remove_backup(repository_type, repository_args)
 
         do_backup = not args.skip_backup
+        if args.layout:
+            cls.__migrate_layout(repository_type, repository_args, args.layout, do_backup)
         cls.__migrate_entities(repository_type, repository_args, do_backup)
         sys.exit(0)
 
@@ -113,6 +121,17 @@ class _MigrateCLI(_AbstractCLI):
             sys.exit(1)
         sys.exit(0)
 
+    @classmethod
+    def __migrate_layout(cls, repository_type: str, repository_args: List, layout: str, do_backup: bool):
+        if repository_type != "filesystem":
+            cls._logger.error(f"The filesystem layout of repository type {repository_type} cannot be changed")
+            sys.exit(1)
+
+        path = repository_args[0] or Config.core.taipy_storage_folder
+        if not _migrate_fs_layout(path, layout, do_backup):
+            sys.exit(1)
+        sys.exit(0)
+
     @classmethod
     def __migrate_entities(cls, repository_type: str, repository_args: List, do_backup: bool):
         if repository_type == "filesystem":
@@ -31,7 +31,8 @@ class _Reloader:
         if self._no_reload_context:
             return obj
 
-        entity = _get_manager(manager)._get(obj, obj)
+        # An entity reloaded in context receives the pending changes of obj: it must not be a shared cached one.
+        entity = _get_manager(manager)._get(obj, obj, cached=not obj._is_in_context)
         if obj._is_in_context and hasattr(entity, "_properties"):
             if obj._properties._pending_changes:
                 entity._properties._pending_changes = obj._properties._pending_changes
@@ -24,6 +24,7 @@ from .scenario.scenario_id import ScenarioId
 from .sequence.sequence import Sequence
 from .sequence.sequence_id import SequenceId
 from .submission.submission import Submission
+from .submission.submission_batch import SubmissionBatch
 from .submission.submission_id import SubmissionId
 from .submission.submission_status import SubmissionStatus
 from .taipy import (
@@ -38,6 +39,8 @@ from .taipy import (
     delete_jobs,
     exists,
     get,
+    get_archived_jobs,
+    get_archived_submissions,
     get_cycles,
     get_cycles_scenarios,
     get_data_nodes,
@@ -48,6 +51,7 @@ from .taipy import (
     get_parents,
     get_primary,
     get_primary_scenarios,
+    get_repository_stats,
     get_scenarios,
     get_sequences,
     get_submissions,
@@ -59,7 +63,10 @@ from .taipy import (
     is_submittable,
     set,
     set_primary,
+    snapshot,
     submit,
+    submit_async,
+    submit_many,
     subscribe_scenario,
     subscribe_sequence,
     tag,
@@ -0,0 +1,60 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class _EntityCache:
+    """
+    LRU identity map of the entities loaded from one repository.
+
+    Each entity is stored along with the revision the repository reported for it when it was
+    loaded. A cached entity is only returned if the repository still reports the same revision,
+    so that changes made by other processes or behind the repository back are never hidden.
+
+    Attributes:
+        max_size (int): The maximum number of entities kept in the cache.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[Hashable, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, entity_id: str, revision: Hashable) -> Optional[Any]:
+        with self._lock:
+            if (entry := self._entries.get(entity_id)) is None:
+                return None
+            if entry[0] != revision:
+                del self._entries[entity_id]
+                return None
+            self._entries.move_to_end(entity_id)
+            return entry[1]
+
+    def _put(self, entity_id: str, revision: Hashable, entity: Any):
+        with self._lock:
+            self._entries[entity_id] = (revision, entity)
+            self._entries.move_to_end(entity_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _pop(self, entity_id: str):
+        with self._lock:
+            self._entries.pop(entity_id, None)
+
+    def _clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,100 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+
+class _LatestEntityIndex:
+    """
+    In-process pointers to the most recently created entity of each key, e.g. the latest job of each
+    task.
+
+    The index is built from all the entities on first use, then kept up to date as entities are
+    created. Deleting an entity an index pointer refers to drops the whole index, which is built again
+    on next use: deletions of latest entities are rare compared to lookups. The index is also built
+    again when the scope of the lookups, e.g. the versions of the entities, changes.
+
+    Entities may also be created or deleted by other processes, e.g. standalone workers or a REST
+    server. When the repository can list the ids of its entities, every lookup compares them with the
+    ids known to the index: only the entities created since the previous lookup are loaded, and the
+    index is built again if a latest entity was deleted.
+    """
+
+    def __init__(self):
+        self._latest: Dict[str, Tuple[datetime, str]] = {}
+        self._latest_ids: Set[str] = set()
+        self._known_ids: Optional[Set[str]] = None
+        self._is_built = False
+        self._scope: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _get(
+        self,
+        key: str,
+        build: Callable[[], Iterable[Tuple[str, datetime, str]]],
+        scope: Optional[str] = None,
+        list_ids: Optional[Callable[[], Optional[Set[str]]]] = None,
+        load: Optional[Callable[[Set[str]], Iterable[Tuple[str, datetime, str]]]] = None,
+    ) -> Optional[str]:
+        """
+        Return the id of the latest entity of a key.
+
+        The index is built from the (key, date, id) tuples of `build` if needed. If `list_ids` lists the
+        ids of all the entities, the (key, date, id) tuples of the ones the index does not know yet are
+        added using `load`.
+        """
+        with self._lock:
+            ids = list_ids() if list_ids else None
+            if not self._is_built or scope != self._scope or (ids is not None and not self._latest_ids <= ids):
+                self.__clear()
+                for entity_key, creation_date, entity_id in build():
+                    self.__add(entity_key, creation_date, entity_id)
+                self._is_built = True
+                self._scope = scope
+                self._known_ids = ids
+            elif ids is not None and self._known_ids is not None and load is not None:
+                if new_ids := ids - self._known_ids:
+                    for entity_key, creation_date, entity_id in load(new_ids):
+                        self.__add(entity_key, creation_date, entity_id)
+                self._known_ids = ids
+            entry = self._latest.get(key)
+        return entry[1] if entry else None
+
+    def _add(self, key: str, creation_date: datetime, entity_id: str):
+        with self._lock:
+            if self._is_built:
+                self.__add(key, creation_date, entity_id)
+                if self._known_ids is not None:
+                    self._known_ids.add(entity_id)
+
+    def _discard(self, entity_ids: Iterable[str]):
+        with self._lock:
+            if not self._latest_ids.isdisjoint(entity_ids):
+                self.__clear()
+
+    def _clear(self):
+        with self._lock:
+            self.__clear()
+
+    def __clear(self):
+        self._latest.clear()
+        self._latest_ids.clear()
+        self._known_ids = None
+        self._is_built = False
+
+    def __add(self, key: str, creation_date: datetime, entity_id: str):
+        if (entry := self._latest.get(key)) is None or creation_date.timestamp() > entry[0].timestamp():
+            if entry is not None:
+                self._latest_ids.discard(entry[1])
+            self._latest[key] = (creation_date, entity_id)
+            self._latest_ids.add(entity_id)
@@ -9,15 +9,22 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Dict, Generic, Iterable, List, Optional, TypeVar, Union
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+from weakref import WeakKeyDictionary
 
+from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from .._entity._entity_ids import _EntityIds
 from .._repository._abstract_repository import _AbstractRepository
+from .._repository._archive import _Archive
 from ..exceptions.exceptions import ModelNotFound
 from ..notification import Event, EventOperation, Notifier
 from ..reason import EntityDoesNotExist, ReasonCollection
+from ._entity_cache import _EntityCache
+from ._latest_entity_index import _LatestEntityIndex
 
 EntityType = TypeVar("EntityType")
 
@@ -26,6 +33,89 @@ class _Manager(Generic[EntityType]):
     _repository: _AbstractRepository
     _logger = _TaipyLogger._get_logger()
     _ENTITY_NAME: str = "Entity"
+    # Whether the loaded entities are cached. The entities holding other entity objects resolve them again
+    # through their managers when returned from the cache, see `_refresh_references`.
+    _CACHE_ENTITIES: bool = True
+    __entity_caches: "WeakKeyDictionary[_AbstractRepository, _EntityCache]" = WeakKeyDictionary()
+    # Managers answering "latest entity" lookups, e.g. the latest job of a task, keep an index of their latest entities.
+    _INDEX_LATEST_ENTITIES: bool = False
+    __latest_entity_indexes: "WeakKeyDictionary[_AbstractRepository, _LatestEntityIndex]" = WeakKeyDictionary()
+    __snapshot = threading.local()
+
+    @classmethod
+    def _entity_cache(cls) -> Optional[_EntityCache]:
+        """
+        Returns the cache of the entities loaded from the manager repository, or None if disabled.
+        """
+        if not cls._CACHE_ENTITIES or not Config.core.entity_cache:
+            return None
+        max_size = Config.core.entity_cache_max_size
+        if (cache := _Manager.__entity_caches.get(cls._repository)) is None:
+            cache = _Manager.__entity_caches.setdefault(cls._repository, _EntityCache(max_size))
+        cache.max_size = max_size
+        return cache
+
+    @classmethod
+    def _latest_entity_index(cls) -> Optional[_LatestEntityIndex]:
+        """
+        Returns the index of the latest entities of the manager repository, or None if the manager does not keep one.
+        """
+        if not cls._INDEX_LATEST_ENTITIES:
+            return None
+        if (index := _Manager.__latest_entity_indexes.get(cls._repository)) is None:
+            index = _Manager.__latest_entity_indexes.setdefault(cls._repository, _LatestEntityIndex())
+        return index
+
+    @staticmethod
+    @contextmanager
+    def _snapshot() -> Iterator[None]:
+        """
+        Context manager loading each entity read in the current thread at most once.
+
+        Within the context, the first read of an entity loads it from its repository and the next
+        reads return the same object, until the entity is saved or deleted. Nested contexts share
+        the snapshot of the outermost one.
+        """
+        if _Manager.__snapshot_entities() is not None:
+            yield
+            return
+        _Manager.__snapshot.entities = {}
+        try:
+            yield
+        finally:
+            _Manager.__snapshot.entities = None
+
+    @staticmethod
+    def __snapshot_entities() -> Optional[Dict[str, Any]]:
+        return getattr(_Manager.__snapshot, "entities", None)
+
+    @classmethod
+    def __forget(cls, entity_ids: Optional[Iterable[str]] = None):
+        """Drop entities from the entity cache and the snapshot, or all of them if no id is provided."""
+        cache = _Manager.__entity_caches.get(cls._repository)
+        snapshot = _Manager.__snapshot_entities()
+        if entity_ids is None:
+            if cache:
+                cache._clear()
+            if snapshot:
+                snapshot.clear()
+            return
+        for entity_id in entity_ids:
+            if cache:
+                cache._pop(entity_id)
+            if snapshot:
+                snapshot.pop(entity_id, None)
+
+    @classmethod
+    def __forget_deleted(cls, entity_ids: Optional[Iterable[str]] = None):
+        """Forget deleted entities, or all of them if no id is provided, including from the latest entity index."""
+        cls.__forget(entity_ids)
+        if (index := _Manager.__latest_entity_indexes.get(cls._repository)) is None:
+            return
+        if entity_ids is None:
+            index._clear()
+        else:
+            index._discard(entity_ids)
 
     @classmethod
     def _delete_all(cls):
@@ -33,6 +123,7 @@ class _Manager(Generic[EntityType]):
         Deletes all entities.
         """
         cls._repository._delete_all()
+        cls.__forget_deleted()
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -48,6 +139,7 @@ class _Manager(Generic[EntityType]):
         Deletes entities by a list of ids.
         """
         cls._repository._delete_many(ids)
+        cls.__forget_deleted(ids)
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             for entity_id in ids:
                 Notifier.publish(
@@ -65,6 +157,7 @@ class _Manager(Generic[EntityType]):
         Deletes entities by version number.
         """
         cls._repository._delete_by(attribute="version", value=version_number)
+        cls.__forget_deleted()
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -80,6 +173,7 @@ class _Manager(Generic[EntityType]):
         Deletes an entity by id.
         """
         cls._repository._delete(id)
+        cls.__forget_deleted([id])
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -95,6 +189,16 @@ class _Manager(Generic[EntityType]):
         Save or update an entity.
         """
         cls._repository._save(entity)
+        cls.__forget([entity.id])  # type: ignore
+
+    @classmethod
+    def _set_many(cls, entities: Iterable[EntityType]):
+        """
+        Save or update several entities, with batched repository writes when the repository supports them.
+        """
+        entities = list(entities)
+        cls._repository._save_many(entities)
+        cls.__forget([entity.id for entity in entities])  # type: ignore
 
     @classmethod
     def _get_all(cls, version_number: Optional[str] = "all") -> List[EntityType]:
@@ -114,16 +218,128 @@ class _Manager(Generic[EntityType]):
         return cls._repository._load_all(filters)
 
     @classmethod
-    def _get(cls, entity: Union[str, EntityType], default=None) -> EntityType:
+    def _get(cls, entity: Union[str, EntityType], default=None, cached: bool = True) -> EntityType:
         """
         Returns an entity by id or reference.
+
+        Unless *cached* is False, an entity already read in the current snapshot, or that did not
+        change since it was last loaded, is returned as the same object.
         """
         entity_id = entity if isinstance(entity, str) else entity.id  # type: ignore
+        snapshot = _Manager.__snapshot_entities() if cached else None
+        cache = cls._entity_cache() if cached else None
+        found_entity, revision = cls.__get_loaded(entity_id, snapshot, cache)
+        if found_entity is not None:
+            return found_entity
         try:
-            return cls._repository._load(entity_id)
+            loaded_entity = cls._repository._load(entity_id)
         except ModelNotFound:
             cls._logger.error(f"{cls._ENTITY_NAME} not found: {entity_id}")
             return default
+        cls.__keep_loaded(entity_id, loaded_entity, revision, snapshot, cache)
+        return loaded_entity
+
+    @classmethod
+    def _get_many(cls, entities: Iterable[Union[str, EntityType]]) -> Dict[str, EntityType]:
+        """
+        Returns several entities by id or reference, loading from the repository in bulk.
+
+        The entities that do not exist are missing from the returned dictionary.
+        """
+        snapshot = _Manager.__snapshot_entities()
+        cache = cls._entity_cache()
+        found_entities: Dict[str, EntityType] = {}
+        revisions: Dict[str, Optional[Hashable]] = {}
+        for entity in entities:
+            entity_id = entity if isinstance(entity, str) else entity.id  # type: ignore
+            if entity_id in found_entities or entity_id in revisions:
+                continue
+            found_entity, revisions[entity_id] = cls.__get_loaded(entity_id, snapshot, cache)
+            if found_entity is not None:
+                found_entities[entity_id] = found_entity
+                del revisions[entity_id]
+        for entity_id, loaded_entity in cls._repository._load_many(revisions).items():
+            cls.__keep_loaded(entity_id, loaded_entity, revisions[entity_id], snapshot, cache)
+            found_entities[entity_id] = loaded_entity
+        return found_entities
+
+    @classmethod
+    def __get_loaded(
+        cls, entity_id: str, snapshot: Optional[Dict[str, Any]], cache: Optional[_EntityCache]
+    ) -> Tuple[Optional[EntityType], Optional[Hashable]]:
+        """Return the entity if it is already loaded, along with its current revision."""
+        if snapshot is not None and (snapshot_entity := snapshot.get(entity_id)) is not None:
+            return snapshot_entity, None
+        if cache is None:
+            return None, None
+        if (revision := cls._repository._revision(entity_id)) is None:
+            cache._pop(entity_id)
+        elif (cached_entity := cache._get(entity_id, revision)) is not None:
+            if getattr(cached_entity, "_context_thread_id", None) is not None:
+                # The pending changes of a `with` block must not leak to the other callers.
+                return None, revision
+            cls._refresh_references(cached_entity)
+            if snapshot is not None:
+                snapshot[entity_id] = cached_entity
+            return cached_entity, revision
+        return None, revision
+
+    @classmethod
+    def _refresh_references(cls, entity: EntityType):
+        """
+        Resolve again the entities held by an entity returned from the entity cache, which may be stale.
+
+        The held entities are resolved through their own managers, so that they come from their entity caches.
+        """
+
+    @staticmethod
+    def __keep_loaded(
+        entity_id: str,
+        entity: Any,
+        revision: Optional[Hashable],
+        snapshot: Optional[Dict[str, Any]],
+        cache: Optional[_EntityCache],
+    ):
+        if cache is not None and revision is not None:
+            cache._put(entity_id, revision, entity)
+        if snapshot is not None:
+            snapshot[entity_id] = entity
+
+    @classmethod
+    def _archive(cls) -> _Archive:
+        """
+        Returns the archive holding the entities moved out of the manager repository.
+        """
+        return _Archive(cls._ENTITY_NAME.lower(), cls._repository._serializer)
+
+    @classmethod
+    def _archive_many(cls, entities: List[EntityType]):
+        """
+        Moves entities from the repository to the archive.
+        """
+        if not entities:
+            return
+        converter = cls._repository.converter  # type: ignore[attr-defined]
+        cls._archive()._append(converter._entity_to_model(entity).to_dict() for entity in entities)
+        cls._delete_many([entity.id for entity in entities])  # type: ignore[attr-defined]
+
+    @classmethod
+    def _get_all_archived(cls) -> List[EntityType]:
+        """
+        Returns the archived entities. The ones referencing entities that no longer exist are ignored.
+        """
+        model_type, converter = cls._repository.model_type, cls._repository.converter  # type: ignore[attr-defined]
+        models = [model_type.from_dict(model_dict) for model_dict in cls._archive()._load_all()]
+        try:
+            return converter._models_to_entities(models)
+        except ModelNotFound:
+            entities = []
+            for model in models:
+                try:
+                    entities.append(converter._model_to_entity(model))
+                except ModelNotFound as e:
+                    cls._logger.warning(f"Archived {cls._ENTITY_NAME} {model.id} cannot be read: {e.message}")
+            return entities
 
     @classmethod
     def _exists(cls, entity_id: str) -> ReasonCollection:
@@ -10,11 +10,12 @@
 # specific language governing permissions and limitations under the License.
 
 from abc import abstractmethod
-from typing import Callable, Iterable, Optional, Union
+from typing import Callable, Iterable, Optional, Tuple, Union
 
 from .._entity.submittable import Submittable
 from ..job.job import Job
 from ..submission.submission import Submission
+from ..submission.submission_batch import SubmissionBatch
 from ..task.task import Task
 
 
@@ -62,7 +63,28 @@ class _AbstractOrchestrator:
     ) -> Submission:
         raise NotImplementedError
 
+    @classmethod
+    @abstractmethod
+    def submit_many(
+        cls,
+        entities: Iterable[Tuple[Union[Submittable, Task], Optional[Iterable[Callable]]]],
+        force: bool = False,
+        wait: bool = False,
+        timeout: Optional[Union[float, int]] = None,
+        **properties,
+    ) -> SubmissionBatch:
+        raise NotImplementedError
+
     @classmethod
     @abstractmethod
     def cancel_job(cls, job: Job):
         raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def _requeue_job(cls, job: Job) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def _on_data_node_ready(cls, dn_id: str) -> None:
+        """Called when a data node becomes ready for reading outside of jobs, e.g. when written by a user."""
@@ -11,4 +11,5 @@
 
 from ._development_job_dispatcher import _DevelopmentJobDispatcher
 from ._job_dispatcher import _JobDispatcher
+from ._remote_job_dispatcher import _RemoteJobDispatcher
 from ._standalone_job_dispatcher import _StandaloneJobDispatcher
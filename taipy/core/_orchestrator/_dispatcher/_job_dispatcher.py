@@ -10,15 +10,15 @@
 # specific language governing permissions and limitations under the License.
 
 import threading
-import time
 import traceback
 from abc import abstractmethod
 from queue import Empty
-from typing import Optional
+from typing import Dict, Optional
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
+from ...data._data_fingerprint import _DataFingerprint
 from ...data._data_manager_factory import _DataManagerFactory
 from ...job._job_manager_factory import _JobManagerFactory
 from ...job.job import Job
@@ -32,6 +32,10 @@ class _JobDispatcher(threading.Thread):
     _STOP_FLAG = False
     stop_wait = True
     stop_timeout = None
+    # Upper bound of the dispatcher waits, so that it notices when it is stopped.
+    _MAX_WAIT = 0.1
+    # The job config and task property holding the amounts of resources the workers share and a task needs.
+    _RESOURCES_PROPERTY = "resources"
     _logger = _TaipyLogger._get_logger()
 
     def __init__(self, orchestrator: _AbstractOrchestrator):
@@ -39,6 +43,10 @@ class _JobDispatcher(threading.Thread):
         self.daemon = True
         self.orchestrator = orchestrator
         self.lock = self.orchestrator.lock  # type: ignore
+        self._worker_released = threading.Event()
+        self._resources_lock = threading.Lock()
+        self._available_resources = self.__to_amounts(getattr(Config.job_config, self._RESOURCES_PROPERTY, None))
+        self._total_resources = dict(self._available_resources)
         Config.block_update()
 
     def start(self):
@@ -57,6 +65,7 @@ class _JobDispatcher(threading.Thread):
             timeout (Optional[float]): The maximum time to wait. If None, the method will wait indefinitely.
         """
         self._STOP_FLAG = True
+        self._worker_released.set()
         if wait and self.is_running():
             self._logger.debug("Waiting for the dispatcher thread to stop...")
             self.join(timeout=timeout)
@@ -64,34 +73,71 @@ class _JobDispatcher(threading.Thread):
     def run(self):
         self._logger.debug("Job dispatcher started.")
         while not self._STOP_FLAG:
+            self._worker_released.clear()
             if not self._can_execute():
-                time.sleep(0.2)  # We need to sleep to avoid busy waiting.
+                # Woken up as soon as a worker is released.
+                self._worker_released.wait(self._MAX_WAIT)
                 continue
 
-            with self.lock:
-                self._logger.debug("Acquiring lock to check jobs to run.")
-                job = None
-                try:
-                    if not self._STOP_FLAG:
-                        job = self.orchestrator.jobs_to_run.get(block=True, timeout=0.1)
-                except Empty:  # In case the last job of the queue has been removed.
-                    pass
-            if job:
-                self._logger.debug(f"Got a job to execute {job.id}.")
-                try:
-                    if not self._STOP_FLAG:
-                        self._execute_job(job)
-                    else:
-                        self.orchestrator.jobs_to_run.put(job)
-                except Exception as e:
-                    self._logger.exception(e)
+            # Woken up as soon as a job is put in the queue. The lock is not held while waiting, so that
+            # submissions and job unblocking are not delayed by an idle dispatcher.
+            try:
+                job = self.orchestrator.jobs_to_run.get(block=True, timeout=self._MAX_WAIT, accept=self._can_dispatch)
+            except Empty:
+                continue
+            self._logger.debug(f"Got a job to execute {job.id}.")
+            try:
+                if not self._STOP_FLAG:
+                    self._execute_job(job)
+                else:
+                    self.orchestrator.jobs_to_run.put(job)
+            except Exception as e:
+                self._logger.exception(e)
         self._logger.debug("Job dispatcher stopped.")
 
+    def _release_worker(self):
+        """Wake up the dispatcher waiting for a worker or for resources to be available."""
+        self._worker_released.set()
+        self.orchestrator.jobs_to_run._wake_up()
+
+    def _get_required_resources(self, job: Job) -> Dict[str, float]:
+        """Returns the amounts of the resources shared by the workers the job needs."""
+        required = self.__to_amounts(job._task._properties.get(self._RESOURCES_PROPERTY))
+        # A job needing more than the total amount of a resource runs once all of it is available.
+        return {
+            name: min(amount, self._total_resources[name])
+            for name, amount in required.items()
+            if name in self._total_resources
+        }
+
+    def _has_resources_for(self, job: Job) -> bool:
+        with self._resources_lock:
+            required = self._get_required_resources(job)
+            return all(self._available_resources[name] >= amount for name, amount in required.items())
+
+    def _acquire_resources(self, job: Job):
+        with self._resources_lock:
+            for name, amount in self._get_required_resources(job).items():
+                self._available_resources[name] -= amount
+
+    def _release_resources(self, job: Job):
+        with self._resources_lock:
+            for name, amount in self._get_required_resources(job).items():
+                self._available_resources[name] += amount
+
+    @staticmethod
+    def __to_amounts(resources) -> Dict[str, float]:
+        return {str(name): float(amount) for name, amount in (resources or {}).items()}
+
     @abstractmethod
     def _can_execute(self) -> bool:
         """Returns True if the dispatcher have resources to dispatch a new job."""
         raise NotImplementedError
 
+    def _can_dispatch(self, job: Job) -> bool:
+        """Returns True if the dispatcher have a worker and the resources to dispatch the given job."""
+        return self._has_resources_for(job)
+
     def _execute_job(self, job: Job):
         if job.force or self._needs_to_run(job.task):
             if job.force:
@@ -117,6 +163,9 @@ class _JobDispatcher(threading.Thread):
         """
         Returns True if the task has no output or if at least one input was modified since the latest run.
 
+        The inputs are not considered modified if the outputs were last written from inputs with the same
+        fingerprints, even if the inputs were written again since.
+
         Parameters:
              task (Task^): The task to run.
 
@@ -128,13 +177,17 @@ class _JobDispatcher(threading.Thread):
         data_manager = _DataManagerFactory._build_manager()
         if len(task.output) == 0:
             return True
-        are_outputs_in_cache = all(data_manager._get(dn.id).is_valid for dn in task.output.values())
+        outputs = [data_manager._get(dn.id) for dn in task.output.values()]
+        are_outputs_in_cache = all(dn.is_valid for dn in outputs)
         if not are_outputs_in_cache:
             return True
         if len(task.input) == 0:
             return False
-        input_last_edit = max(data_manager._get(dn.id).last_edit_date for dn in task.input.values())
-        output_last_edit = min(data_manager._get(dn.id).last_edit_date for dn in task.output.values())
+        inputs = [data_manager._get(dn.id) for dn in task.input.values()]
+        if _DataFingerprint._match_last_run(inputs, outputs):
+            return False
+        input_last_edit = max(dn.last_edit_date for dn in inputs)
+        output_last_edit = min(dn.last_edit_date for dn in outputs)
         return input_last_edit > output_last_edit
 
     @abstractmethod
@@ -0,0 +1,264 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import pickle
+import threading
+from multiprocessing.connection import Client, Connection, Listener, answer_challenge, deliver_challenge
+from time import monotonic
+from typing import Dict, List, Optional
+
+from taipy.common.config import Config
+
+from ...exceptions.exceptions import MissingWorkerAuthKey, WorkerLost
+from ...job.job import Job
+from ...job.job_id import JobId
+from .._abstract_orchestrator import _AbstractOrchestrator
+from ._job_dispatcher import _JobDispatcher
+from ._remote_protocol import _RemoteProtocol
+from ._standalone_job_dispatcher import _StandaloneJobDispatcher
+from ._task_function_wrapper import _TaskFunctionWrapper
+
+
+class _ConnectedWorker:
+    """A worker agent connected to the remote job dispatcher, and the jobs it runs."""
+
+    def __init__(self, name: str, connection: Connection, capacity: int):
+        self.name = name
+        self.connection = connection
+        self.capacity = capacity
+        self.jobs: Dict[JobId, Job] = {}
+        self.config_hash: Optional[str] = None
+        self.last_seen = monotonic()
+        self._send_lock = threading.Lock()
+
+    @property
+    def nb_available_slots(self) -> int:
+        return self.capacity - len(self.jobs)
+
+    def send(self, message: tuple):
+        with self._send_lock:
+            self.connection.send(message)
+
+    def close(self):
+        try:
+            self.connection.close()
+        except OSError:
+            pass
+
+
+class _RemoteJobDispatcher(_JobDispatcher):
+    """Manages job dispatching (instances of `Job^` class) on remote worker agents.
+
+    The dispatcher listens on the *"address"* of the job configuration, to which worker agents started with
+    `taipy worker --connect <address>` connect, authenticated with the *"authkey"* of the job configuration.
+    Each agent reports the number of jobs it runs in parallel,
+    and runs the jobs it is sent on a pool of processes. The workers must share the storage of the
+    entities and of the data nodes with the orchestrator, e.g. a shared file system or a database.
+
+    A worker that does not send a heartbeat for a few heartbeat intervals, or whose connection is lost, is
+    removed. Its running jobs are put back in the queue of the jobs to run, to be dispatched to another
+    worker, unless they were already put back too many times, in which case they fail.
+    """
+
+    _DEFAULT_ADDRESS = "localhost:5755"
+    _DEFAULT_HEARTBEAT_INTERVAL = 5.0
+    # The number of heartbeat intervals without any message after which a worker is considered dead.
+    _MISSED_HEARTBEATS = 3
+    _MAX_NB_OF_REQUEUES = 3
+
+    def __init__(self, orchestrator: _AbstractOrchestrator):
+        self._authkey = _RemoteProtocol._to_authkey(Config.job_config.authkey)
+        if self._authkey is None:
+            raise MissingWorkerAuthKey()
+        super().__init__(orchestrator)
+        address, family = _RemoteProtocol._parse_address(str(Config.job_config.address or self._DEFAULT_ADDRESS))
+        # The workers authenticate on their own thread, so that a client not answering does not block the others.
+        self._listener = Listener(address, family)
+        self._family = family
+        self._heartbeat_interval = float(Config.job_config.heartbeat_interval or self._DEFAULT_HEARTBEAT_INTERVAL)
+        self._workers: List[_ConnectedWorker] = []
+        self._workers_changed = threading.Condition()
+        self._nb_requeues: Dict[JobId, int] = {}
+        self._accepting_thread = threading.Thread(
+            target=self._accept_workers, name="Thread-Taipy-WorkerListener", daemon=True
+        )
+
+    @property
+    def address(self) -> str:
+        """The address the worker agents connect to."""
+        return _RemoteProtocol._format_address(self._listener.address)
+
+    @property
+    def workers(self) -> List[_ConnectedWorker]:
+        with self._workers_changed:
+            return list(self._workers)
+
+    def start(self):
+        self._accepting_thread.start()
+        super().start()
+
+    def run(self):
+        super().run()
+        self.__stop_accepting()
+        with self._workers_changed:
+            # Like the pools of the standalone dispatcher, wait for the running jobs to be finished.
+            self._workers_changed.wait_for(lambda: not any(worker.jobs for worker in self._workers))
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                worker.send((_RemoteProtocol.STOP,))
+            except (OSError, ValueError):
+                pass
+            worker.close()
+        self._logger.debug("Remote job dispatcher: Workers disconnected.")
+
+    def _can_execute(self) -> bool:
+        with self._workers_changed:
+            return any(worker.nb_available_slots > 0 for worker in self._workers)
+
+    def _can_dispatch(self, job: Job) -> bool:
+        return self._can_execute() and super()._can_dispatch(job)
+
+    def _dispatch(self, job: Job):
+        """Dispatches the given `Job^` on the remote worker with the most available slots.
+
+        Parameters:
+            job (Job^): The job to send to a worker.
+        """
+        try:
+            wrapper = pickle.dumps(_TaskFunctionWrapper(job.id, job.task))
+        except Exception as e:
+            self._update_job_status(job, [e])
+            return
+        with self._workers_changed:
+            worker = max(self._workers, key=lambda w: w.nb_available_slots, default=None)
+            if worker is not None:
+                worker.jobs[job.id] = job
+        if worker is None:
+            # The workers were lost since the job was taken from the queue.
+            self.orchestrator._requeue_job(job)
+            return
+        self._acquire_resources(job)
+
+        config_as_string, config_hash = _StandaloneJobDispatcher._get_serialized_config()
+        sent_config = config_as_string if worker.config_hash != config_hash else None
+        worker.config_hash = config_hash
+        try:
+            worker.send((_RemoteProtocol.JOB, job.id, wrapper, sent_config, config_hash))
+        except (OSError, ValueError):
+            self._remove_worker(worker)
+            return
+        self._logger.debug(f"Job {job.id} sent to worker {worker.name}.")
+
+    def _accept_workers(self):
+        while not self._STOP_FLAG:
+            try:
+                connection = self._listener.accept()
+            except Exception as e:
+                if not self._STOP_FLAG:
+                    self._logger.warning(f"A worker could not connect: {e!r}")
+                continue
+            if self._STOP_FLAG:
+                connection.close()
+                break
+            threading.Thread(
+                target=self._serve_worker, args=(connection,), name="Thread-Taipy-RemoteWorker", daemon=True
+            ).start()
+
+    def _serve_worker(self, connection: Connection):
+        """Receive the messages of a worker until its connection is lost or it misses its heartbeats."""
+        try:
+            deliver_challenge(connection, self._authkey)
+            answer_challenge(connection, self._authkey)
+        except Exception as e:
+            self._logger.warning(f"A worker failed to authenticate: {e!r}")
+            connection.close()
+            return
+        try:
+            kind, name, capacity = connection.recv()
+            if kind != _RemoteProtocol.HELLO:
+                raise ValueError(f"Unexpected message {kind} from a worker.")
+            connection.send((_RemoteProtocol.WELCOME, self._heartbeat_interval))
+        except (EOFError, OSError, ValueError, TypeError) as e:
+            self._logger.warning(f"A worker failed to introduce itself: {e}")
+            connection.close()
+            return
+
+        worker = _ConnectedWorker(name, connection, int(capacity))
+        with self._workers_changed:
+            self._workers.append(worker)
+        self._logger.info(f"Worker {name} connected with a capacity of {capacity} jobs.")
+        self._release_worker()
+        timeout = self._heartbeat_interval * self._MISSED_HEARTBEATS
+        try:
+            # The worker is still served while the dispatcher stops, until its running jobs are finished.
+            while True:
+                if not connection.poll(min(self._heartbeat_interval, self._MAX_WAIT * 10)):
+                    if monotonic() - worker.last_seen > timeout:
+                        self._logger.warning(f"Worker {name} missed its heartbeats.")
+                        break
+                    continue
+                worker.last_seen = monotonic()
+                self._handle_message(worker, connection.recv())
+        except Exception as e:
+            if not self._STOP_FLAG:
+                self._logger.warning(f"Connection to worker {name} lost: {e!r}")
+        self._remove_worker(worker)
+
+    def _handle_message(self, worker: _ConnectedWorker, message: tuple):
+        kind = message[0]
+        if kind == _RemoteProtocol.HEARTBEAT:
+            with self._workers_changed:
+                worker.capacity = int(message[1])
+            self._release_worker()
+        elif kind == _RemoteProtocol.RESULT:
+            _, job_id, exceptions = message
+            with self._workers_changed:
+                job = worker.jobs.pop(job_id, None)
+                self._workers_changed.notify_all()
+            if job is None:
+                # The job was put back in the queue, e.g. after the worker missed heartbeats.
+                return
+            self._nb_requeues.pop(job_id, None)
+            self._release_resources(job)
+            self._release_worker()
+            self._update_job_status(job, exceptions)
+
+    def _remove_worker(self, worker: _ConnectedWorker):
+        """Disconnect a worker and put its running jobs back in the queue of the jobs to run."""
+        with self._workers_changed:
+            if worker not in self._workers:
+                return
+            self._workers.remove(worker)
+            jobs, worker.jobs = list(worker.jobs.values()), {}
+            self._workers_changed.notify_all()
+        worker.close()
+        self._logger.info(f"Worker {worker.name} disconnected.")
+
+        for job in jobs:
+            self._release_resources(job)
+            nb_requeues = self._nb_requeues[job.id] = self._nb_requeues.get(job.id, 0) + 1
+            if nb_requeues > self._MAX_NB_OF_REQUEUES:
+                del self._nb_requeues[job.id]
+                self._update_job_status(job, [WorkerLost(job.id, worker.name)])
+            else:
+                self._logger.warning(f"Job {job.id} was running on lost worker {worker.name}: putting it back.")
+                self.orchestrator._requeue_job(job)
+        self._release_worker()
+
+    def __stop_accepting(self):
+        # Wake up the accepting thread, blocked until a connection comes.
+        try:
+            Client(self._listener.address, self._family).close()
+        except Exception:
+            pass
+        self._accepting_thread.join(timeout=self._MAX_WAIT * 10)
+        self._listener.close()
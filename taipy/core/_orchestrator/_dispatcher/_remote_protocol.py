@@ -0,0 +1,63 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Optional, Tuple, Union
+
+_Address = Union[Tuple[str, int], str]
+
+
+class _RemoteProtocol:
+    """
+    Protocol between the remote job dispatcher and the worker agents.
+
+    The messages are tuples sent over `multiprocessing.connection` connections, which frame and pickle
+    them, on a TCP socket (*"host:port"* addresses) or a Unix socket (*"unix:path"* addresses). Both ends
+    authenticate each other with an HMAC challenge on connection, from a required authentication key: as
+    the messages are pickled, the workers and the dispatcher must trust each other.
+
+    A worker agent opens the connection with `(HELLO, name, capacity)`, where the capacity is the number
+    of jobs it runs in parallel. The dispatcher answers `(WELCOME, heartbeat_interval)`. Then, the agent
+    sends `(HEARTBEAT, capacity)` at every interval, and `(RESULT, job_id, exceptions)` when a job is
+    finished. The dispatcher sends `(JOB, job_id, pickled_task_function_wrapper, config_as_string,
+    config_hash)`, where the configuration is only given if it changed since the last job sent to the
+    worker, and `(STOP,)` to make the agent exit when the dispatcher stops.
+    """
+
+    HELLO = "hello"
+    WELCOME = "welcome"
+    HEARTBEAT = "heartbeat"
+    JOB = "job"
+    RESULT = "result"
+    STOP = "stop"
+
+    _UNIX_PREFIX = "unix:"
+    _TCP_FAMILY = "AF_INET"
+    _UNIX_FAMILY = "AF_UNIX"
+
+    @classmethod
+    def _parse_address(cls, address: str) -> Tuple[_Address, str]:
+        """Return the address and the family of a *"host:port"* or *"unix:path"* address."""
+        if address.startswith(cls._UNIX_PREFIX):
+            return address[len(cls._UNIX_PREFIX) :], cls._UNIX_FAMILY
+        host, separator, port = address.rpartition(":")
+        if not separator or not port.isdigit():
+            raise ValueError(f"Invalid worker address '{address}': expected 'host:port' or 'unix:path'.")
+        return (host or "localhost", int(port)), cls._TCP_FAMILY
+
+    @classmethod
+    def _format_address(cls, address: _Address) -> str:
+        if isinstance(address, str):
+            return cls._UNIX_PREFIX + address
+        return f"{address[0]}:{address[1]}"
+
+    @staticmethod
+    def _to_authkey(authkey: Optional[str]) -> Optional[bytes]:
+        return str(authkey).encode() if authkey else None
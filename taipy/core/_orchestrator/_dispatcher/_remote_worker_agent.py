@@ -0,0 +1,200 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import multiprocessing as mp
+import os
+import pickle
+import socket
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing.connection import Client, Connection
+from typing import Any, List, Optional
+
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from ...exceptions.exceptions import MissingWorkerAuthKey
+from ._remote_protocol import _RemoteProtocol
+from ._task_function_wrapper import _initialize_worker
+
+
+def _initialize_agent_process(config_as_string: str, config_hash: str, agent_pid: int):
+    """Initialize a process of the worker pool, which exits when the agent is lost."""
+    _initialize_worker(config_as_string, config_hash)
+    threading.Thread(target=_exit_with_agent, args=(agent_pid,), name="Thread-Taipy-AgentWatcher", daemon=True).start()
+
+
+def _exit_with_agent(agent_pid: int):
+    # The dispatcher puts the jobs of a lost agent back to run: they must not run twice.
+    while os.getppid() == agent_pid:
+        time.sleep(_RemoteWorkerAgent._MAX_WAIT)
+    os._exit(1)
+
+
+def _execute_pickled_task_function(wrapper: bytes, config_hash: str) -> List[Exception]:
+    """Execute a pickled `_TaskFunctionWrapper` in a process of the worker pool."""
+    try:
+        task_function_wrapper = pickle.loads(wrapper)
+    except Exception as e:
+        return [e]
+    return task_function_wrapper(config_hash=config_hash)
+
+
+class _RemoteWorkerAgent:
+    """
+    Worker agent running the jobs sent by a remote job dispatcher on a pool of local processes.
+
+    The agent connects to the dispatcher, and connects again whenever the connection is lost, until it is
+    stopped or the dispatcher asks it to stop. As the dispatcher puts the jobs of a lost connection back to
+    run, the processes of the pool are terminated with the jobs they run before connecting again. The processes of the pool are initialized with the
+    configuration the jobs are sent with, and the pool is created again when the configuration changes.
+    """
+
+    _RECONNECTION_DELAY = 1.0
+    _MAX_WAIT = 0.5
+    _logger = _TaipyLogger._get_logger()
+
+    def __init__(
+        self,
+        address: str,
+        capacity: Optional[int] = None,
+        authkey: Optional[str] = None,
+        name: Optional[str] = None,
+    ):
+        self._address, self._family = _RemoteProtocol._parse_address(address)
+        self.capacity = int(capacity or os.cpu_count() or 1)
+        self._authkey = _RemoteProtocol._to_authkey(authkey)
+        if self._authkey is None:
+            raise MissingWorkerAuthKey()
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        self._stop_event = threading.Event()
+        self._send_lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_config_hash: Optional[str] = None
+        self._config_as_string: Optional[str] = None
+
+    def stop(self):
+        """Stop the agent once the connection to the dispatcher is checked again."""
+        self._stop_event.set()
+
+    def run(self):
+        """Run the jobs sent by the dispatcher until the agent is stopped."""
+        address = _RemoteProtocol._format_address(self._address)
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    connection = Client(self._address, self._family, authkey=self._authkey)
+                except (OSError, EOFError) as e:
+                    self._logger.debug(f"Worker {self.name} cannot connect to {address}: {e!r}")
+                    self._stop_event.wait(self._RECONNECTION_DELAY)
+                    continue
+                self._logger.info(f"Worker {self.name} connected to {address}.")
+                try:
+                    if self.__serve(connection):
+                        break
+                except (OSError, EOFError) as e:
+                    self._logger.warning(f"Worker {self.name} lost the connection to {address}: {e!r}")
+                finally:
+                    connection.close()
+                # The dispatcher puts the jobs of a lost connection back to run: they must not run twice.
+                self.__terminate_pool()
+                self._stop_event.wait(self._RECONNECTION_DELAY)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+        self._logger.info(f"Worker {self.name} stopped.")
+
+    def __serve(self, connection: Connection) -> bool:
+        """Run the jobs received on a connection.
+
+        Returns:
+            True if the agent must stop, False if the connection was closed by the dispatcher.
+        """
+        connection.send((_RemoteProtocol.HELLO, self.name, self.capacity))
+        _, heartbeat_interval = connection.recv()
+        disconnected = threading.Event()
+        threading.Thread(
+            target=self.__send_heartbeats,
+            args=(connection, float(heartbeat_interval), disconnected),
+            name="Thread-Taipy-WorkerHeartbeat",
+            daemon=True,
+        ).start()
+        try:
+            while not self._stop_event.is_set():
+                if not connection.poll(self._MAX_WAIT):
+                    continue
+                message = connection.recv()
+                if message[0] == _RemoteProtocol.STOP:
+                    return True
+                if message[0] == _RemoteProtocol.JOB:
+                    self.__run_job(connection, *message[1:])
+            return True
+        finally:
+            disconnected.set()
+
+    def __send_heartbeats(self, connection: Connection, interval: float, disconnected: threading.Event):
+        while not disconnected.wait(interval):
+            try:
+                self.__send(connection, (_RemoteProtocol.HEARTBEAT, self.capacity))
+            except (OSError, ValueError):
+                return
+
+    def __run_job(self, connection: Connection, job_id: str, wrapper: bytes, config_as_string, config_hash: str):
+        if config_as_string is not None:
+            self._config_as_string = config_as_string
+        try:
+            future = self.__get_pool(config_hash).submit(_execute_pickled_task_function, wrapper, config_hash)
+        except BrokenProcessPool:
+            # A process of the pool died, e.g. killed by the system: the pool is created again.
+            self._pool = None
+            future = self.__get_pool(config_hash).submit(_execute_pickled_task_function, wrapper, config_hash)
+        future.add_done_callback(partial(self.__send_result, connection, job_id))
+
+    def __get_pool(self, config_hash: str) -> ProcessPoolExecutor:
+        if self._pool is None or self._pool_config_hash != config_hash:
+            if self._pool is not None:
+                # The running jobs of the former pool are still reported.
+                self._pool.shutdown(wait=False)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.capacity,
+                initializer=_initialize_agent_process,
+                initargs=(self._config_as_string, config_hash, os.getpid()),
+                mp_context=mp.get_context("spawn"),
+            )
+            self._pool_config_hash = config_hash
+        return self._pool
+
+    def __terminate_pool(self):
+        """Terminate the processes of the pool, with the jobs they are running."""
+        if self._pool is None:
+            return
+        for process in list((self._pool._processes or {}).values()):
+            process.terminate()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._pool = None
+        self._pool_config_hash = None
+
+    def __send_result(self, connection: Connection, job_id: str, future: Future):
+        try:
+            exceptions: Any = future.result()
+            pickle.dumps(exceptions)
+        except Exception as e:
+            exceptions = [RuntimeError(f"Job {job_id} failed on worker {self.name}: {e!r}")]
+        try:
+            self.__send(connection, (_RemoteProtocol.RESULT, job_id, exceptions))
+        except (OSError, ValueError):
+            self._logger.warning(f"The result of job {job_id} could not be sent: the dispatcher puts it back to run.")
+
+    def __send(self, connection: Connection, message: tuple):
+        with self._send_lock:
+            connection.send(message)
@@ -9,45 +9,75 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import hashlib
 import multiprocessing as mp
-from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
 from threading import Lock
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
+from taipy.common.config.common._config_blocker import _ConfigBlocker
 
+from ...config.task_config import TaskConfig
 from ...job.job import Job
 from .._abstract_orchestrator import _AbstractOrchestrator
 from ._job_dispatcher import _JobDispatcher
-from ._task_function_wrapper import _TaskFunctionWrapper
+from ._task_function_wrapper import _initialize_worker, _TaskFunctionWrapper
 
 
 class _StandaloneJobDispatcher(_JobDispatcher):
-    """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor."""
+    """Manages job dispatching (instances of `Job^` class) in an asynchronous way.
+
+    Jobs run on a ProcessPoolExecutor, except the jobs of the tasks configured with the *"thread"* executor,
+    which run on a ThreadPoolExecutor of the orchestrator process. Such jobs avoid the cost of spawning a
+    process and of pickling the task, which suits I/O-bound tasks.
+
+    The configuration is serialized once per configuration revision and installed in the worker processes
+    by the pool initializer. The jobs only carry the hash of the configuration, along with the serialized
+    configuration if it changed since the pool was created, so that the workers reload it only then.
+    """
 
     _nb_available_workers_lock = Lock()
+    _serialized_config_lock = Lock()
+    _serialized_config: Optional[Tuple[Tuple[int, int], str, str]] = None
     _DEFAULT_MAX_NB_OF_WORKERS = 2
+    _DEFAULT_MAX_NB_OF_THREADS = 4
 
     def __init__(self, orchestrator: _AbstractOrchestrator, subproc_initializer: Optional[Callable] = None):
         super().__init__(orchestrator)
         max_workers = Config.job_config.max_nb_of_workers or self._DEFAULT_MAX_NB_OF_WORKERS
+        config_as_string, self._installed_config_hash = self._get_serialized_config()
         self._executor: Executor = ProcessPoolExecutor(
-            max_workers=max_workers, initializer=subproc_initializer, mp_context=mp.get_context("spawn")
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(config_as_string, self._installed_config_hash, subproc_initializer),
+            mp_context=mp.get_context("spawn"),
         )
         self._nb_available_workers = self._executor._max_workers  # type: ignore
+        max_threads = int(Config.job_config.max_nb_of_threads or self._DEFAULT_MAX_NB_OF_THREADS)
+        self._thread_executor: Executor = ThreadPoolExecutor(max_threads, thread_name_prefix="Thread-Taipy-Task")
+        self._nb_available_threads = max_threads
 
     def _can_execute(self) -> bool:
         """Returns True if the dispatcher have resources to dispatch a job."""
         with self._nb_available_workers_lock:
-            self._logger.debug(f"{self._nb_available_workers=}")
-            return self._nb_available_workers > 0
+            self._logger.debug(f"{self._nb_available_workers=}, {self._nb_available_threads=}")
+            return self._nb_available_workers > 0 or self._nb_available_threads > 0
+
+    def _can_dispatch(self, job: Job) -> bool:
+        with self._nb_available_workers_lock:
+            if self._runs_in_thread(job):
+                has_worker = self._nb_available_threads > 0
+            else:
+                has_worker = self._nb_available_workers > 0
+        return has_worker and super()._can_dispatch(job)
 
     def run(self):
-        with self._executor:
+        with self._executor, self._thread_executor:
             super().run()
-        self._logger.debug("Standalone job dispatcher: Pool executor shut down.")
+        self._logger.debug("Standalone job dispatcher: Pool executors shut down.")
 
     def _dispatch(self, job: Job):
         """Dispatches the given `Job^` on an available worker for execution.
@@ -55,16 +85,49 @@ class _StandaloneJobDispatcher(_JobDispatcher):
         Parameters:
             job (Job^): The job to submit on an executor with an available worker.
         """
+        in_thread = self._runs_in_thread(job)
         with self._nb_available_workers_lock:
-            self._nb_available_workers -= 1
+            if in_thread:
+                self._nb_available_threads -= 1
+            else:
+                self._nb_available_workers -= 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the dispatch method.")
-        config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
+        self._acquire_resources(job)
 
-        future = self._executor.submit(_TaskFunctionWrapper(job.id, job.task), config_as_string=config_as_string)
+        if in_thread:
+            # The configuration is already applied in the orchestrator process.
+            future = self._thread_executor.submit(_TaskFunctionWrapper(job.id, job.task))
+        else:
+            config_as_string, config_hash = self._get_serialized_config()
+            kwargs = {"config_hash": config_hash}
+            if config_hash != self._installed_config_hash:
+                # The workers were initialized with another configuration.
+                kwargs["config_as_string"] = config_as_string
+            future = self._executor.submit(_TaskFunctionWrapper(job.id, job.task), **kwargs)
         future.add_done_callback(partial(self._update_job_status_from_future, job))
 
     def _update_job_status_from_future(self, job: Job, ft):
         with self._nb_available_workers_lock:
-            self._nb_available_workers += 1
+            if self._runs_in_thread(job):
+                self._nb_available_threads += 1
+            else:
+                self._nb_available_workers += 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the callback method.")
+        self._release_resources(job)
+        self._release_worker()
         self._update_job_status(job, ft.result())
+
+    @classmethod
+    def _get_serialized_config(cls) -> Tuple[str, str]:
+        """Return the applied configuration serialized as TOML and its hash, computed once per revision."""
+        revision = (_ConfigBlocker._get_revision(), id(Config._applied_config))
+        with cls._serialized_config_lock:
+            if cls._serialized_config is None or cls._serialized_config[0] != revision:
+                config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
+                config_hash = hashlib.sha256(config_as_string.encode()).hexdigest()
+                cls._serialized_config = (revision, config_as_string, config_hash)
+            return cls._serialized_config[1], cls._serialized_config[2]
+
+    @staticmethod
+    def _runs_in_thread(job: Job) -> bool:
+        return job._task._properties.get(TaskConfig._EXECUTOR_KEY) == TaskConfig._EXECUTOR_VALUE_THREAD
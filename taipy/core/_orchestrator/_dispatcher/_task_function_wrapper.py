@@ -9,13 +9,15 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Optional
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
+from ...data._data_fingerprint import _DataFingerprint
 from ...data._data_manager_factory import _DataManagerFactory
+from ...data._shared_memory_handoff import _SharedMemoryHandoff
 from ...data.data_node import DataNode
 from ...exceptions import DataNodeWritingError
 from ...job.job_id import JobId
@@ -24,23 +26,40 @@ from ...task.task import Task
 logger = _TaipyLogger._get_logger()
 
 
+def _initialize_worker(config_as_string: str, config_hash: str, initializer: Optional[Callable] = None):
+    """Initialize a worker process of the job dispatcher by installing the configuration."""
+    _TaskFunctionWrapper._install_config(config_as_string, config_hash)
+    if initializer:
+        initializer()
+
+
 class _TaskFunctionWrapper:
     """Wrapper around task function."""
 
+    # The hash of the configuration installed in the current process, if any.
+    _config_hash: Optional[str] = None
+
     def __init__(self, job_id: JobId, task: Task):
         self.job_id = job_id
         self.task = task
+        # The fingerprints of the data read from the inputs, recorded in the edits of the outputs.
+        self._input_fingerprints: Optional[Dict[str, str]] = None
 
     def __call__(self, **kwargs):
         """Make this object callable as a function. Actually calls `execute`."""
         return self.execute(**kwargs)
 
     def execute(self, **kwargs):
-        """Execute the wrapped function. If `config_as_string` is given, then it will be reapplied to the config."""
+        """Execute the wrapped function.
+
+        If `config_as_string` is given, then it will be reapplied to the config, unless the given `config_hash` is the
+        hash of the config already installed in the process.
+        """
         try:
-            if config_as_string := kwargs.pop("config_as_string", None):
-                Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
-                Config.block_update()
+            config_hash = kwargs.pop("config_hash", None)
+            config_as_string = kwargs.pop("config_as_string", None)
+            if config_as_string and (config_hash is None or config_hash != self._config_hash):
+                self._install_config(config_as_string, config_hash)
 
             inputs = list(self.task.input.values())
             outputs = list(self.task.output.values())
@@ -52,9 +71,17 @@ class _TaskFunctionWrapper:
             logger.error("Error during task function execution!", exc_info=1)
             return [e]
 
+    @classmethod
+    def _install_config(cls, config_as_string: str, config_hash: Optional[str] = None):
+        Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
+        Config.block_update()
+        cls._config_hash = config_hash
+
     def _read_inputs(self, inputs: List[DataNode]) -> List[Any]:
         data_manager = _DataManagerFactory._build_manager()
-        return [data_manager._get(dn.id).read_or_raise() for dn in inputs]
+        data_nodes = [data_manager._get(dn.id) for dn in inputs]
+        self._input_fingerprints = _DataFingerprint._of_all(data_nodes) if data_nodes else None
+        return [_SharedMemoryHandoff._read_or_raise(dn) for dn in data_nodes]
 
     def _write_data(self, outputs: List[DataNode], results, job_id: JobId):
         data_manager = _DataManagerFactory._build_manager()
@@ -62,10 +89,14 @@ class _TaskFunctionWrapper:
             if outputs:
                 _results = self._extract_results(outputs, results)
                 exceptions = []
+                edit_options = {}
+                if self._input_fingerprints:
+                    edit_options[_DataFingerprint._INPUT_FINGERPRINTS_EDIT_KEY] = self._input_fingerprints
                 for res, dn in zip(_results, outputs):
                     try:
                         data_node = data_manager._get(dn.id)
-                        data_node.write(res, job_id=job_id)
+                        if not _SharedMemoryHandoff._hand_off(data_node, res, job_id, **edit_options):
+                            data_node.write(res, job_id=job_id, **edit_options)
                     except Exception as e:
                         logger.error("Error during write", exc_info=1)
                         exceptions.append(DataNodeWritingError(f"Error writing in datanode id {dn.id}: {e}"))
@@ -0,0 +1,207 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import heapq
+import itertools
+import threading
+from collections import deque
+from queue import Empty
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..job.job import Job
+
+_Priority = Tuple[int, int]
+
+
+def _iter_in_heap_order(heap: List[Any]) -> Iterator[Any]:
+    """Iterate over the items of a heap from the smallest, without popping them."""
+    frontier = [(heap[0], 0)] if heap else []
+    while frontier:
+        item, index = heapq.heappop(frontier)
+        yield item
+        for child in (2 * index + 1, 2 * index + 2):
+            if child < len(heap):
+                heapq.heappush(frontier, (heap[child], child))
+
+
+class _PriorityLevel:
+    """
+    The queued jobs of one priority, by submission, with a heap of the submissions in fair-share order.
+
+    A heap entry is a `[number of dequeued jobs, counter of the first queued job, submission id]`
+    list. Changing the order of a submission marks its entry as removed, by clearing its submission
+    id, and pushes a new one. Removed entries are dropped as they reach the top of the heap.
+    """
+
+    _COMPACTION_MIN_SIZE = 32
+
+    def __init__(self):
+        self.jobs: Dict[str, Deque[Tuple[int, Job]]] = {}
+        self._heap: List[List[Any]] = []
+        self._entries: Dict[str, List[Any]] = {}
+
+    def _update(self, submit_id: str, nb_dequeued: int):
+        """Move a submission to its fair-share position, or drop it if it has no queued job anymore."""
+        queued = self.jobs.get(submit_id)
+        key = [nb_dequeued, queued[0][0]] if queued else None
+        if (entry := self._entries.get(submit_id)) is not None:
+            if entry[:2] == key:
+                return
+            entry[-1] = None
+            del self._entries[submit_id]
+        if key is not None:
+            self._entries[submit_id] = entry = key + [submit_id]
+            heapq.heappush(self._heap, entry)
+        while self._heap and self._heap[0][-1] is None:
+            heapq.heappop(self._heap)
+        if len(self._heap) > max(2 * len(self._entries), self._COMPACTION_MIN_SIZE):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def _iter_submissions(self) -> Iterator[str]:
+        for entry in _iter_in_heap_order(self._heap):
+            if entry[-1] is not None:
+                yield entry[-1]
+
+
+class _JobQueue:
+    """
+    Queue of the jobs to run, shared by the orchestrator and the job dispatcher.
+
+    Jobs are dequeued by decreasing priority. A job priority is the pair of the priority of its
+    submission and of the priority of its task, so that the submission priority prevails. Among the
+    jobs of the same priority, the submission that had the fewest jobs dequeued goes first, so that a
+    large submission does not starve the others. The jobs of a submission are dequeued in the order
+    they were put.
+
+    The priorities and, within each priority, the submissions are kept in heaps, so that getting a
+    job does not sort the queue.
+
+    The queue exposes the methods of `queue.Queue` the orchestrator uses. A getter can also provide a
+    predicate on the jobs it accepts, e.g. the jobs the available resources can run. It is then given
+    the first accepted job in the queue order.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._levels: Dict[_Priority, _PriorityLevel] = {}
+        # The opposites of the priorities, including the ones of levels removed since they were pushed.
+        self._priority_heap: List[_Priority] = []
+        self._heaped_priorities: Set[_Priority] = set()
+        self._nb_queued: Dict[str, int] = {}
+        # The numbers of dequeued jobs and the priorities of the submissions having queued jobs.
+        self._nb_dequeued: Dict[str, int] = {}
+        self._priorities: Dict[str, Set[_Priority]] = {}
+        self._counter = itertools.count()
+        self._size = 0
+
+    def put(self, job: Job, priority: _Priority = (0, 0)):
+        with self._condition:
+            if (level := self._levels.get(priority)) is None:
+                level = self._levels[priority] = _PriorityLevel()
+                if priority not in self._heaped_priorities:
+                    self._heaped_priorities.add(priority)
+                    heapq.heappush(self._priority_heap, (-priority[0], -priority[1]))
+            if (queued := level.jobs.get(job.submit_id)) is None:
+                queued = level.jobs[job.submit_id] = deque()
+                self._priorities.setdefault(job.submit_id, set()).add(priority)
+            queued.append((next(self._counter), job))
+            if len(queued) == 1:
+                level._update(job.submit_id, self._nb_dequeued.get(job.submit_id, 0))
+            self._nb_queued[job.submit_id] = self._nb_queued.get(job.submit_id, 0) + 1
+            self._size += 1
+            self._condition.notify_all()
+    def get(
+        self, block: bool = True, timeout: Optional[float] = None, accept: Optional[Callable[[Job], bool]] = None
+    ) -> Job:
+        """Remove and return the first job accepted by the *accept* predicate, if any.
+
+        Raises:
+            Empty: If no accepted job is available before the timeout, or immediately if *block* is False.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            while True:
+                for priority, submit_id, index, job in self.__iter_in_order():
+                    if accept is None or accept(job):
+                        self.__remove_at(priority, submit_id, index)
+                        self._nb_dequeued[submit_id] = self._nb_dequeued.get(submit_id, 0) + 1
+                        for submission_priority in self._priorities.get(submit_id, ()):
+                            self._levels[submission_priority]._update(submit_id, self._nb_dequeued[submit_id])
+                        self.__forget_if_done(submit_id)
+                        return job
+                remaining = None if deadline is None else deadline - monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise Empty
+                self._condition.wait(remaining)
+
+    def get_nowait(self) -> Job:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def _remove(self, jobs: Iterable[Job]):
+        """Remove the given jobs from the queue."""
+        job_ids = {job.id for job in jobs}
+        with self._condition:
+            for priority, level in list(self._levels.items()):
+                for submit_id, queued in list(level.jobs.items()):
+                    kept = deque(entry for entry in queued if entry[1].id not in job_ids)
+                    if len(kept) == len(queued):
+                        continue
+                    self._size -= len(queued) - len(kept)
+                    self._nb_queued[submit_id] -= len(queued) - len(kept)
+                    level.jobs[submit_id] = kept
+                    level._update(submit_id, self._nb_dequeued.get(submit_id, 0))
+                    self.__clean(priority, submit_id)
+                    self.__forget_if_done(submit_id)
+
+    def _wake_up(self):
+        """Wake up the getters, e.g. when the jobs they accept may have changed."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def __iter_in_order(self) -> Iterator[Tuple[_Priority, str, int, Job]]:
+        while self._priority_heap and (-self._priority_heap[0][0], -self._priority_heap[0][1]) not in self._levels:
+            self._heaped_priorities.discard((-self._priority_heap[0][0], -self._priority_heap[0][1]))
+            heapq.heappop(self._priority_heap)
+        for opposite in _iter_in_heap_order(self._priority_heap):
+            if (level := self._levels.get(priority := (-opposite[0], -opposite[1]))) is None:
+                continue
+            for submit_id in level._iter_submissions():
+                for index, (_, job) in enumerate(level.jobs[submit_id]):
+                    yield priority, submit_id, index, job
+
+    def __remove_at(self, priority: _Priority, submit_id: str, index: int):
+        del self._levels[priority].jobs[submit_id][index]
+        self._nb_queued[submit_id] -= 1
+        self._size -= 1
+        self.__clean(priority, submit_id)
+
+    def __clean(self, priority: _Priority, submit_id: str):
+        level = self._levels[priority]
+        if not level.jobs[submit_id]:
+            del level.jobs[submit_id]
+            level._update(submit_id, 0)
+            self._priorities[submit_id].discard(priority)
+            if not level.jobs:
+                del self._levels[priority]
+
+    def __forget_if_done(self, submit_id: str):
+        if not self._nb_queued[submit_id]:
+            del self._nb_queued[submit_id]
+            self._nb_dequeued.pop(submit_id, None)
+            self._priorities.pop(submit_id, None)
@@ -9,25 +9,28 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import asyncio
 import itertools
-from datetime import datetime
-from queue import Queue
-from threading import Lock
-from time import sleep
-from typing import Callable, Iterable, List, Optional, Set, Union
+from threading import Condition, Lock, RLock
+from time import monotonic
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from .._entity.submittable import Submittable
 from ..data._data_manager_factory import _DataManagerFactory
+from ..data._shared_memory_handoff import _SharedMemoryHandoff
 from ..job._job_manager_factory import _JobManagerFactory
 from ..job.job import Job
 from ..job.job_id import JobId
+from ..notification import EventOperation, Notifier, _make_event
 from ..submission._submission_manager_factory import _SubmissionManagerFactory
 from ..submission.submission import Submission
+from ..submission.submission_batch import SubmissionBatch
 from ..task.task import Task
 from ._abstract_orchestrator import _AbstractOrchestrator
+from ._job_queue import _JobQueue
 
 
 class _Orchestrator(_AbstractOrchestrator):
@@ -35,10 +38,36 @@ class _Orchestrator(_AbstractOrchestrator):
     Handles the functional orchestrating.
     """
 
-    jobs_to_run: Queue = Queue()
+    jobs_to_run: _JobQueue = _JobQueue()
     blocked_jobs: List[Job] = []
-
-    lock = Lock()
+    # Index of the blocked jobs: the blocked jobs reading each data node, and the ids of the input data nodes
+    # each blocked job is still waiting for.
+    _blocked_jobs_by_input: Dict[str, Dict[JobId, Job]] = {}
+    _unready_inputs_by_job: Dict[JobId, Set[str]] = {}
+    # The priorities the blocked jobs are put in the queue with once unblocked.
+    _blocked_job_priorities: Dict[JobId, Tuple[int, int]] = {}
+
+    # The shared memory segments of the data handed off by the jobs of each submission, the transient data nodes
+    # handed off with their writing job, and the jobs of the submission that are not finished yet, which may
+    # still read them.
+    _handoffs_by_submission: Dict[str, Tuple[Set[str], Set[Tuple[str, JobId]], Set[JobId]]] = {}
+    __handoffs_lock = Lock()
+
+    # The submission and task property holding their priority.
+    _PRIORITY_PROPERTY = "priority"
+
+    # Reentrant: unblocking jobs when a data node is written may happen while the lock is held, e.g. on cancellation.
+    lock = RLock()
+    # Notified on every job status change, to wake up the threads waiting for jobs to be finished.
+    _job_status_changed = Condition()
+    # Counts the job status changes, so that the waiting threads do not miss the ones that happen while they check
+    # the jobs, which is done without holding the condition, as the jobs may be reloaded from the storage.
+    _nb_of_job_status_changes = 0
+    # Upper bound of a wait for jobs to be finished, in case a job status is changed by another process.
+    _MAX_WAIT = 0.5
+    # The functions called on the status changes of the jobs of each submission, e.g. to wake up async waiters.
+    _job_status_listeners: Dict[str, Set[Callable[[Job], None]]] = {}
+    __job_status_listeners_lock = Lock()
     __logger = _TaipyLogger._get_logger()
 
     @classmethod
@@ -68,7 +97,9 @@ class _Orchestrator(_AbstractOrchestrator):
                 before returning.<br/>
                 If not provided and *wait* is True, the function waits indefinitely.
              **properties (dict[str, any]): A key worded variable length list of user additional arguments
-                that will be stored within the `Submission^`. It can be accessed via `Submission.properties^`.
+                that will be stored within the `Submission^`. It can be accessed via `Submission.properties^`.<br/>
+                The *"priority"* property is an integer giving the priority of the submission jobs over the
+                jobs of other submissions, 0 by default.
 
         Returns:
             The created `Submission^` containing the information about the submission.
@@ -95,7 +126,8 @@ class _Orchestrator(_AbstractOrchestrator):
                     for task in ts
                 )
             submission.jobs = jobs  # type: ignore
-            cls._orchestrate_job_to_run_or_block(jobs)
+            cls._track_handoffs(submission.id, jobs)
+            cls._orchestrate_job_to_run_or_block(jobs, properties.get(cls._PRIORITY_PROPERTY))
         if Config.job_config.is_development:
             cls._check_and_execute_jobs_if_development_mode()
         elif wait:
@@ -124,7 +156,9 @@ class _Orchestrator(_AbstractOrchestrator):
                 to be finished before returning.<br/>
                 If not provided and *wait* is True, the function waits indefinitely.
              **properties (dict[str, any]): A key worded variable length list of user additional arguments
-                that will be stored within the `Submission^`. It can be accessed via `Submission.properties^`.
+                that will be stored within the `Submission^`. It can be accessed via `Submission.properties^`.<br/>
+                The *"priority"* property is an integer giving the priority of the submission jobs over the
+                jobs of other submissions, 0 by default.
 
         Returns:
             The created `Submission^` containing the information about the submission.
@@ -144,7 +178,8 @@ class _Orchestrator(_AbstractOrchestrator):
             )
             jobs = [job]
             submission.jobs = jobs  # type: ignore
-            cls._orchestrate_job_to_run_or_block(jobs)
+            cls._track_handoffs(submission.id, jobs)
+            cls._orchestrate_job_to_run_or_block(jobs, properties.get(cls._PRIORITY_PROPERTY))
         if Config.job_config.is_development:
             cls._check_and_execute_jobs_if_development_mode()
         else:
@@ -152,6 +187,74 @@ class _Orchestrator(_AbstractOrchestrator):
                 cls._wait_until_job_finished(job, timeout)
         return submission
 
+    @classmethod
+    def submit_many(
+        cls,
+        entities: Iterable[Tuple[Union[Submittable, Task], Optional[Iterable[Callable]]]],
+        force: bool = False,
+        wait: bool = False,
+        timeout: Optional[Union[float, int]] = None,
+        **properties,
+    ) -> SubmissionBatch:
+        """Submit several scenarios, sequences, or tasks for an execution at once.
+
+        The submissions and their jobs are created with batched repository writes, under a single
+        acquisition of the orchestrator lock, and the jobs are orchestrated together.
+
+        Parameters:
+             entities: The pairs of the entities to submit and of the optional functions that should be
+                executed on the status change of their jobs.
+             force (bool) : Enforce execution of the tasks even if their output data nodes are cached.
+             wait (bool): Wait for all the orchestrated jobs to be finished in asynchronous mode.
+             timeout (Union[float, int]): The optional maximum number of seconds to wait for the jobs to be
+                finished before returning.<br/>
+                If not provided and *wait* is True, the function waits indefinitely.
+             **properties (dict[str, any]): A key worded variable length list of user additional arguments
+                that will be stored within every `Submission^`.
+
+        Returns:
+            The `SubmissionBatch^` of the created submissions, in the order of the entities.
+        """
+        entities = list(entities)
+        submission_manager = _SubmissionManagerFactory._build_manager()
+        submissions = submission_manager._create_many(
+            [
+                (entity.id, entity._ID_PREFIX, getattr(entity, "config_id", None))  # type: ignore[attr-defined]
+                for entity, _ in entities
+            ],
+            **properties,
+        )
+        with cls.lock:
+            cls.__logger.debug(f"Acquiring lock to submit {len(submissions)} entities.")
+            jobs_to_create = []
+            for (entity, callbacks), submission in zip(entities, submissions):
+                tasks = [entity] if isinstance(entity, Task) else itertools.chain(*entity._get_sorted_tasks())
+                job_callbacks = [cls._on_status_change, cls._update_submission_status, *(callbacks or [])]
+                for task in tasks:
+                    for dn in task.output.values():
+                        dn.lock_edit()
+                    jobs_to_create.append((task, job_callbacks, submission.id, submission.entity_id))
+            jobs = _JobManagerFactory._build_manager()._create_many(jobs_to_create, force=force)  # type: ignore
+
+            jobs_by_submission: Dict[str, List[Job]] = {submission.id: [] for submission in submissions}
+            for job in jobs:
+                jobs_by_submission[job.submit_id].append(job)
+            for submission in submissions:
+                submission._jobs = jobs_by_submission[submission.id]
+            submission_manager._set_many(submissions)
+            for submission in submissions:
+                jobs_event = _make_event(
+                    submission, EventOperation.UPDATE, attribute_name="jobs", attribute_value=submission._jobs
+                )
+                Notifier.publish(jobs_event)
+                cls._track_handoffs(submission.id, submission._jobs)
+            cls._orchestrate_job_to_run_or_block(jobs, properties.get(cls._PRIORITY_PROPERTY))
+        if Config.job_config.is_development:
+            cls._check_and_execute_jobs_if_development_mode()
+        elif wait:
+            cls._wait_until_job_finished(jobs, timeout)
+        return SubmissionBatch(submissions, jobs)
+
     @classmethod
     def _lock_dn_output_and_create_job(
         cls,
@@ -186,7 +289,35 @@ class _Orchestrator(_AbstractOrchestrator):
             cls.__logger.error(f"Job {job.id} status: {job.status}")
 
     @classmethod
-    def _orchestrate_job_to_run_or_block(cls, jobs: List[Job]) -> None:
+    def _track_handoffs(cls, submit_id: str, jobs: List[Job]) -> None:
+        """Track the segments the jobs of a submission hand their outputs off in, to release them afterwards."""
+        handed_off_outputs = [
+            (dn, job.id) for job in jobs for dn in job._task.output.values() if _SharedMemoryHandoff._is_enabled(dn)
+        ]
+        if handed_off_outputs:
+            segment_names = {_SharedMemoryHandoff._segment_name(dn.id, job_id) for dn, job_id in handed_off_outputs}
+            transient_outputs = {
+                (dn.id, job_id) for dn, job_id in handed_off_outputs if _SharedMemoryHandoff._is_transient(dn)
+            }
+            with cls.__handoffs_lock:
+                cls._handoffs_by_submission[submit_id] = (segment_names, transient_outputs, {job.id for job in jobs})
+
+    @classmethod
+    def __release_handoffs(cls, finished_job: Job) -> None:
+        with cls.__handoffs_lock:
+            if (handoffs := cls._handoffs_by_submission.get(finished_job.submit_id)) is None:
+                return
+            segment_names, transient_outputs, unfinished_job_ids = handoffs
+            unfinished_job_ids.discard(finished_job.id)
+            if unfinished_job_ids:
+                return
+            del cls._handoffs_by_submission[finished_job.submit_id]
+        _SharedMemoryHandoff._release(segment_names)
+        # The data of the transient data nodes is lost with their segments.
+        _SharedMemoryHandoff._invalidate(transient_outputs)
+
+    @classmethod
+    def _orchestrate_job_to_run_or_block(cls, jobs: List[Job], submission_priority: Optional[int] = None) -> None:
         blocked_jobs = []
         pending_jobs = []
 
@@ -198,29 +329,102 @@ class _Orchestrator(_AbstractOrchestrator):
                 job.pending()
                 pending_jobs.append(job)
 
-        cls.blocked_jobs.extend(blocked_jobs)
+        cls._add_blocked_jobs(blocked_jobs, submission_priority)
         for job in pending_jobs:
-            cls.jobs_to_run.put(job)
+            cls.jobs_to_run.put(job, cls._get_priority(job, submission_priority))
 
     @classmethod
     def _wait_until_job_finished(cls, jobs: Union[List[Job], Job], timeout: Optional[Union[float, int]] = None) -> None:
         #  Note: this method should be prefixed by two underscores, but it has only one, so it can be mocked in tests.
-        def __check_if_timeout(st, to):
-            if to is None:
-                return True
-            return (datetime.now() - st).seconds < to
-
-        start = datetime.now()
+        deadline = None if timeout is None else monotonic() + timeout
         jobs = list(jobs) if isinstance(jobs, Iterable) else [jobs]
         index = 0
-        while __check_if_timeout(start, timeout) and index < len(jobs):
-            try:
-                if jobs[index]._is_finished():
-                    index += 1
-                else:
-                    sleep(0.5)  # Limit CPU usage
-            except Exception:
-                pass
+        while True:
+            with cls._job_status_changed:
+                nb_of_status_changes = cls._nb_of_job_status_changes
+            while index < len(jobs) and cls.__is_finished(jobs[index]):
+                index += 1
+            if index == len(jobs):
+                return
+            wait = cls._MAX_WAIT if deadline is None else min(cls._MAX_WAIT, deadline - monotonic())
+            if wait <= 0:
+                return
+            with cls._job_status_changed:
+                cls._job_status_changed.wait_for(
+                    lambda: cls._nb_of_job_status_changes != nb_of_status_changes, timeout=wait
+                )
+
+    @staticmethod
+    def __is_finished(job: Job) -> bool:
+        try:
+            return job._is_finished()
+        except Exception:
+            return False
+
+    @classmethod
+    async def _wait_until_submission_finished_async(
+        cls, submission: Submission, timeout: Optional[Union[float, int]] = None
+    ) -> bool:
+        """Wait for the jobs of a submission to be finished without blocking the running event loop.
+
+        The waiting coroutine is woken up by the status changes of the submission jobs, through a job status
+        listener that schedules the check in the event loop.
+
+        Returns:
+            True if all the jobs of the submission are finished, False if the timeout expired before.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        finished_job_ids: Set[JobId] = set()
+        job_finished = asyncio.Event()
+
+        def on_job_finished(job_id: JobId):
+            finished_job_ids.add(job_id)
+            job_finished.set()
+
+        def listener(job: Job):
+            if job._is_finished():
+                try:
+                    loop.call_soon_threadsafe(on_job_finished, job.id)
+                except RuntimeError:
+                    # The event loop is closed.
+                    pass
+
+        cls._add_job_status_listener(submission.id, listener)
+        try:
+            job_manager = _JobManagerFactory._build_manager()
+            unfinished_job_ids = set()
+            for job in submission._jobs:
+                if isinstance(job, str):
+                    job = job_manager._get(job)
+                if job is not None and not job._is_finished():
+                    unfinished_job_ids.add(job.id)
+            while unfinished_job_ids - finished_job_ids:
+                job_finished.clear()
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(job_finished.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return False
+            return True
+        finally:
+            cls._remove_job_status_listener(submission.id, listener)
+
+    @classmethod
+    def _add_job_status_listener(cls, submit_id: str, listener: Callable[[Job], None]) -> None:
+        """Call the listener on every status change of the jobs of the submission, from the changing thread."""
+        with cls.__job_status_listeners_lock:
+            cls._job_status_listeners.setdefault(submit_id, set()).add(listener)
+
+    @classmethod
+    def _remove_job_status_listener(cls, submit_id: str, listener: Callable[[Job], None]) -> None:
+        with cls.__job_status_listeners_lock:
+            if (listeners := cls._job_status_listeners.get(submit_id)) is not None:
+                listeners.discard(listener)
+                if not listeners:
+                    del cls._job_status_listeners[submit_id]
 
     @classmethod
     def _is_blocked(cls, obj: Union[Task, Job]) -> bool:
@@ -236,6 +440,35 @@ class _Orchestrator(_AbstractOrchestrator):
         data_manager = _DataManagerFactory._build_manager()
         return any(not data_manager._get(dn.id).is_ready_for_reading for dn in input_data_nodes)
 
+    @staticmethod
+    def __get_unready_input_ids(job: Job) -> Set[str]:
+        data_manager = _DataManagerFactory._build_manager()
+        return {dn.id for dn in job._task.input.values() if not data_manager._get(dn.id).is_ready_for_reading}
+
+    @classmethod
+    def _requeue_job(cls, job: Job) -> None:
+        """Put a job the dispatcher could not run to completion back to run, e.g. when its worker is lost."""
+        submission = _SubmissionManagerFactory._build_manager()._get(job.submit_id)
+        submission_priority = submission.properties.get(cls._PRIORITY_PROPERTY) if submission else None
+        job.pending()
+        cls.jobs_to_run.put(job, cls._get_priority(job, submission_priority))
+
+    @classmethod
+    def _get_priority(cls, job: Job, submission_priority: Optional[int] = None) -> Tuple[int, int]:
+        """Returns the priority of a job in the queue of the jobs to run: its submission then its task priority."""
+        task_priority = job._task._properties.get(cls._PRIORITY_PROPERTY)
+        return int(submission_priority or 0), int(task_priority or 0)
+
+    @classmethod
+    def _add_blocked_jobs(cls, jobs: List[Job], submission_priority: Optional[int] = None) -> None:
+        """Add jobs to the blocked jobs, indexed by the input data nodes they read."""
+        cls.blocked_jobs.extend(jobs)
+        for job in jobs:
+            cls._blocked_job_priorities[job.id] = cls._get_priority(job, submission_priority)
+            cls._unready_inputs_by_job[job.id] = cls.__get_unready_input_ids(job)
+            for dn in job._task.input.values():
+                cls._blocked_jobs_by_input.setdefault(dn.id, {})[job.id] = job
+
     @staticmethod
     def _unlock_edit_on_jobs_outputs(jobs: Union[Job, List[Job], Set[Job]]) -> None:
         jobs = [jobs] if isinstance(jobs, Job) else jobs
@@ -244,31 +477,57 @@ class _Orchestrator(_AbstractOrchestrator):
 
     @classmethod
     def _on_status_change(cls, job: Job) -> None:
+        with cls._job_status_changed:
+            cls._nb_of_job_status_changes += 1
+            cls._job_status_changed.notify_all()
+        if cls._job_status_listeners:
+            with cls.__job_status_listeners_lock:
+                listeners = list(cls._job_status_listeners.get(job.submit_id, ()))
+            for listener in listeners:
+                listener(job)
         if job.is_completed() or job.is_skipped():
             cls.__logger.debug(f"{job.id} has been completed or skipped. Unblocking jobs.")
-            cls.__unblock_jobs()
+            cls.__unblock_jobs(job)
         elif job.is_failed():
             cls._fail_subsequent_jobs(job)
+        if job._is_finished():
+            cls.__release_handoffs(job)
+
+    @classmethod
+    def _on_data_node_ready(cls, dn_id: str) -> None:
+        """Unblock the jobs reading a data node that became ready outside of jobs, e.g. written by a user."""
+        if dn_id in cls._blocked_jobs_by_input:
+            cls.__unblock_jobs_reading([dn_id])
 
     @classmethod
-    def __unblock_jobs(cls) -> None:
+    def __unblock_jobs(cls, finished_job: Job) -> None:
+        cls.__unblock_jobs_reading([dn.id for dn in finished_job._task.output.values()])
+
+    @classmethod
+    def __unblock_jobs_reading(cls, ready_dn_ids: List[str]) -> None:
         with cls.lock:
             cls.__logger.debug("Acquiring lock to unblock jobs.")
-            for job in cls.blocked_jobs:
-                if not cls._is_blocked(job):
+            unblocked_jobs = []
+            # Only the blocked jobs reading a data node that became ready may be unblocked.
+            for dn_id in ready_dn_ids:
+                for job in list(cls._blocked_jobs_by_input.get(dn_id, {}).values()):
+                    if (unready_input_ids := cls._unready_inputs_by_job.get(job.id)) is None:
+                        continue
+                    unready_input_ids.discard(dn_id)
+                    if unready_input_ids:
+                        continue
+                    if cls._is_blocked(job):
+                        # An input the job was not waiting for is no longer ready, e.g. it is being edited.
+                        cls._unready_inputs_by_job[job.id] = cls.__get_unready_input_ids(job)
+                        continue
                     cls.__logger.debug(f"Unblocking job: {job.id}.")
                     job.pending()
-                    cls.__logger.debug(f"Removing job {job.id} from the blocked_job list.")
-                    cls.__remove_blocked_job(job)
-                    cls.__logger.debug(f"Adding job {job.id} to the list of jobs to run.")
-                    cls.jobs_to_run.put(job)
-
-    @classmethod
-    def __remove_blocked_job(cls, job: Job) -> None:
-        try:  # In case the job has been removed from the list of blocked_jobs.
-            cls.blocked_jobs.remove(job)
-        except Exception:
-            cls.__logger.warning(f"{job.id} is not in the blocked list anymore.")
+                    del cls._unready_inputs_by_job[job.id]
+                    unblocked_jobs.append((job, cls._blocked_job_priorities[job.id]))
+            cls.__remove_blocked_jobs({job for job, _ in unblocked_jobs})
+            for job, priority in unblocked_jobs:
+                cls.__logger.debug(f"Adding job {job.id} to the list of jobs to run.")
+                cls.jobs_to_run.put(job, priority)
 
     @classmethod
     def cancel_job(cls, job: Job) -> None:
@@ -282,40 +541,43 @@ class _Orchestrator(_AbstractOrchestrator):
             with cls.lock:
                 cls.__logger.debug(f"Acquiring lock to cancel job {job.id}.")
                 to_cancel_or_abandon_jobs = {job}
-                to_cancel_or_abandon_jobs.update(cls.__find_subsequent_jobs(job.submit_id, set(job.task.output.keys())))
+                to_cancel_or_abandon_jobs.update(
+                    cls.__find_subsequent_jobs(job.submit_id, {dn.id for dn in job._task.output.values()})
+                )
                 cls.__remove_blocked_jobs(to_cancel_or_abandon_jobs)
                 cls.__remove_jobs_to_run(to_cancel_or_abandon_jobs)
                 cls._cancel_jobs(job.id, to_cancel_or_abandon_jobs)
                 cls._unlock_edit_on_jobs_outputs(to_cancel_or_abandon_jobs)
 
     @classmethod
-    def __find_subsequent_jobs(cls, submit_id, output_dn_config_ids: Set) -> Set[Job]:
-        next_output_dn_config_ids = set()
-        subsequent_jobs = set()
-        for job in cls.blocked_jobs:
-            job_input_dn_config_ids = job.task.input.keys()
-            if job.submit_id == submit_id and len(output_dn_config_ids.intersection(job_input_dn_config_ids)) > 0:
-                next_output_dn_config_ids.update(job.task.output.keys())
-                subsequent_jobs.update([job])
-        if next_output_dn_config_ids:
-            subsequent_jobs.update(
-                cls.__find_subsequent_jobs(submit_id, output_dn_config_ids=next_output_dn_config_ids)
-            )
+    def __find_subsequent_jobs(cls, submit_id, output_dn_ids: Set[str]) -> Set[Job]:
+        subsequent_jobs: Set[Job] = set()
+        dn_ids_to_visit = list(output_dn_ids)
+        while dn_ids_to_visit:
+            for job in cls._blocked_jobs_by_input.get(dn_ids_to_visit.pop(), {}).values():
+                if job.submit_id == submit_id and job not in subsequent_jobs:
+                    subsequent_jobs.add(job)
+                    dn_ids_to_visit.extend(dn.id for dn in job._task.output.values())
         return subsequent_jobs
 
     @classmethod
     def __remove_blocked_jobs(cls, jobs: Set[Job]) -> None:
+        if not jobs:
+            return
         for job in jobs:
-            cls.__remove_blocked_job(job)
+            cls._unready_inputs_by_job.pop(job.id, None)
+            cls._blocked_job_priorities.pop(job.id, None)
+            for dn in job._task.input.values():
+                if (blocked_jobs := cls._blocked_jobs_by_input.get(dn.id)) is not None:
+                    blocked_jobs.pop(job.id, None)
+                    if not blocked_jobs:
+                        del cls._blocked_jobs_by_input[dn.id]
+        job_ids = {job.id for job in jobs}
+        cls.blocked_jobs[:] = [job for job in cls.blocked_jobs if job.id not in job_ids]
 
     @classmethod
     def __remove_jobs_to_run(cls, jobs: Set[Job]) -> None:
-        new_jobs_to_run: Queue = Queue()
-        while not cls.jobs_to_run.empty():
-            current_job = cls.jobs_to_run.get()
-            if current_job not in jobs:
-                new_jobs_to_run.put(current_job)
-        cls.jobs_to_run = new_jobs_to_run
+        cls.jobs_to_run._remove(jobs)
 
     @classmethod
     def _fail_subsequent_jobs(cls, failed_job: Job) -> None:
@@ -323,7 +585,7 @@ class _Orchestrator(_AbstractOrchestrator):
             cls.__logger.debug("Acquiring lock to fail subsequent jobs.")
             to_fail_or_abandon_jobs = set()
             to_fail_or_abandon_jobs.update(
-                cls.__find_subsequent_jobs(failed_job.submit_id, set(failed_job.task.output.keys()))
+                cls.__find_subsequent_jobs(failed_job.submit_id, {dn.id for dn in failed_job._task.output.values()})
             )
             for job in to_fail_or_abandon_jobs:
                 job.abandoned()
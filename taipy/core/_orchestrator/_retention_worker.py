@@ -0,0 +1,158 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+from weakref import WeakKeyDictionary
+
+from taipy.common.config import Config
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from .._manager._manager import _Manager
+from .._repository._abstract_repository import _AbstractRepository
+from ..job._job_manager_factory import _JobManagerFactory
+from ..job.job import Job
+from ..submission._submission_manager_factory import _SubmissionManagerFactory
+from ..submission.submission import Submission
+
+_EntityType = TypeVar("_EntityType", Job, Submission)
+
+
+class _RetentionWorker(threading.Thread):
+    """
+    Periodically moves the finished jobs and submissions that the retention policy no longer keeps from
+    their repositories to their archives, so that the live repositories stay small.
+
+    The policy is set by the `retention_max_age` and `retention_max_count` core properties. A finished
+    submission is archived once it is older than the maximum age, or once its submitted entity has
+    more recent finished submissions than the maximum count, and its jobs are archived along with it.
+    Finished jobs that no live submission refers to are archived on the same criteria, per task.
+
+    The policy is applied every `retention_interval` seconds. Finished entities no longer change: when
+    the repositories can list the ids of their entities, the worker keeps the finished ones it loaded,
+    and each application of the policy only loads the entities created since the previous one and the
+    ones that were not finished yet.
+    """
+
+    _logger = _TaipyLogger._get_logger()
+
+    def __init__(self, interval: Optional[float] = None):
+        threading.Thread.__init__(self, name="Thread-Taipy-RetentionWorker")
+        self.daemon = True
+        self.interval = float(Config.core.retention_interval) if interval is None else interval
+        self._stop_event = threading.Event()
+        self._finished_entities: "WeakKeyDictionary[_AbstractRepository, Dict[str, _EntityType]]" = (
+            WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _is_enabled() -> bool:
+        return Config.core.retention_max_age is not None or Config.core.retention_max_count is not None
+
+    def stop(self, wait: bool = True, timeout: Optional[float] = None):
+        """Stop the worker.
+
+        Parameters:
+            wait (bool): If True, the method will wait for the worker to stop.
+            timeout (Optional[float]): The maximum time to wait. If None, the method will wait indefinitely.
+        """
+        self._stop_event.set()
+        if wait and self.is_alive():
+            self.join(timeout=timeout)
+
+    def run(self):
+        self._logger.debug("Retention worker started.")
+        while not self._stop_event.wait(self.interval):
+            try:
+                self._archive_expired_entities()
+            except Exception as e:
+                self._logger.exception(e)
+        self._logger.debug("Retention worker stopped.")
+
+    def _archive_expired_entities(self, now: Optional[datetime] = None) -> Tuple[int, int]:
+        """Archive the finished submissions and jobs the retention policy no longer keeps.
+
+        Returns:
+            The numbers of archived submissions and jobs.
+        """
+        now = now or datetime.now()
+        submission_manager = _SubmissionManagerFactory._build_manager()
+        job_manager = _JobManagerFactory._build_manager()
+
+        # Entities are read through their private attributes, which does not reload them from the repositories.
+        submissions = self.__get_entities(submission_manager)
+        expired_submissions = self.__select_expired(submissions, lambda s: s._entity_id, now)
+        expired_submission_ids = {submission.id for submission in expired_submissions}
+        live_job_ids: Set[str] = set()
+        expired_job_ids: Set[str] = set()
+        for submission in submissions:
+            job_ids = expired_job_ids if submission.id in expired_submission_ids else live_job_ids
+            job_ids.update(job if isinstance(job, str) else job.id for job in submission._jobs)
+
+        jobs = [job for job in self.__get_entities(job_manager) if job.id not in live_job_ids]
+        orphan_jobs = [job for job in jobs if job.id not in expired_job_ids]
+        expired_job_ids.update(job.id for job in self.__select_expired(orphan_jobs, lambda j: j._task.id, now))
+        expired_jobs = [job for job in jobs if job.id in expired_job_ids and job._is_finished()]
+
+        self.__archive(submission_manager, expired_submissions)
+        self.__archive(job_manager, expired_jobs)
+        if expired_submissions or expired_jobs:
+            self._logger.info(f"Archived {len(expired_submissions)} submissions and {len(expired_jobs)} jobs.")
+        return len(expired_submissions), len(expired_jobs)
+
+    def __get_entities(self, manager: Type[_Manager]) -> List[_EntityType]:
+        """Return all the entities of a manager, only loading the ones not known to be finished yet."""
+        repository = manager._repository
+        if (ids := repository._list_ids()) is None:
+            return manager._get_all("all")
+        if (finished := self._finished_entities.get(repository)) is None:
+            finished = self._finished_entities.setdefault(repository, {})
+        for entity_id in finished.keys() - ids:
+            del finished[entity_id]
+        unfinished = []
+        for entity in repository._load_many(ids - finished.keys()).values():
+            if entity._is_finished():
+                finished[entity.id] = entity
+            else:
+                unfinished.append(entity)
+        return [*finished.values(), *unfinished]
+
+    def __archive(self, manager: Type[_Manager], entities: List[_EntityType]):
+        """Archive entities as they are in the repository, since the kept finished entities may be stale."""
+        if not entities:
+            return
+        if (finished := self._finished_entities.get(manager._repository)) is not None:
+            for entity in entities:
+                finished.pop(entity.id, None)
+        manager._archive_many(list(manager._repository._load_many([entity.id for entity in entities]).values()))
+
+    @staticmethod
+    def __select_expired(
+        entities: Iterable[_EntityType], group_key: Callable[[_EntityType], str], now: datetime
+    ) -> List[_EntityType]:
+        max_age, max_count = Config.core.retention_max_age, Config.core.retention_max_count
+        groups: Dict[str, List[_EntityType]] = defaultdict(list)
+        for entity in entities:
+            if entity._is_finished():
+                groups[group_key(entity)].append(entity)
+
+        expired = []
+        oldest_kept = now - timedelta(seconds=int(max_age)) if max_age is not None else None
+        for group in groups.values():
+            group.sort(key=lambda e: e._creation_date, reverse=True)
+            for rank, entity in enumerate(group):
+                too_many = max_count is not None and rank >= int(max_count)
+                too_old = oldest_kept is not None and entity._creation_date < oldest_kept
+                if too_many or too_old:
+                    expired.append(entity)
+        return expired
@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from abc import ABC, abstractmethod
+from typing import Iterable, List
 
 
 class _AbstractConverter(ABC):
@@ -22,3 +23,12 @@ class _AbstractConverter(ABC):
     @abstractmethod
     def _model_to_entity(cls, model):
         raise NotImplementedError
+
+    @classmethod
+    def _models_to_entities(cls, models: Iterable) -> List:
+        """Convert several models at once.
+
+        Converters of entities referencing other entities override this method so that the
+        referenced entities of all the models are loaded in bulk.
+        """
+        return [cls._model_to_entity(model) for model in models]
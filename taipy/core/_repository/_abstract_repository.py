@@ -9,19 +9,27 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-import json
 import pathlib
 from abc import abstractmethod
-from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Set, TypeVar, Union
 
-from ..exceptions import FileCannotBeRead
-from ._decoder import _Decoder
+from taipy.common.config import Config
+
+from ..exceptions import FileCannotBeRead, ModelNotFound
+from ._serializer import _get_serializer, _Serializer
 
 ModelType = TypeVar("ModelType")
 Entity = TypeVar("Entity")
 
 
 class _AbstractRepository(Generic[ModelType, Entity]):
+    _SERIALIZER_PROPERTY = "serializer"
+
+    @property
+    def _serializer(self) -> _Serializer:
+        """The codec of the models, set by the `serializer` repository property."""
+        return _get_serializer(Config.core.repository_properties.get(self._SERIALIZER_PROPERTY))
+
     @abstractmethod
     def _save(self, entity: Entity):
         """
@@ -32,6 +40,17 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _save_many(self, entities: Iterable[Entity]):
+        """
+        Save several entities in the repository.
+
+        Parameters:
+            entities: The entities to save. Repositories that can save several entities at once
+                override this method, which saves them one by one by default.
+        """
+        for entity in entities:
+            self._save(entity)
+
     @abstractmethod
     def _exists(self, entity_id: str) -> bool:
         """
@@ -56,6 +75,48 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _load_many(self, entity_ids: Iterable[str]) -> Dict[str, Entity]:
+        """
+        Retrieve the data of several entities from the repository.
+
+        Parameters:
+            entity_ids: The ids of the entities to retrieve. Duplicated ids are only loaded once.
+
+        Returns:
+            A dictionary of the entities found, indexed by id. The ids that do not match any entity
+            are missing from the dictionary.
+        """
+        entities = {}
+        for entity_id in dict.fromkeys(entity_ids):
+            try:
+                entities[entity_id] = self._load(entity_id)
+            except ModelNotFound:
+                pass
+        return entities
+
+    def _revision(self, entity_id: str) -> Optional[Hashable]:
+        """
+        Retrieve a token that changes every time the entity is saved.
+
+        Parameters:
+            entity_id: The entity id, i.e., its primary key.
+
+        Returns:
+            The revision of the entity, or None if the entity does not exist or if its revision cannot
+            be trusted. By default, repositories do not track revisions.
+        """
+        return None
+
+    def _list_ids(self) -> Optional[Set[str]]:
+        """
+        Retrieve the ids of all the entities, without loading them.
+
+        Returns:
+            The ids of the entities, or None if the repository cannot list them without loading the
+            entities. By default, repositories do not list ids.
+        """
+        return None
+
     @abstractmethod
     def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
         """
@@ -147,6 +208,6 @@ class _AbstractRepository(Generic[ModelType, Entity]):
             raise FileCannotBeRead(str(entity_file_path)) from None
 
         if isinstance(file_content, str):
-            file_content = json.loads(file_content, cls=_Decoder)
+            file_content = self._serializer._loads(file_content)
         model = self.model_type.from_dict(file_content)  # type: ignore[attr-defined]
         return self.converter._model_to_entity(model)  # type: ignore[attr-defined]
@@ -0,0 +1,73 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import gzip
+import pathlib
+from typing import Any, Dict, Iterable, List
+
+from taipy.common.config import Config
+
+from ._filesystem_lock import _FileSystemLock
+from ._serializer import _Serializer
+
+
+class _Archive:
+    """
+    Compressed, append-only archive of the models of the entities of one type that were removed from
+    their repository.
+
+    The archive is a gzip file holding one serialized model per line. Every archival appends a new gzip
+    member to the file, which gzip readers read as one stream, so that archiving never rewrites the
+    previous members. Appends hold an exclusive lock and reads a shared one (see `_FileSystemLock`), so
+    that a reader never sees a partially written member.
+
+    Attributes:
+        name (str): The name of the archive, e.g. "job".
+        serializer (_Serializer): The codec of the archived models.
+    """
+
+    _ARCHIVE_DIR_NAME = "archive"
+    _FILE_EXTENSION = ".jsonl.gz"
+
+    def __init__(self, name: str, serializer: _Serializer):
+        self.name = name
+        self.serializer = serializer
+
+    @property
+    def path(self) -> pathlib.Path:
+        archive_dir = pathlib.Path(Config.core.taipy_storage_folder) / self._ARCHIVE_DIR_NAME
+        return archive_dir / f"{self.name}{self._FILE_EXTENSION}"
+
+    @property
+    def _lock(self) -> _FileSystemLock:
+        return _FileSystemLock(self.path.with_name(f".{self.path.name}.lock"))
+
+    def _append(self, model_dicts: Iterable[Dict[str, Any]]):
+        """Append the models to the archive."""
+        # Without indentation, a serialized model never holds a line break.
+        lines = b"".join(self.serializer._dumps(model_dict) + b"\n" for model_dict in model_dicts)
+        if not lines:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock._exclusive(), self.path.open("ab") as f:
+            f.write(gzip.compress(lines))
+
+    def _load_all(self) -> List[Dict[str, Any]]:
+        """Return the archived models, from the oldest archived to the latest."""
+        try:
+            with self._lock._shared(), gzip.open(self.path, "rt", encoding="UTF-8") as f:
+                return [self.serializer._loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _clear(self):
+        with self._lock._exclusive():
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,301 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import os
+import pathlib
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ._filesystem_layout import _FileSystemLayout
+
+
+class _FileSystemIndex:
+    """
+    Persistent secondary index of the commonly filtered attributes of the entities stored in one folder
+    of a `_FileSystemRepository`.
+
+    The index is persisted as an append-only journal of JSON lines, so that updating it on every save or
+    deletion costs a small append instead of a rewrite. Each line is either an entry, a deletion, or a
+    stamp recording the modification time of the entity folder at which the index was known to be
+    complete. Any change made to the folder behind the index back (by another tool, a user, or a
+    process that crashed before journaling) updates the folder modification time, which makes the
+    stamp stale and triggers an incremental rebuild from the folder listing. With a sharded layout, the
+    stamp is the latest modification time of the entity folder and of its shards.
+
+    The index only provides candidate files. Callers must still check the filters on the file content.
+
+    Attributes:
+        dir_path (pathlib.Path): The folder holding the entity files.
+        journal_path (pathlib.Path): The file holding the index journal.
+        layout (_FileSystemLayout): The layout of the entity files in the folder.
+    """
+
+    _INDEXED_FIELDS = ("config_id", "owner_id", "version", "cycle", "parent_ids", "entity_id")
+    _FILE_EXTENSION = ".json"
+
+    # A folder modification time that is too close to the moment it was checked cannot be trusted since
+    # filesystem timestamps are coarse: a later change could occur within the same timestamp tick.
+    _RACY_WINDOW_NS = 1_000_000_000
+    _COMPACTION_THRESHOLD = 1_000
+
+    def __init__(
+        self,
+        dir_path: pathlib.Path,
+        journal_path: pathlib.Path,
+        loader: Callable[[pathlib.Path], Any],
+        layout: Optional[_FileSystemLayout] = None,
+    ):
+        self.dir_path = dir_path
+        self.journal_path = journal_path
+        self.layout = layout or _FileSystemLayout()
+        self._loader = loader
+        self._lock = threading.RLock()
+        self.__reset()
+
+    @classmethod
+    def _extract_fields(cls, model_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return {field: model_dict[field] for field in cls._INDEXED_FIELDS if field in model_dict}
+
+    @classmethod
+    def _is_indexable(cls, filters: Optional[List[Dict]]) -> bool:
+        return bool(filters) and all(_filter and set(_filter).issubset(cls._INDEXED_FIELDS) for _filter in filters)
+
+    def _get_candidates(self, filters: Optional[List[Dict]]) -> Optional[Set[str]]:
+        """Return the ids of the entities that may match the filters, or None if the index cannot tell."""
+        if not self._is_indexable(filters):
+            return None
+
+        with self._lock:
+            self.__refresh()
+            candidates: Set[str] = set()
+            for _filter in filters:  # type: ignore[union-attr]
+                ids: Optional[Set[str]] = None
+                for key, value in _filter.items():
+                    matching = self._inverted[key].get(self.__hashable(value), set())
+                    ids = set(matching) if ids is None else ids & matching
+                    if not ids:
+                        break
+                candidates.update(ids or ())
+            return candidates
+
+    def _get_ids(self) -> Set[str]:
+        """Return the ids of all the entities of the folder."""
+        with self._lock:
+            self.__refresh()
+            return set(self._entries)
+
+    def _update(self, entity_id: str, model_dict: Dict[str, Any], write: Callable[[], Any]):
+        """Run the write of an entity file and record its indexed fields."""
+        with self._lock:
+            was_fresh = self.__is_fresh(self.__dir_mtime())
+            write()
+            fields = self._extract_fields(model_dict)
+            self.__apply_entry(entity_id, fields)
+            record: Dict[str, Any] = {"id": entity_id, "fields": fields}
+            if was_fresh:
+                self._stamp = self.__dir_mtime()
+                record["stamp"] = self._stamp
+            self.__append([record])
+
+    def _remove(self, entity_id: str, delete: Callable[[], Any]):
+        """Run the deletion of an entity file and drop it from the index."""
+        self._remove_many([entity_id], delete)
+
+    def _remove_many(self, entity_ids: List[str], delete: Callable[[], Any]):
+        """Run the deletion of several entity files at once and drop them from the index with a single append."""
+        if not entity_ids:
+            return
+        with self._lock:
+            was_fresh = self.__is_fresh(self.__dir_mtime())
+            delete()
+            records: List[Dict[str, Any]] = []
+            for entity_id in entity_ids:
+                self.__apply_deletion(entity_id)
+                records.append({"id": entity_id, "deleted": True})
+            if was_fresh:
+                self._stamp = self.__dir_mtime()
+                records[-1]["stamp"] = self._stamp
+            self.__append(records)
+
+    def _clear(self):
+        with self._lock:
+            self.__reset()
+            try:
+                self.journal_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __reset(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._inverted: Dict[str, Dict[Any, Set[str]]] = defaultdict(dict)
+        self._stamp: Optional[int] = None
+        self._journal_state: Optional[Tuple[int, int]] = None
+        self._journal_records = 0
+
+    def __refresh(self):
+        self.__replay_journal()
+        dir_mtime = self.__dir_mtime()
+        if dir_mtime is None:
+            if self._entries:
+                self.__reset()
+            return
+        if not self.__is_fresh(dir_mtime):
+            self.__rebuild(dir_mtime)
+
+    def __is_fresh(self, dir_mtime: Optional[int]) -> bool:
+        return dir_mtime is not None and self._stamp == dir_mtime and self._journal_state == self.__journal_state()
+
+    def __rebuild(self, dir_mtime: int):
+        checked_at = time.time_ns()
+        listed_ids = {
+            f.name[: -len(self._FILE_EXTENSION)]
+            for f in self.layout._iter_files(self.dir_path)
+            if f.name.endswith(self._FILE_EXTENSION) and not f.name.startswith(".")
+        }
+
+        records: List[Dict[str, Any]] = []
+        complete = True
+        for entity_id in set(self._entries) - listed_ids:
+            self.__apply_deletion(entity_id)
+            records.append({"id": entity_id, "deleted": True})
+        for entity_id in listed_ids - set(self._entries):
+            model_dict = self._loader(self.layout._get_path(self.dir_path, entity_id))
+            if not isinstance(model_dict, dict):
+                # The file is empty or being written. Index it during a later refresh.
+                complete = False
+                continue
+            fields = self._extract_fields(model_dict)
+            self.__apply_entry(entity_id, fields)
+            records.append({"id": entity_id, "fields": fields})
+
+        if complete and checked_at - dir_mtime > self._RACY_WINDOW_NS:
+            self._stamp = dir_mtime
+            records.append({"stamp": dir_mtime})
+        else:
+            self._stamp = None
+
+        if self._journal_records + len(records) > 2 * len(self._entries) + self._COMPACTION_THRESHOLD:
+            self.__compact()
+        elif records:
+            self.__append(records)
+
+    def __replay_journal(self):
+        journal_state = self.__journal_state()
+        if journal_state == self._journal_state:
+            return
+        if journal_state is None or self._journal_state is None or journal_state[0] != self._journal_state[0]:
+            self.__reset()
+            offset = 0
+        else:
+            offset = self._journal_state[1]
+            if journal_state[1] < offset:
+                self.__reset()
+                offset = 0
+        if journal_state is None:
+            return
+
+        try:
+            with self.journal_path.open("rb") as journal:
+                journal.seek(offset)
+                content = journal.read()
+        except FileNotFoundError:
+            self.__reset()
+            return
+
+        # Only consume complete lines: a concurrent writer may be appending the last one.
+        complete_content = content[: content.rfind(b"\n") + 1]
+        for line in complete_content.splitlines():
+            try:
+                self.__apply_record(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                self._stamp = None
+        self._journal_state = (journal_state[0], offset + len(complete_content))
+
+    def __apply_record(self, record: Dict[str, Any]):
+        self._journal_records += 1
+        if "fields" in record:
+            self.__apply_entry(record["id"], record["fields"])
+        elif record.get("deleted"):
+            self.__apply_deletion(record["id"])
+        if "stamp" in record:
+            self._stamp = record["stamp"]
+
+    def __apply_entry(self, entity_id: str, fields: Dict[str, Any]):
+        self.__apply_deletion(entity_id)
+        self._entries[entity_id] = fields
+        for key, value in fields.items():
+            for hashable_value in self.__values(value):
+                self._inverted[key].setdefault(hashable_value, set()).add(entity_id)
+
+    def __apply_deletion(self, entity_id: str):
+        if (fields := self._entries.pop(entity_id, None)) is None:
+            return
+        for key, value in fields.items():
+            for hashable_value in self.__values(value):
+                if ids := self._inverted[key].get(hashable_value):
+                    ids.discard(entity_id)
+                    if not ids:
+                        del self._inverted[key][hashable_value]
+
+    def __append(self, records: Iterable[Dict[str, Any]]):
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        previous_state = self.__journal_state()
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.journal_path.open("a", encoding="UTF-8") as journal:
+            journal.write(lines)
+        new_state = self.__journal_state()
+        if previous_state == self._journal_state and new_state is not None:
+            # Nobody else appended in between: the journal content is fully known.
+            self._journal_state = new_state
+            self._journal_records += lines.count("\n")
+        else:
+            # Another writer appended records: force a replay of the whole journal at next refresh.
+            self._journal_state = None
+
+    def __compact(self):
+        records = [{"id": entity_id, "fields": fields} for entity_id, fields in self._entries.items()]
+        if self._stamp is not None:
+            records.append({"stamp": self._stamp})
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.journal_path.with_name(f"{self.journal_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records), encoding="UTF-8"
+        )
+        os.replace(tmp_path, self.journal_path)
+        self._journal_state = self.__journal_state()
+        self._journal_records = len(records)
+
+    def __dir_mtime(self) -> Optional[int]:
+        return self.layout._mtime(self.dir_path)
+
+    def __journal_state(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.journal_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size
+
+    @staticmethod
+    def __values(value: Any) -> List[Any]:
+        if isinstance(value, (list, tuple, set)):
+            return [_FileSystemIndex.__hashable(v) for v in value]
+        return [_FileSystemIndex.__hashable(value)]
+
+    @staticmethod
+    def __hashable(value: Any) -> Any:
+        try:
+            hash(value)
+        except TypeError:
+            return json.dumps(value, sort_keys=True, default=str)
+        return value
@@ -0,0 +1,120 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pathlib
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+
+class _FileSystemLayout:
+    """
+    Flat layout of the entity files of a `_FileSystemRepository`: every file lives directly in the
+    entity folder, as `<folder>/<entity_id>.json`.
+    """
+
+    NAME = "flat"
+    _FILE_EXTENSION = ".json"
+
+    def _get_path(self, dir_path: pathlib.Path, entity_id: str) -> pathlib.Path:
+        return dir_path / f"{entity_id}{self._FILE_EXTENSION}"
+
+    def _iter_files(self, dir_path: pathlib.Path) -> Iterator[pathlib.Path]:
+        """Iterate over the entity files. Raise FileNotFoundError if the folder does not exist."""
+        return (f for f in dir_path.iterdir() if self._is_entity_file(f.name))
+
+    @staticmethod
+    def _is_entity_file(name: str) -> bool:
+        """Tell whether a file is an entity file, as opposed to the hidden temporary file of a pending write."""
+        return not name.startswith(".")
+
+    def _folders(self, dir_path: pathlib.Path) -> List[pathlib.Path]:
+        """Return the folders whose modification times change whenever an entity file is added or removed."""
+        return [dir_path]
+
+    def _mtime(self, dir_path: pathlib.Path) -> Optional[int]:
+        """Return the latest modification time of the folders holding entity files, or None if there are none."""
+        try:
+            return max(folder.stat().st_mtime_ns for folder in self._folders(dir_path))
+        except FileNotFoundError:
+            return None
+
+
+class _ShardedFileSystemLayout(_FileSystemLayout):
+    """
+    Hash-sharded layout of the entity files of a `_FileSystemRepository`: every file lives in one of
+    256 sub-folders of the entity folder, named after a hash of the entity id, as
+    `<folder>/<shard>/<entity_id>.json`.
+
+    The path of an entity is still computed from its id alone, and no folder holds so many files that
+    listing it or looking a file up in it slows down.
+    """
+
+    NAME = "sharded"
+
+    def _get_path(self, dir_path: pathlib.Path, entity_id: str) -> pathlib.Path:
+        return dir_path / self._shard(entity_id) / f"{entity_id}{self._FILE_EXTENSION}"
+
+    def _iter_files(self, dir_path: pathlib.Path) -> Iterator[pathlib.Path]:
+        shards = self._folders(dir_path)[1:]
+        for shard in shards:
+            try:
+                yield from (f for f in shard.iterdir() if self._is_entity_file(f.name))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+    def _folders(self, dir_path: pathlib.Path) -> List[pathlib.Path]:
+        return [dir_path, *(dir_path / name for name in sorted(os.listdir(dir_path)) if self._is_shard(name))]
+
+    @staticmethod
+    def _shard(entity_id: str) -> str:
+        return f"{zlib.crc32(entity_id.encode('UTF-8')) & 0xFF:02x}"
+
+    @staticmethod
+    def _is_shard(name: str) -> bool:
+        return len(name) == 2 and all(c in "0123456789abcdef" for c in name)
+
+
+_LAYOUTS: Dict[str, _FileSystemLayout] = {
+    layout.NAME: layout for layout in (_FileSystemLayout(), _ShardedFileSystemLayout())
+}
+
+
+def _get_layout(name: Optional[str]) -> _FileSystemLayout:
+    """Return the layout of the given name, the flat layout being the default one."""
+    return _LAYOUTS.get(name or _FileSystemLayout.NAME, _LAYOUTS[_FileSystemLayout.NAME])
+
+
+def _relocate_files(dir_path: pathlib.Path, layout: _FileSystemLayout) -> int:
+    """
+    Move the entity files of a folder, stored in any layout, to their paths in the given layout.
+
+    Returns:
+        The number of files moved.
+    """
+    files = [f for f in dir_path.iterdir() if f.is_file()]
+    shards = [f for f in dir_path.iterdir() if f.is_dir() and _ShardedFileSystemLayout._is_shard(f.name)]
+    for shard in shards:
+        files.extend(f for f in shard.iterdir() if f.is_file())
+
+    moved = 0
+    for file in files:
+        if file.suffix != _FileSystemLayout._FILE_EXTENSION or file.name.startswith("."):
+            continue
+        if (target := layout._get_path(dir_path, file.stem)) != file:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(file, target)
+            moved += 1
+
+    for shard in shards:
+        if not any(shard.iterdir()):
+            shard.rmdir()
+    return moved
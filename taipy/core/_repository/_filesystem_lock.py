@@ -0,0 +1,104 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pathlib
+import threading
+from contextlib import contextmanager
+from importlib import util
+from typing import Iterator
+
+_FCNTL_AVAILABLE = util.find_spec("fcntl") is not None
+if _FCNTL_AVAILABLE:
+    import fcntl
+
+
+class _FileSystemLock:
+    """
+    Cross-process readers-writer lock over the entity files of a folder, held with `fcntl.flock` on a
+    dedicated lock file.
+
+    Every acquisition opens its own descriptor on the lock file, so that the lock also excludes the
+    other threads of the current process. The lock is not reentrant: it must only be held around file
+    operations, never while acquiring it again. Where fcntl is not available, e.g. on Windows, the lock
+    does nothing and only the atomicity of the writes (see `_write_atomically`) protects the readers.
+
+    Attributes:
+        path (pathlib.Path): The lock file, created on first acquisition.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+
+    @contextmanager
+    def _shared(self) -> Iterator[None]:
+        """Hold the lock along with other readers, excluding the writers."""
+        with self.__acquire(exclusive=False):
+            yield
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold the lock alone, excluding the readers and the other writers."""
+        with self.__acquire(exclusive=True):
+            yield
+
+    @contextmanager
+    def __acquire(self, exclusive: bool) -> Iterator[None]:
+        if not _FCNTL_AVAILABLE:
+            yield
+            return
+        fd = self.__open()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            # Closing the descriptor releases the lock.
+            os.close(fd)
+
+    def __open(self) -> int:
+        try:
+            return os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        except FileNotFoundError:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            return os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+
+
+def _write_atomically(path: pathlib.Path, content: bytes, fsync: bool = False):
+    """
+    Replace the content of a file at once: readers either see the previous content or the new one,
+    never a partially written file.
+
+    The content is written to a hidden temporary file of the same folder, which is then renamed over
+    the target file.
+
+    Parameters:
+        path (pathlib.Path): The file to write.
+        content (bytes): The new content of the file.
+        fsync (bool): If True, the content and the rename are flushed to the disk before returning, so
+            that they survive a system crash.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if fsync and os.name == "posix":
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -10,10 +10,11 @@
 # specific language governing permissions and limitations under the License.
 
 import copy
-import json
 import pathlib
 import shutil
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
 
 from taipy.common.config import Config
 
@@ -21,8 +22,10 @@ from ..common._utils import _retry_repository_operation
 from ..common.typing import Converter, Entity, Json, ModelType
 from ..exceptions import FileCannotBeRead, FileEmpty, ModelNotFound
 from ._abstract_repository import _AbstractRepository
-from ._decoder import _Decoder
-from ._encoder import _Encoder
+from ._filesystem_index import _FileSystemIndex
+from ._filesystem_layout import _FileSystemLayout, _get_layout
+from ._filesystem_lock import _FileSystemLock, _write_atomically
+from ._repository_stats import _measured, _RepositoryStats
 
 
 class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
@@ -37,19 +40,68 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         model_type (ModelType): Generic dataclass.
         converter: A class that handles conversion to and from a database backend
         dir_name (str): Folder that will hold the files for this dataclass model.
+
+    Filtered lookups on the commonly filtered attributes (see `_FileSystemIndex`) only read the files
+    of the matching entities, thanks to a secondary index stored in the `.index` sub-folder of the
+    storage folder.
+
+    The entity files are stored flat in the folder, unless the "filesystem_layout" repository property
+    is set to "sharded" (see `_ShardedFileSystemLayout`).
+
+    Entity files are written atomically, so that readers, including the ones of other processes, never
+    see a partially written file. Writes and deletions hold an exclusive lock on the folder files, and
+    reads of several files hold a shared one, so that they see a consistent set of files (see
+    `_FileSystemLock`). Setting the "filesystem_fsync" repository property to True also flushes every
+    write to the disk.
     """
 
-    __EXCEPTIONS_TO_RETRY = (FileCannotBeRead, FileEmpty)
+    # Files are never read while partially written: only actual read failures are worth a retry.
+    __EXCEPTIONS_TO_RETRY = (FileCannotBeRead,)
+    _INDEX_DIR_NAME = ".index"
+    _LOCK_DIR_NAME = ".locks"
+    _LAYOUT_PROPERTY = "filesystem_layout"
+    _FSYNC_PROPERTY = "filesystem_fsync"
+
+    # A file modified that recently may be modified again within the same filesystem timestamp tick,
+    # without its modification time changing. Its revision cannot be trusted yet.
+    _RACY_REVISION_WINDOW_NS = 100_000_000
+
+    # Reading files is mostly spent waiting for I/O: many files are read by a pool of threads.
+    _PARALLEL_READ_MIN_FILES = 32
+    _PARALLEL_READ_MAX_WORKERS = 8
 
     def __init__(self, model_type: Type[ModelType], converter: Type[Converter], dir_name: str):
         self.model_type = model_type
         self.converter = converter
         self._dir_name = dir_name
+        self.__indexes: Dict[Tuple[pathlib.Path, str], _FileSystemIndex] = {}
 
     @property
     def dir_path(self):
         return self._storage_folder / self._dir_name
 
+    @property
+    def _layout(self) -> _FileSystemLayout:
+        return _get_layout(Config.core.repository_properties.get(self._LAYOUT_PROPERTY))  # type: ignore[arg-type]
+
+    @property
+    def _fsync(self) -> bool:
+        return str(Config.core.repository_properties.get(self._FSYNC_PROPERTY, False)).lower() in ("true", "1")
+
+    @property
+    def _file_lock(self) -> _FileSystemLock:
+        return _FileSystemLock(self._storage_folder / self._LOCK_DIR_NAME / f"{self._dir_name}.lock")
+
+    @property
+    def _index(self) -> _FileSystemIndex:
+        dir_path, layout = self.dir_path, self._layout
+        if (index := self.__indexes.get((dir_path, layout.NAME))) is None:
+            journal_path = self._storage_folder / self._INDEX_DIR_NAME / f"{self._dir_name}.idx"
+            index = self.__indexes.setdefault(
+                (dir_path, layout.NAME), _FileSystemIndex(dir_path, journal_path, self.__load_dict, layout)
+            )
+        return index
+
     @property
     def _storage_folder(self) -> pathlib.Path:
         return pathlib.Path(Config.core.taipy_storage_folder)
@@ -58,17 +110,33 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     # ##   Inherited methods   ## #
     ###############################
 
+    @_measured("save")
     def _save(self, entity: Entity):
-        self.__create_directory_if_not_exists()
         model = self.converter._entity_to_model(entity)  # type: ignore
-        self.__get_path(model.id).write_text(
-            json.dumps(model.to_dict(), ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
-            encoding="UTF-8",
-        )
-
+        model_dict = model.to_dict()
+        path = self.__get_path(model.id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        content = self._serializer._dumps(model_dict, indent=0)
+        _RepositoryStats._add(bytes_written=len(content))
+        self._index._update(model.id, model_dict, lambda: self._write_file(path, content))
+
+    @_measured("exists")
     def _exists(self, entity_id: str) -> bool:
         return self.__get_path(entity_id).exists()
 
+    def _revision(self, entity_id: str) -> Optional[Hashable]:
+        try:
+            stat = self.__get_path(entity_id).stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if time.time_ns() - stat.st_mtime_ns < self._RACY_REVISION_WINDOW_NS:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _list_ids(self) -> Optional[Set[str]]:
+        return self._index._get_ids()
+
+    @_measured("load")
     def _load(self, entity_id: str) -> Entity:
         path = pathlib.Path(self.__get_path(entity_id))
 
@@ -76,47 +144,60 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
             file_content = self.__read_file(path)
         except (FileNotFoundError, FileCannotBeRead, FileEmpty):
             raise ModelNotFound(str(self.dir_path), entity_id) from None
+        _RepositoryStats._add(bytes_read=len(file_content), files_scanned=1)
 
         return self.__file_content_to_entity(file_content)
 
+    @_measured("load_many")
+    def _load_many(self, entity_ids: Iterable[str]) -> Dict[str, Entity]:
+        files = [self.__get_path(entity_id) for entity_id in dict.fromkeys(entity_ids)]
+        return {entity.id: entity for entity in self.__to_entities(files, None)}  # type: ignore
+
+    @_measured("load_all")
     def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
-        entities = []
         try:
-            for f in self.dir_path.iterdir():
-                if data := self.__filter_by(f, filters):
-                    entities.append(self.__file_content_to_entity(data))
+            files = list(self.__find_files(filters))
         except FileNotFoundError:
-            pass
-        return entities
+            return []
+        return self.__to_entities(files, filters)
 
+    @_measured("delete")
     def _delete(self, entity_id: str):
         try:
-            self.__get_path(entity_id).unlink()
+            self._index._remove(entity_id, lambda: self.__delete_file(self.__get_path(entity_id)))
         except FileNotFoundError:
             raise ModelNotFound(str(self.dir_path), entity_id) from None
 
+    @_measured("delete_all")
     def _delete_all(self):
         shutil.rmtree(self.dir_path, ignore_errors=True)
+        self._index._clear()
 
+    @_measured("delete_many")
     def _delete_many(self, ids: Iterable[str]):
         for model_id in ids:
             self._delete(model_id)
 
+    @_measured("delete_by")
     def _delete_by(self, attribute: str, value: str):
-        filters: List[Dict] = [{}]
-        for fil in filters:
-            fil.update({attribute: value})
+        filters: List[Dict] = [{attribute: value}]
 
         try:
-            for f in self.dir_path.iterdir():
-                if self.__filter_by(f, filters):
-                    f.unlink()
+            files = list(self.__find_files(filters))
         except FileNotFoundError:
-            pass
+            return
+        # Deleting a version only reads the files the index lists for it, and deletes them in one go.
+        matching = [f for f, content in zip(files, self.__filter_files(files, filters)) if content]
+        self._index._remove_many([f.stem for f in matching], lambda: self.__delete_files(matching))
 
+    @_measured("search")
     def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        if attribute in _FileSystemIndex._INDEXED_FIELDS and isinstance(value, str):
+            # Narrow the files to read down to the ones holding the searched value.
+            filters = [{**fil, attribute: value} for fil in (filters or [{}])]
         return list(self.__search(attribute, value, filters))
 
+    @_measured("export")
     def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]) -> None:
         if isinstance(folder_path, str):
             folder: pathlib.Path = pathlib.Path(folder_path)
@@ -134,6 +215,7 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     ###########################################
     # ##   Specific or optimized methods   ## #
     ###########################################
+    @_measured("get_by_configs_and_owner_ids")
     def _get_by_configs_and_owner_ids(self, configs_and_owner_ids, filters: Optional[List[Dict]] = None):
         # Design in order to optimize performance on Entity creation.
         # Maintainability and readability were impacted.
@@ -142,8 +224,12 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         res = {}
         configs_and_owner_ids = set(configs_and_owner_ids)
 
+        if _FileSystemIndex._is_indexable([{**fil, "config_id": "", "owner_id": None} for fil in filters]):
+            return self.__get_by_configs_and_owner_ids_from_index(configs_and_owner_ids, filters)
+
         try:
-            for f in self.dir_path.iterdir():
+            _RepositoryStats._add(full_scan_filters=filters)
+            for f in self._layout._iter_files(self.dir_path):
                 config_id, owner_id, entity = self.__match_file_and_get_entity(
                     f, configs_and_owner_ids, copy.deepcopy(filters)
                 )
@@ -161,6 +247,7 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
 
         return res
 
+    @_measured("get_by_config_and_owner_id")
     def _get_by_config_and_owner_id(
         self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
     ) -> Optional[Entity]:
@@ -171,15 +258,44 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
                 fil.update({"owner_id": owner_id})
         return self.__filter_files_by_config_and_owner_id(config_id, owner_id, filters)
 
+    def _write_file(self, path: pathlib.Path, content: bytes):
+        """Atomically write a file of the repository, excluding the other readers and writers."""
+        with self._file_lock._exclusive():
+            _write_atomically(path, content, self._fsync)
+
     #############################
     # ##   Private methods   ## #
     #############################
 
+    def __delete_file(self, path: pathlib.Path):
+        with self._file_lock._exclusive():
+            path.unlink()
+
+    def __delete_files(self, paths: List[pathlib.Path]):
+        with self._file_lock._exclusive():
+            for path in paths:
+                path.unlink(missing_ok=True)
+
+    def __get_by_configs_and_owner_ids_from_index(self, configs_and_owner_ids, filters: List[Dict]):
+        res = {}
+        for config, owner_id in configs_and_owner_ids:
+            key_filters = [{**fil, "config_id": config.id, "owner_id": owner_id} for fil in filters]
+            for f in self.__find_files(key_filters):
+                if data := self.__filter_by(f, key_filters):
+                    res[config, owner_id] = self.__file_content_to_entity(data)
+                    break
+        return res
+
     def __filter_files_by_config_and_owner_id(
         self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
     ):
+        index_filters = [{**fil, "config_id": config_id, "owner_id": owner_id} for fil in filters or [{}]]
         try:
-            files = filter(lambda f: config_id in f.name, self.dir_path.iterdir())
+            if (ids := self._index._get_candidates(index_filters)) is not None:
+                files: Iterable[pathlib.Path] = (self.__get_path(entity_id) for entity_id in ids)
+            else:
+                _RepositoryStats._add(full_scan_filters=index_filters)
+                files = filter(lambda f: config_id in f.name, self._layout._iter_files(self.dir_path))
             entities = (self.__file_content_to_entity(self.__filter_by(f, filters)) for f in files)
             corresponding_entities = filter(
                 lambda e: e is not None and e.config_id == config_id and e.owner_id == owner_id,  # type: ignore
@@ -201,50 +317,87 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
 
         return None, None, None
 
-    def __create_directory_if_not_exists(self):
-        self.dir_path.mkdir(parents=True, exist_ok=True)
+    def __find_files(self, filters: Optional[List[Dict]]) -> Iterable[pathlib.Path]:
+        """Return the files that may match the filters, using the index whenever possible."""
+        if (ids := self._index._get_candidates(filters)) is not None:
+            return (self.__get_path(entity_id) for entity_id in ids)
+        _RepositoryStats._add(full_scan_filters=filters or [])
+        return self._layout._iter_files(self.dir_path)
 
     def __search(self, attribute: str, value: str, filters: Optional[List[Dict]] = None) -> Iterator[Entity]:
         return filter(lambda e: getattr(e, attribute, None) == value, self._load_all(filters))
 
     def __get_path(self, model_id) -> pathlib.Path:
-        return self.dir_path / f"{model_id}.json"
+        return self._layout._get_path(self.dir_path, model_id)
 
     def __file_content_to_entity(self, file_content):
         if not file_content:
             return None
         if isinstance(file_content, str):
-            file_content = json.loads(file_content, cls=_Decoder)
+            file_content = self._serializer._loads(file_content)
         model = self.model_type.from_dict(file_content)
         return self.converter._model_to_entity(model)
 
+    def __to_entities(self, files: List[pathlib.Path], filters: Optional[List[Dict]]) -> List[Entity]:
+        contents = self.__filter_files(files, filters)
+        models = [self.model_type.from_dict(content) for content in contents if content]  # type: ignore
+        return self.converter._models_to_entities(models)  # type: ignore
+
+    def __filter_files(self, files: List[pathlib.Path], filters: Optional[List[Dict]]) -> List[Optional[Json]]:
+        """Read several files at once, in parallel if there are many of them, and filter them."""
+        with self._file_lock._shared():
+            if len(files) < self._PARALLEL_READ_MIN_FILES:
+                contents = [self.__read_content(f) for f in files]
+            else:
+                with ThreadPoolExecutor(max_workers=self._PARALLEL_READ_MAX_WORKERS) as executor:
+                    contents = list(executor.map(self.__read_content, files))
+        _RepositoryStats._add(bytes_read=sum(len(c) for c in contents if c), files_scanned=len(files))
+        return [self.__filter_content(content, filters) for content in contents]
+
     def __filter_by(self, filepath: pathlib.Path, filters: Optional[List[Dict]]) -> Optional[Json]:
+        content = self.__read_content(filepath)
+        _RepositoryStats._add(bytes_read=len(content or ""), files_scanned=1)
+        return self.__filter_content(content, filters)
+
+    def __filter_content(self, file_content: Optional[str], filters: Optional[List[Dict]]) -> Optional[Json]:
+        if file_content is None:
+            return None
         if not filters:
             filters = [{}]
 
+        for _filter in filters:
+            if all(self.__may_contain(file_content, key, value) for key, value in _filter.items()):
+                return self._serializer._loads(file_content)
+        return None
+
+    @staticmethod
+    def __may_contain(file_content: str, key: str, value: Any) -> bool:
+        """Tell whether a file content may hold a key and a value, whatever the serializer that wrote it."""
+        encoded_value = f'"{value}"' if value is not None else "null"
+        return f'"{key}": {encoded_value}' in file_content or f'"{key}":{encoded_value}' in file_content
+
+    def __load_dict(self, filepath: pathlib.Path) -> Optional[Dict]:
         try:
-            file_content = self.__read_file(filepath)
-        except (FileNotFoundError, FileCannotBeRead, FileEmpty):
+            with filepath.open("r", encoding="UTF-8") as f:
+                return self._serializer._loads(f.read())
+        except (OSError, ValueError):
             return None
 
-        for _filter in filters:
-            conditions = [
-                f'"{key}": "{value}"' if value is not None else f'"{key}": null' for key, value in _filter.items()
-            ]
-            if all(condition in file_content for condition in conditions):
-                return json.loads(file_content, cls=_Decoder)
-        return None
+    def __read_content(self, filepath: pathlib.Path) -> Optional[str]:
+        try:
+            return self.__read_file(filepath)
+        except (FileNotFoundError, FileCannotBeRead, FileEmpty):
+            return None
 
     @_retry_repository_operation(__EXCEPTIONS_TO_RETRY)
     def __read_file(self, filepath: pathlib.Path) -> str:
-        if not filepath.is_file():
-            raise FileNotFoundError
-
         try:
             with filepath.open("r", encoding="UTF-8") as f:
                 file_content = f.read()
-            if not file_content:
-                raise FileEmpty(str(filepath))
-            return file_content
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            raise FileNotFoundError(str(filepath)) from None
         except Exception:
             raise FileCannotBeRead(str(filepath)) from None
+        if not file_content:
+            raise FileEmpty(str(filepath))
+        return file_content
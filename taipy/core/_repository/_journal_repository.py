@@ -0,0 +1,317 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import copy
+import itertools
+import os
+import pathlib
+import shutil
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Type, Union
+
+from taipy.common.config import Config
+
+from ..common.typing import Converter, Entity, ModelType
+from ..exceptions import ModelNotFound
+from ._abstract_repository import _AbstractRepository
+from ._filesystem_lock import _FileSystemLock
+
+
+class _JournalRepository(_AbstractRepository[ModelType, Entity]):
+    """
+    Holds common methods to be used and extended when the need for saving frequently updated
+    dataclasses in an append-only journal emerges.
+
+    Every save appends a single JSON line to the active segment file of the journal folder, only
+    holding the attributes that changed since the entity was last saved. The current state of the
+    entities is kept in memory. It is replayed from the segments when the repository is first used,
+    and refreshed from the records other processes appended before every operation. Records hold
+    absolute values so that replaying a record twice is harmless.
+
+    Once the journal holds many more records than entities, it is compacted into a new segment
+    holding one record per entity, and the previous segments are removed.
+
+    Appends and compactions hold an exclusive lock on the journal, and refreshes a shared one (see
+    `_FileSystemLock`), so that no process appends to a segment another one is compacting.
+
+    Attributes:
+        model_type (ModelType): Generic dataclass.
+        converter: A class that handles conversion to and from a database backend
+        dir_name (str): Folder of the journal directory that will hold the segments of this dataclass model.
+    """
+
+    _JOURNAL_DIR_NAME = "journal"
+    _SEGMENT_PREFIX = "segment-"
+    _SEGMENT_EXTENSION = ".log"
+    _COMPACTION_THRESHOLD = 1_000
+
+    def __init__(self, model_type: Type[ModelType], converter: Type[Converter], dir_name: str):
+        self.model_type = model_type
+        self.converter = converter
+        self._dir_name = dir_name
+        self._lock = threading.RLock()
+        # Revisions are never reused, even across replays, so that a cached entity is never mistaken for another.
+        self.__revision_counter = itertools.count()
+        self.__reset()
+
+    @property
+    def dir_path(self) -> pathlib.Path:
+        return self._storage_folder / self._JOURNAL_DIR_NAME / self._dir_name
+
+    @property
+    def _storage_folder(self) -> pathlib.Path:
+        return pathlib.Path(Config.core.taipy_storage_folder)
+
+    @property
+    def _file_lock(self) -> _FileSystemLock:
+        # Outside of the journal folder, which is removed when all the entities are deleted.
+        return _FileSystemLock(self._storage_folder / self._JOURNAL_DIR_NAME / f".{self._dir_name}.lock")
+
+    ###############################
+    # ##   Inherited methods   ## #
+    ###############################
+
+    def _save(self, entity: Entity):
+        self._save_many([entity])
+
+    def _save_many(self, entities: Iterable[Entity]):
+        """Append the changes of several entities to the journal at once."""
+        with self._lock, self._file_lock._exclusive():
+            self.__refresh()
+            records = []
+            for entity in entities:
+                model_dict = self.converter._entity_to_model(entity).to_dict()  # type: ignore
+                if (record := self.__changes(model_dict)) is not None:
+                    records.append(record)
+            self.__append(records)
+
+    def _exists(self, entity_id: str) -> bool:
+        with self._lock, self._file_lock._shared():
+            self.__refresh()
+            return entity_id in self.__documents
+
+    def _revision(self, entity_id: str) -> Optional[Hashable]:
+        with self._lock, self._file_lock._shared():
+            self.__refresh()
+            return self.__revisions.get(entity_id)
+
+    def _list_ids(self) -> Optional[Set[str]]:
+        with self._lock, self._file_lock._shared():
+            self.__refresh()
+            return set(self.__documents)
+
+    def _load(self, entity_id: str) -> Entity:
+        with self._lock, self._file_lock._shared():
+            self.__refresh()
+            if (document := self.__documents.get(entity_id)) is None:
+                raise ModelNotFound(str(self.dir_path), entity_id)
+            model = self.model_type.from_dict(copy.deepcopy(document))  # type: ignore[attr-defined]
+        return self.converter._model_to_entity(model)  # type: ignore[attr-defined]
+
+    def _load_many(self, entity_ids: Iterable[str]) -> Dict[str, Entity]:
+        with self._lock, self._file_lock._shared():
+            self.__refresh()
+            documents = [self.__documents[i] for i in dict.fromkeys(entity_ids) if i in self.__documents]
+        entities = self.__to_entities(documents)
+        return {entity.id: entity for entity in entities}  # type: ignore[attr-defined]
+
+    def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        with self._lock, self._file_lock._shared():
+            self.__refresh()
+            documents = [document for document in self.__documents.values() if self.__match(document, filters)]
+        return self.__to_entities(documents)
+
+    def _delete(self, entity_id: str):
+        with self._lock, self._file_lock._exclusive():
+            self.__refresh()
+            if entity_id not in self.__documents:
+                raise ModelNotFound(str(self.dir_path), entity_id)
+            self.__append([{"id": entity_id, "deleted": True}])
+
+    def _delete_all(self):
+        with self._lock, self._file_lock._exclusive():
+            shutil.rmtree(self.dir_path, ignore_errors=True)
+            self.__reset()
+
+    def _delete_many(self, ids: Iterable[str]):
+        with self._lock, self._file_lock._exclusive():
+            self.__refresh()
+            self.__append([{"id": entity_id, "deleted": True} for entity_id in ids if entity_id in self.__documents])
+
+    def _delete_by(self, attribute: str, value: str):
+        with self._lock, self._file_lock._exclusive():
+            self.__refresh()
+            self.__append(
+                [
+                    {"id": entity_id, "deleted": True}
+                    for entity_id, document in self.__documents.items()
+                    if document.get(attribute) == value
+                ]
+            )
+
+    def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        return [entity for entity in self._load_all(filters) if getattr(entity, attribute, None) == value]
+
+    def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]) -> None:
+        if isinstance(folder_path, str):
+            folder: pathlib.Path = pathlib.Path(folder_path)
+        else:
+            folder = folder_path
+
+        export_dir = folder / self._dir_name
+        if not export_dir.exists():
+            export_dir.mkdir(parents=True)
+
+        with self._lock, self._file_lock._shared():
+            self.__refresh()
+            if (document := self.__documents.get(entity_id)) is None:
+                raise ModelNotFound(str(self.dir_path), entity_id)
+            content = self._serializer._dumps(document, indent=0)
+        (export_dir / f"{entity_id}.json").write_bytes(content)
+
+    #############################
+    # ##   Private methods   ## #
+    #############################
+
+    def __reset(self):
+        self.__documents: Dict[str, Dict[str, Any]] = {}
+        self.__revisions: Dict[str, int] = {}
+        # The journal folder, its segment names and the inode of the active one, as of the last read.
+        self.__state: Optional[Tuple[pathlib.Path, Tuple[str, ...], int]] = None
+        self.__offset = 0
+        self.__nb_records = 0
+
+    def __changes(self, model_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the record saving the model, or None if it is unchanged."""
+        entity_id = model_dict["id"]
+        if (document := self.__documents.get(entity_id)) is None or document.keys() != model_dict.keys():
+            return {"id": entity_id, "model": model_dict}
+        if changes := {key: value for key, value in model_dict.items() if document[key] != value}:
+            return {"id": entity_id, "set": changes}
+        return None
+
+    def __apply(self, record: Dict[str, Any]):
+        self.__nb_records += 1
+        entity_id = record["id"]
+        if record.get("deleted"):
+            self.__documents.pop(entity_id, None)
+            self.__revisions.pop(entity_id, None)
+            return
+        if "model" in record:
+            self.__documents[entity_id] = record["model"]
+        elif (document := self.__documents.get(entity_id)) is not None:
+            document.update(record["set"])
+        else:
+            # The entity was deleted in the meantime by another process.
+            return
+        self.__revisions[entity_id] = next(self.__revision_counter)
+
+    def __append(self, records: List[Dict[str, Any]]):
+        """Append records to the active segment, with the exclusive lock held since the journal was refreshed."""
+        if not records:
+            return
+        serializer = self._serializer
+        lines = b"".join(serializer._dumps(record) + b"\n" for record in records)
+        dir_path = self.dir_path
+        dir_path.mkdir(parents=True, exist_ok=True)
+        segments = self.__state[1] if self.__state else (self.__segment_name(1),)
+        with (dir_path / segments[-1]).open("ab") as segment:
+            segment.write(lines)
+            end = segment.tell()
+            inode = os.fstat(segment.fileno()).st_ino
+
+        for record in records:
+            self.__apply(record)
+        if (self.__state is None or self.__state[2] == inode) and end == self.__offset + len(lines):
+            # Nobody else appended in between, which the lock only ensures where fcntl is available.
+            self.__state = (dir_path, segments, inode)
+            self.__offset = end
+
+        if self.__nb_records > 2 * len(self.__documents) + self._COMPACTION_THRESHOLD:
+            self.__compact()
+
+    def __refresh(self):
+        """Replay the records appended to the journal since it was last read, with the lock held."""
+        dir_path = self.dir_path
+        segments = self.__list_segments(dir_path)
+        try:
+            state = (dir_path, segments, (dir_path / segments[-1]).stat().st_ino) if segments else None
+        except FileNotFoundError:
+            # The journal was deleted by another process, which the lock does not prevent without fcntl.
+            state = None
+        if state is None:
+            if self.__state is not None:
+                self.__reset()
+            return
+        if state != self.__state:
+            self.__reset()
+            for name in segments:
+                self.__offset = self.__replay(dir_path / name, 0)
+            self.__state = state
+        else:
+            self.__offset = self.__replay(dir_path / segments[-1], self.__offset)
+
+    def __replay(self, path: pathlib.Path, offset: int) -> int:
+        try:
+            with path.open("rb") as segment:
+                segment.seek(offset)
+                content = segment.read()
+        except FileNotFoundError:
+            return offset
+
+        # Only consume complete lines: a concurrent writer may be appending the last one.
+        complete_content = content[: content.rfind(b"\n") + 1]
+        serializer = self._serializer
+        for line in complete_content.splitlines():
+            try:
+                self.__apply(serializer._loads(line))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+        return offset + len(complete_content)
+
+    def __compact(self):
+        dir_path, segments, _ = self.__state  # type: ignore[misc]
+        records = [{"id": entity_id, "model": document} for entity_id, document in self.__documents.items()]
+        name = self.__segment_name(self.__segment_number(segments[-1]) + 1)
+        tmp_path = dir_path / f".{name}.{os.getpid()}.tmp"
+        serializer = self._serializer
+        content = b"".join(serializer._dumps(record) + b"\n" for record in records)
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, dir_path / name)
+        for previous_name in segments:
+            (dir_path / previous_name).unlink(missing_ok=True)
+        self.__state = (dir_path, (name,), (dir_path / name).stat().st_ino)
+        self.__offset = len(content)
+        self.__nb_records = len(records)
+
+    def __list_segments(self, dir_path: pathlib.Path) -> Tuple[str, ...]:
+        try:
+            names = os.listdir(dir_path)
+        except FileNotFoundError:
+            return ()
+        segments = (n for n in names if n.startswith(self._SEGMENT_PREFIX) and n.endswith(self._SEGMENT_EXTENSION))
+        return tuple(sorted(segments, key=self.__segment_number))
+
+    def __segment_name(self, number: int) -> str:
+        return f"{self._SEGMENT_PREFIX}{number:08d}{self._SEGMENT_EXTENSION}"
+
+    def __segment_number(self, name: str) -> int:
+        return int(name[len(self._SEGMENT_PREFIX) : -len(self._SEGMENT_EXTENSION)])
+
+    def __to_entities(self, documents: List[Dict[str, Any]]) -> List[Entity]:
+        models = [self.model_type.from_dict(copy.deepcopy(document)) for document in documents]  # type: ignore
+        return self.converter._models_to_entities(models)  # type: ignore[attr-defined]
+
+    @staticmethod
+    def __match(document: Dict[str, Any], filters: Optional[List[Dict]]) -> bool:
+        if not filters:
+            return True
+        return any(all(document.get(key) == value for key, value in _filter.items()) for _filter in filters)
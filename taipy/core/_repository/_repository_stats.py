@@ -0,0 +1,182 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import atexit
+import functools
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from taipy.common.config import Config
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+
+class _OperationStats:
+    """Statistics of one kind of operation of a repository."""
+
+    def __init__(self, nb_buckets: int = 0):
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.files_scanned = 0
+        self.full_scans = 0
+        self.full_scan_filters: Counter = Counter()
+        self.latency_histogram = [0] * nb_buckets
+
+    def _merge(self, other: "_OperationStats"):
+        self.bytes_read += other.bytes_read
+        self.bytes_written += other.bytes_written
+        self.files_scanned += other.files_scanned
+        self.full_scans += other.full_scans
+        self.full_scan_filters.update(other.full_scan_filters)
+
+
+class _RepositoryStats:
+    """
+    Opt-in collector of statistics on the operations of the filesystem repositories.
+
+    The collection is enabled by setting the "collect_stats" repository property to True. Every
+    measured operation then records, per entity folder and per operation, its number of calls, its
+    latency, the size of the contents it read and wrote, the number of files it read, and the number
+    of times it listed the whole entity folder along with the filters that caused it. An operation
+    calling other measured operations is accounted for once, by the outermost one.
+
+    The statistics are logged when the process exits.
+    """
+
+    _ENABLED_PROPERTY = "collect_stats"
+    _LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1_000, 5_000)
+
+    __lock = threading.Lock()
+    __local = threading.local()
+    __stats: Dict[Tuple[str, str], _OperationStats] = {}
+    __dump_registered = False
+    __logger = _TaipyLogger._get_logger()
+
+    @classmethod
+    def _is_enabled(cls) -> bool:
+        return str(Config.core.repository_properties.get(cls._ENABLED_PROPERTY, False)).lower() in ("true", "1")
+
+    @classmethod
+    @contextmanager
+    def _measure(cls, entity_type: str, operation: str) -> Iterator[None]:
+        """Measure an operation, unless the collection is disabled or another operation is being measured."""
+        if getattr(cls.__local, "current", None) is not None or not cls._is_enabled():
+            yield
+            return
+
+        current = cls.__local.current = _OperationStats()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            cls.__local.current = None
+            cls.__record(entity_type, operation, current, elapsed)
+
+    @classmethod
+    def _add(
+        cls,
+        bytes_read: int = 0,
+        bytes_written: int = 0,
+        files_scanned: int = 0,
+        full_scan_filters: Optional[List[Dict]] = None,
+    ):
+        """Account for some work in the operation being measured by the current thread, if any."""
+        if (current := getattr(cls.__local, "current", None)) is None:
+            return
+        current.bytes_read += bytes_read
+        current.bytes_written += bytes_written
+        current.files_scanned += files_scanned
+        if full_scan_filters is not None:
+            current.full_scans += 1
+            current.full_scan_filters[cls.__describe_filters(full_scan_filters)] += 1
+
+    @classmethod
+    def _get(cls, reset: bool = False) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Return the statistics, by entity folder and operation."""
+        with cls.__lock:
+            res: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            for (entity_type, operation), stats in sorted(cls.__stats.items()):
+                res.setdefault(entity_type, {})[operation] = cls.__to_dict(stats)
+            if reset:
+                cls.__stats.clear()
+        return res
+
+    @classmethod
+    def _reset(cls):
+        with cls.__lock:
+            cls.__stats.clear()
+
+    @classmethod
+    def _dump(cls):
+        if stats := cls._get():
+            cls.__logger.info(f"Repository statistics: {json.dumps(stats, indent=2)}")
+
+    @classmethod
+    def __record(cls, entity_type: str, operation: str, current: _OperationStats, elapsed: float):
+        bucket = next(
+            (i for i, limit in enumerate(cls._LATENCY_BUCKETS_MS) if elapsed * 1_000 <= limit),
+            len(cls._LATENCY_BUCKETS_MS),
+        )
+        with cls.__lock:
+            if (stats := cls.__stats.get((entity_type, operation))) is None:
+                stats = cls.__stats[entity_type, operation] = _OperationStats(len(cls._LATENCY_BUCKETS_MS) + 1)
+            stats.count += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            stats.latency_histogram[bucket] += 1
+            stats._merge(current)
+            if not cls.__dump_registered:
+                atexit.register(cls._dump)
+                cls.__dump_registered = True
+
+    @classmethod
+    def __to_dict(cls, stats: _OperationStats) -> Dict[str, Any]:
+        labels = [f"<={limit}ms" for limit in cls._LATENCY_BUCKETS_MS] + [f">{cls._LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": stats.count,
+            "total_time": stats.total_time,
+            "mean_time": stats.total_time / stats.count if stats.count else 0.0,
+            "max_time": stats.max_time,
+            "bytes_read": stats.bytes_read,
+            "bytes_written": stats.bytes_written,
+            "files_scanned": stats.files_scanned,
+            "full_scans": stats.full_scans,
+            "full_scan_filters": dict(stats.full_scan_filters),
+            "latency_histogram": dict(zip(labels, stats.latency_histogram)),
+        }
+
+    @staticmethod
+    def __describe_filters(filters: List[Dict]) -> str:
+        keys = sorted({key for _filter in filters or [] for key in _filter})
+        return ", ".join(keys) if keys else "<no filter>"
+
+
+def _measured(operation: str):
+    """Measure the decorated repository method as the given operation (see `_RepositoryStats`)."""
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _RepositoryStats._is_enabled():
+                return method(self, *args, **kwargs)
+            with _RepositoryStats._measure(self._dir_name, operation):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
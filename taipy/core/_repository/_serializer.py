@@ -0,0 +1,104 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+from datetime import datetime, timedelta
+from importlib import util
+from typing import Any, Dict, Optional, Set, Union
+
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from ._decoder import _Decoder
+from ._encoder import _Encoder
+
+if util.find_spec("orjson"):
+    import orjson
+
+
+class _Serializer:
+    """
+    Codec of the repository models, based on the standard json module along with `_Encoder` and
+    `_Decoder`.
+
+    All the serializers produce and read the same JSON documents, datetimes and timedeltas being
+    encoded as `{"__type__": ..., "__value__": ...}` objects, so that entities written by one of them
+    can be read by any other.
+    """
+
+    NAME = "json"
+
+    def _dumps(self, obj: Any, indent: Optional[int] = None) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON. The output is a single line unless indent is set."""
+        return json.dumps(obj, ensure_ascii=False, indent=indent, cls=_Encoder, check_circular=False).encode("UTF-8")
+
+    def _loads(self, content: Union[str, bytes]) -> Any:
+        return json.loads(content, cls=_Decoder)
+
+
+class _OrjsonSerializer(_Serializer):
+    """
+    Codec of the repository models based on the orjson package.
+
+    The output is compact JSON whatever the indent. Objects that orjson cannot serialize, like integers
+    that do not fit in 64 bits or dictionaries with non-string keys, are serialized by the standard json
+    module instead.
+    """
+
+    NAME = "orjson"
+    _TYPE_KEY = "__type__"
+
+    def _dumps(self, obj: Any, indent: Optional[int] = None) -> bytes:
+        try:
+            return orjson.dumps(obj, default=self.__default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError:
+            return super()._dumps(obj, indent)
+
+    def _loads(self, content: Union[str, bytes]) -> Any:
+        obj = orjson.loads(content)
+        marker = self._TYPE_KEY if isinstance(content, str) else self._TYPE_KEY.encode()
+        if marker in content:  # type: ignore[operator]
+            return self.__decode_types(obj)
+        return obj
+
+    @staticmethod
+    def __default(o: Any):
+        if isinstance(o, (datetime, timedelta)):
+            return _ENCODER.default(o)
+        raise TypeError
+
+    @classmethod
+    def __decode_types(cls, obj: Any) -> Any:
+        if isinstance(obj, dict):
+            obj = {key: cls.__decode_types(value) for key, value in obj.items()}
+            return _DECODER.object_hook(obj) if cls._TYPE_KEY in obj else obj
+        if isinstance(obj, list):
+            return [cls.__decode_types(value) for value in obj]
+        return obj
+
+
+_ENCODER = _Encoder()
+_DECODER = _Decoder()
+_SERIALIZERS: Dict[str, _Serializer] = {_Serializer.NAME: _Serializer()}
+if util.find_spec("orjson"):
+    _SERIALIZERS[_OrjsonSerializer.NAME] = _OrjsonSerializer()
+_SERIALIZER_NAMES = (_Serializer.NAME, _OrjsonSerializer.NAME)
+__logger = _TaipyLogger._get_logger()
+__missing_serializers_warned: Set[str] = set()
+
+
+def _get_serializer(name: Optional[str]) -> _Serializer:
+    """Return the serializer of the given name, falling back on the standard json one if it is unavailable."""
+    if (serializer := _SERIALIZERS.get(name or _Serializer.NAME)) is not None:
+        return serializer
+    if name in _SERIALIZER_NAMES and name not in __missing_serializers_warned:
+        __missing_serializers_warned.add(name)
+        __logger.warning(f"The {name} package is not installed. The json serializer is used instead.")
+    return _SERIALIZERS[_Serializer.NAME]
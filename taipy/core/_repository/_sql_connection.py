@@ -0,0 +1,83 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pathlib
+import sqlite3
+import threading
+from typing import Callable, Dict, Set, Tuple
+
+from taipy.common.config import Config
+
+
+class _SQLConnection:
+    """
+    Holds the SQLite connections shared by all the SQL repositories.
+
+    A single connection is opened per database file and per process, so that forked processes never reuse
+    the connection of their parent. The database runs in WAL mode: readers do not block the writer and
+    the writer does not block readers. Since the connection is shared between threads, any use of it
+    must be done while holding `_lock`.
+
+    The database file is given by the `db_location` repository property of the core section. It defaults
+    to a `taipy.sqlite3` file in the Taipy storage folder.
+    """
+
+    _DB_LOCATION_KEY = "db_location"
+    _DEFAULT_DB_FILE_NAME = "taipy.sqlite3"
+    _BUSY_TIMEOUT = 30
+
+    _lock = threading.RLock()
+    __connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+    __initialized_tables: Dict[Tuple[int, str], Set[str]] = {}
+
+    @classmethod
+    def _db_location(cls) -> str:
+        if db_location := Config.core.repository_properties.get(cls._DB_LOCATION_KEY):
+            return str(db_location)
+        return os.path.join(Config.core.taipy_storage_folder, cls._DEFAULT_DB_FILE_NAME)
+
+    @classmethod
+    def _get_connection(
+        cls, table_name: str, create_tables: Callable[[sqlite3.Connection], None]
+    ) -> sqlite3.Connection:
+        """Return the connection to the current database, creating the tables of the caller if needed."""
+        key = (os.getpid(), cls._db_location())
+        with cls._lock:
+            if (connection := cls.__connections.get(key)) is None:
+                connection = cls.__connect(key[1])
+                cls.__connections[key] = connection
+                cls.__initialized_tables[key] = set()
+            if table_name not in cls.__initialized_tables[key]:
+                create_tables(connection)
+                cls.__initialized_tables[key].add(table_name)
+            return connection
+
+    @classmethod
+    def _close_all(cls):
+        with cls._lock:
+            pid = os.getpid()
+            for (connection_pid, _), connection in cls.__connections.items():
+                if connection_pid == pid:
+                    connection.close()
+            cls.__connections.clear()
+            cls.__initialized_tables.clear()
+
+    @classmethod
+    def __connect(cls, db_location: str) -> sqlite3.Connection:
+        pathlib.Path(db_location).parent.mkdir(parents=True, exist_ok=True)
+        # Statements are auto-committed. Multi-statement writes open their own transaction.
+        connection = sqlite3.connect(
+            db_location, timeout=cls._BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
@@ -0,0 +1,265 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import pathlib
+import sqlite3
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+
+from ..common.typing import Converter, Entity, ModelType
+from ..exceptions import ModelNotFound
+from ._abstract_repository import _AbstractRepository
+from ._sql_connection import _SQLConnection
+
+
+class _SQLRepository(_AbstractRepository[ModelType, Entity]):
+    """
+    Holds common methods to be used and extended when the need for saving
+    dataclasses in a local SQLite database emerges.
+
+    Each model is stored as a JSON document in its own table. The commonly filtered attributes
+    (see `_INDEXED_COLUMNS`) are also stored in indexed columns so that filtered lookups run as
+    indexed queries. Filters on other attributes are evaluated on the JSON document. Every save
+    also stores a new random revision token, used to tell whether an entity changed.
+
+    Attributes:
+        model_type (ModelType): Generic dataclass.
+        converter: A class that handles conversion to and from a database backend
+        table_name (str): Table that will hold the rows for this dataclass model. It is also the name
+            of the folder entities are exported to, so that exports match the filesystem repository ones.
+    """
+
+    _INDEXED_COLUMNS = ("config_id", "owner_id", "version", "entity_id")
+
+    # Keep the number of bound parameters of a query well below the SQLite limit.
+    _MAX_BATCH_SIZE = 500
+
+    def __init__(self, model_type: Type[ModelType], converter: Type[Converter], table_name: str):
+        self.model_type = model_type
+        self.converter = converter
+        self.table_name = table_name
+
+    ###############################
+    # ##   Inherited methods   ## #
+    ###############################
+
+    def _save(self, entity: Entity):
+        self._save_many([entity])
+
+    def _save_many(self, entities: Iterable[Entity]):
+        """Upsert several entities at once, in a single transaction."""
+        rows = [self.__entity_to_row(entity) for entity in entities]
+        if not rows:
+            return
+        columns = ("id", *self._INDEXED_COLUMNS, "document", "revision")
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        query = (
+            f"INSERT INTO {self.table_name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+        with self._transaction() as connection:
+            connection.executemany(query, rows)
+
+    def _exists(self, entity_id: str) -> bool:
+        with self._connection() as connection:
+            return (
+                connection.execute(f"SELECT 1 FROM {self.table_name} WHERE id = ?", (entity_id,)).fetchone() is not None
+            )
+
+    def _revision(self, entity_id: str) -> Optional[Hashable]:
+        with self._connection() as connection:
+            row = connection.execute(f"SELECT revision FROM {self.table_name} WHERE id = ?", (entity_id,)).fetchone()
+        return row[0] if row else None
+
+    def _list_ids(self) -> Optional[Set[str]]:
+        with self._connection() as connection:
+            return {entity_id for (entity_id,) in connection.execute(f"SELECT id FROM {self.table_name}")}
+
+    def _load(self, entity_id: str) -> Entity:
+        with self._connection() as connection:
+            row = connection.execute(f"SELECT document FROM {self.table_name} WHERE id = ?", (entity_id,)).fetchone()
+        if row is None:
+            raise ModelNotFound(self.table_name, entity_id)
+        return self.__document_to_entity(row[0])
+
+    def _load_many(self, entity_ids: Iterable[str]) -> Dict[str, Entity]:
+        ids = list(dict.fromkeys(entity_ids))
+        rows = []
+        with self._connection() as connection:
+            for start in range(0, len(ids), self._MAX_BATCH_SIZE):
+                batch = ids[start : start + self._MAX_BATCH_SIZE]
+                rows.extend(
+                    connection.execute(
+                        f"SELECT id, document FROM {self.table_name} WHERE id IN ({', '.join('?' * len(batch))})", batch
+                    ).fetchall()
+                )
+        entities = self.__documents_to_entities(document for _, document in rows)
+        return {entity_id: entity for (entity_id, _), entity in zip(rows, entities)}
+
+    def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        where, params = self.__build_where_clause(filters)
+        with self._connection() as connection:
+            rows = connection.execute(f"SELECT document FROM {self.table_name}{where}", params).fetchall()
+        return self.__documents_to_entities(document for (document,) in rows)
+
+    def _delete(self, entity_id: str):
+        with self._connection() as connection:
+            cursor = connection.execute(f"DELETE FROM {self.table_name} WHERE id = ?", (entity_id,))
+        if cursor.rowcount == 0:
+            raise ModelNotFound(self.table_name, entity_id)
+
+    def _delete_all(self):
+        with self._connection() as connection:
+            connection.execute(f"DELETE FROM {self.table_name}")
+
+    def _delete_many(self, ids: Iterable[str]):
+        ids = list(ids)
+        with self._transaction() as connection:
+            for start in range(0, len(ids), self._MAX_BATCH_SIZE):
+                batch = ids[start : start + self._MAX_BATCH_SIZE]
+                connection.execute(f"DELETE FROM {self.table_name} WHERE id IN ({', '.join('?' * len(batch))})", batch)
+
+    def _delete_by(self, attribute: str, value: str):
+        where, params = self.__build_where_clause([{attribute: value}])
+        with self._connection() as connection:
+            connection.execute(f"DELETE FROM {self.table_name}{where}", params)
+
+    def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        return self._load_all([{**fil, attribute: value} for fil in (filters or [{}])])
+
+    def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]) -> None:
+        if isinstance(folder_path, str):
+            folder: pathlib.Path = pathlib.Path(folder_path)
+        else:
+            folder = folder_path
+
+        export_dir = folder / self.table_name
+        if not export_dir.exists():
+            export_dir.mkdir(parents=True)
+
+        with self._connection() as connection:
+            row = connection.execute(f"SELECT document FROM {self.table_name} WHERE id = ?", (entity_id,)).fetchone()
+        if row is None:
+            raise ModelNotFound(self.table_name, entity_id)
+
+        (export_dir / f"{entity_id}.json").write_text(row[0], encoding="UTF-8")
+
+    ###########################################
+    # ##   Specific or optimized methods   ## #
+    ###########################################
+    def _get_by_configs_and_owner_ids(self, configs_and_owner_ids, filters: Optional[List[Dict]] = None):
+        if not filters:
+            filters = [{}]
+        keys = {(config.id, owner_id): (config, owner_id) for config, owner_id in set(configs_and_owner_ids)}
+        res = {}
+
+        # Batch the keys so that a query never holds too many parameters.
+        batch_size = max(1, self._MAX_BATCH_SIZE // (len(filters) * (len(filters[0]) + 2)))
+        key_list = list(keys)
+        for start in range(0, len(key_list), batch_size):
+            key_filters = [
+                {**fil, "config_id": config_id, "owner_id": owner_id}
+                for config_id, owner_id in key_list[start : start + batch_size]
+                for fil in filters
+            ]
+            where, params = self.__build_where_clause(key_filters)
+            with self._connection() as connection:
+                rows = connection.execute(
+                    f"SELECT config_id, owner_id, document FROM {self.table_name}{where}", params
+                ).fetchall()
+            for config_id, owner_id, document in rows:
+                if (key := keys.get((config_id, owner_id))) and key not in res:
+                    res[key] = self.__document_to_entity(document)
+        return res
+
+    def _get_by_config_and_owner_id(
+        self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
+    ) -> Optional[Entity]:
+        key_filters = [{**fil, "config_id": config_id, "owner_id": owner_id} for fil in (filters or [{}])]
+        where, params = self.__build_where_clause(key_filters)
+        with self._connection() as connection:
+            row = connection.execute(f"SELECT document FROM {self.table_name}{where} LIMIT 1", params).fetchone()
+        return self.__document_to_entity(row[0]) if row else None
+
+    ###########################################
+    # ##   Connection and table handling   ## #
+    ###########################################
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        with _SQLConnection._lock:
+            yield _SQLConnection._get_connection(self.table_name, self._create_tables)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _create_tables(self, connection: sqlite3.Connection):
+        indexed_columns = ", ".join(f"{column} TEXT" for column in self._INDEXED_COLUMNS)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+            f"(id TEXT PRIMARY KEY NOT NULL, {indexed_columns}, document TEXT NOT NULL, revision TEXT NOT NULL)"
+        )
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table_name}_config_id_owner_id "
+            f"ON {self.table_name} (config_id, owner_id)"
+        )
+        for column in self._INDEXED_COLUMNS[2:]:
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {self.table_name}_{column} ON {self.table_name} ({column})")
+
+    #############################
+    # ##   Private methods   ## #
+    #############################
+
+    def __entity_to_row(self, entity: Entity) -> Tuple:
+        model = self.converter._entity_to_model(entity)  # type: ignore
+        model_dict = model.to_dict()
+        document = self._serializer._dumps(model_dict).decode("UTF-8")
+        return (model.id, *(model_dict.get(column) for column in self._INDEXED_COLUMNS), document, uuid.uuid4().hex)
+
+    def __document_to_entity(self, document: str) -> Entity:
+        model = self.model_type.from_dict(self._serializer._loads(document))  # type: ignore[attr-defined]
+        return self.converter._model_to_entity(model)  # type: ignore[attr-defined]
+
+    def __documents_to_entities(self, documents: Iterable[str]) -> List[Entity]:
+        serializer = self._serializer
+        models = [self.model_type.from_dict(serializer._loads(document)) for document in documents]  # type: ignore
+        return self.converter._models_to_entities(models)  # type: ignore[attr-defined]
+
+    def __build_where_clause(self, filters: Optional[List[Dict]]) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause matching any of the filters, each filter being a conjunction of equalities."""
+        if not filters or not all(filters):
+            return "", []
+
+        clauses = []
+        params: List[Any] = []
+        for _filter in filters:
+            conditions = []
+            for key, value in _filter.items():
+                if key in self._INDEXED_COLUMNS:
+                    target = key
+                else:
+                    target = "json_extract(document, ?)"
+                    params.append(f'$."{key}"')
+                if value is None:
+                    conditions.append(f"{target} IS NULL")
+                else:
+                    conditions.append(f"{target} = ?")
+                    params.append(value)
+            clauses.append(f"({' AND '.join(conditions)})")
+        return f" WHERE {' OR '.join(clauses)}", params
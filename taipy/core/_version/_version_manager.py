@@ -44,7 +44,7 @@ class _VersionManager(_Manager[_Version]):
     _repository: _VersionFSRepository
 
     @classmethod
-    def _get(cls, entity: Union[str, _Version], default=None) -> _Version:
+    def _get(cls, entity: Union[str, _Version], default=None, cached: bool = True) -> _Version:
         """
         Returns the version entity by id or reference.
         """
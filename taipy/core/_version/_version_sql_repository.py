@@ -0,0 +1,71 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sqlite3
+
+from .._repository._sql_repository import _SQLRepository
+from ..exceptions import ModelNotFound
+from ._version_converter import _VersionConverter
+from ._version_model import _VersionModel
+
+
+class _VersionSQLRepository(_SQLRepository):
+    _LATEST_VERSION_KEY = "latest_version"
+    _DEVELOPMENT_VERSION_KEY = "development_version"
+
+    def __init__(self) -> None:
+        super().__init__(model_type=_VersionModel, converter=_VersionConverter, table_name="version")
+
+    @property
+    def _settings_table_name(self) -> str:
+        return f"{self.table_name}_settings"
+
+    def _create_tables(self, connection: sqlite3.Connection):
+        super()._create_tables(connection)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._settings_table_name} (key TEXT PRIMARY KEY NOT NULL, value TEXT)"
+        )
+
+    def _delete_all(self):
+        super()._delete_all()
+
+        with self._connection() as connection:
+            connection.execute(f"DELETE FROM {self._settings_table_name}")
+
+    def _set_latest_version(self, version_number):
+        with self._transaction() as connection:
+            self.__set_setting(connection, self._DEVELOPMENT_VERSION_KEY, "", override=False)
+            self.__set_setting(connection, self._LATEST_VERSION_KEY, version_number)
+
+    def _get_latest_version(self) -> str:
+        return self.__get_setting(self._LATEST_VERSION_KEY)
+
+    def _set_development_version(self, version_number):
+        with self._transaction() as connection:
+            self.__set_setting(connection, self._DEVELOPMENT_VERSION_KEY, version_number)
+            self.__set_setting(connection, self._LATEST_VERSION_KEY, version_number)
+
+    def _get_development_version(self) -> str:
+        return self.__get_setting(self._DEVELOPMENT_VERSION_KEY)
+
+    def __set_setting(self, connection: sqlite3.Connection, key: str, value: str, override: bool = True):
+        conflict_clause = "DO UPDATE SET value = excluded.value" if override else "DO NOTHING"
+        connection.execute(
+            f"INSERT INTO {self._settings_table_name} (key, value) VALUES (?, ?) ON CONFLICT(key) {conflict_clause}",
+            (key, value),
+        )
+
+    def __get_setting(self, key: str) -> str:
+        with self._connection() as connection:
+            row = connection.execute(f"SELECT value FROM {self._settings_table_name} WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise ModelNotFound(self._settings_table_name, key)
+        return row[0]
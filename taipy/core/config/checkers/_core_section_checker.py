@@ -15,11 +15,15 @@ from taipy.common.config._config import _Config
 from taipy.common.config.checker._checkers._config_checker import _ConfigChecker
 from taipy.common.config.checker.issue_collector import IssueCollector
 
+from ..._repository._filesystem_layout import _LAYOUTS
+from ..._repository._serializer import _SERIALIZER_NAMES
 from ..core_section import CoreSection
 
 
 class _CoreSectionChecker(_ConfigChecker):
-    _ACCEPTED_REPOSITORY_TYPES: Set[str] = {"filesystem", "sql"}
+    _ACCEPTED_REPOSITORY_TYPES: Set[str] = {"filesystem", "sql", "journal"}
+    _FILESYSTEM_LAYOUT_KEY = "filesystem_layout"
+    _SERIALIZER_KEY = "serializer"
 
     def __init__(self, config: _Config, collector: IssueCollector):
         super().__init__(config, collector)
@@ -28,6 +32,8 @@ class _CoreSectionChecker(_ConfigChecker):
         if core_section := self._config._unique_sections.get(CoreSection.name):
             core_section = cast(CoreSection, core_section)
             self._check_repository_type(core_section)
+            self._check_filesystem_layout(core_section)
+            self._check_serializer(core_section)
         return self._collector
 
     def _check_repository_type(self, core_section: CoreSection):
@@ -39,3 +45,25 @@ class _CoreSectionChecker(_ConfigChecker):
                 f'Value "{value}" for field {core_section._REPOSITORY_TYPE_KEY} of the CoreSection is not supported. '
                 f'Default value "filesystem" is applied.',
             )
+
+    def _check_filesystem_layout(self, core_section: CoreSection):
+        value = core_section.repository_properties.get(self._FILESYSTEM_LAYOUT_KEY)
+        if value is not None and value not in _LAYOUTS:
+            self._warning(
+                core_section._REPOSITORY_PROPERTIES_KEY,
+                core_section.repository_properties,
+                f'Value "{value}" for property {self._FILESYSTEM_LAYOUT_KEY} of field '
+                f"{core_section._REPOSITORY_PROPERTIES_KEY} of the CoreSection is not supported. "
+                f'Default value "flat" is applied.',
+            )
+
+    def _check_serializer(self, core_section: CoreSection):
+        value = core_section.repository_properties.get(self._SERIALIZER_KEY)
+        if value is not None and value not in _SERIALIZER_NAMES:
+            self._warning(
+                core_section._REPOSITORY_PROPERTIES_KEY,
+                core_section.repository_properties,
+                f'Value "{value}" for property {self._SERIALIZER_KEY} of field '
+                f"{core_section._REPOSITORY_PROPERTIES_KEY} of the CoreSection is not supported. "
+                f'Default value "json" is applied.',
+            )
@@ -31,10 +31,11 @@ class _JobConfigChecker(_ConfigChecker):
                 cast(Dict[str, DataNodeConfig], data_node_configs),
             )
             self._check_job_execution_mode(cast(JobConfig, job_config))
+            self._check_remote_mode(cast(JobConfig, job_config))
         return self._collector
 
     def _check_multiprocess_mode(self, job_config: JobConfig, data_node_configs: Dict[str, DataNodeConfig]):
-        if job_config.is_standalone:
+        if job_config.is_standalone or job_config.is_remote:
             for cfg_id, data_node_config in data_node_configs.items():
                 if data_node_config.storage_type == DataNodeConfig._STORAGE_TYPE_VALUE_IN_MEMORY:
                     self._error(
@@ -51,3 +52,11 @@ class _JobConfigChecker(_ConfigChecker):
                 job_config.mode,
                 f"`Job execution mode must be either {', '.join(JobConfig._MODES)}.",
             )
+
+    def _check_remote_mode(self, job_config: JobConfig):
+        if job_config.is_remote and not job_config.authkey:
+            self._error(
+                "authkey",
+                job_config.authkey,
+                f"An authentication key is required in {JobConfig._REMOTE_MODE} mode.",
+            )
@@ -38,6 +38,7 @@ class _TaskConfigChecker(_ConfigChecker):
                     task_config_id, task_config, scenario_attributes
                 )
                 self._check_existing_function(task_config_id, task_config)
+                self._check_executor(task_config_id, task_config)
                 self._check_inputs(task_config_id, task_config)
                 self._check_outputs(task_config_id, task_config)
                 self._check_if_children_config_id_is_overlapping_with_properties(task_config_id, task_config)
@@ -88,3 +89,13 @@ class _TaskConfigChecker(_ConfigChecker):
                 f"{task_config._FUNCTION} field of TaskConfig `{task_config_id}` must be"
                 f" populated with Callable value.",
             )
+
+    def _check_executor(self, task_config_id: str, task_config: TaskConfig):
+        executor = task_config.properties.get(TaskConfig._EXECUTOR_KEY)
+        if executor is not None and executor not in TaskConfig._EXECUTORS:
+            self._error(
+                TaskConfig._EXECUTOR_KEY,
+                executor,
+                f"{TaskConfig._EXECUTOR_KEY} field of TaskConfig `{task_config_id}` must be either"
+                f" {', '.join(TaskConfig._EXECUTORS)}.",
+            )
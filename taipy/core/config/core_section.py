@@ -61,6 +61,21 @@ class CoreSection(UniqueSection):
     _FORCE_KEY = "force"
     _DEFAULT_FORCE = False
 
+    _ENTITY_CACHE_KEY = "entity_cache"
+    _DEFAULT_ENTITY_CACHE = True
+
+    _ENTITY_CACHE_MAX_SIZE_KEY = "entity_cache_max_size"
+    _DEFAULT_ENTITY_CACHE_MAX_SIZE = 10000
+
+    _RETENTION_MAX_AGE_KEY = "retention_max_age"
+    _DEFAULT_RETENTION_MAX_AGE = None
+
+    _RETENTION_MAX_COUNT_KEY = "retention_max_count"
+    _DEFAULT_RETENTION_MAX_COUNT = None
+
+    _RETENTION_INTERVAL_KEY = "retention_interval"
+    _DEFAULT_RETENTION_INTERVAL = 60
+
     _CORE_VERSION_KEY = "core_version"
     _CURRENT_CORE_VERSION = _read_version()
 
@@ -75,6 +90,11 @@ class CoreSection(UniqueSection):
         mode: Optional[str] = None,
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
+        entity_cache: Optional[bool] = None,
+        entity_cache_max_size: Optional[int] = None,
+        retention_max_age: Optional[int] = None,
+        retention_max_count: Optional[int] = None,
+        retention_interval: Optional[int] = None,
         core_version: Optional[str] = None,
         **properties,
     ):
@@ -87,6 +107,11 @@ class CoreSection(UniqueSection):
         self._mode = mode
         self._version_number = version_number
         self._force = force
+        self._entity_cache = entity_cache
+        self._entity_cache_max_size = entity_cache_max_size
+        self._retention_max_age = retention_max_age
+        self._retention_max_count = retention_max_count
+        self._retention_interval = retention_interval
 
         self._check_compatibility(core_version)
         self._core_version = core_version
@@ -104,6 +129,11 @@ class CoreSection(UniqueSection):
             self.mode,
             self.version_number,
             self.force,
+            self.entity_cache,
+            self.entity_cache_max_size,
+            self.retention_max_age,
+            self.retention_max_count,
+            self.retention_interval,
             self._core_version,
             **copy(self._properties),
         )
@@ -242,6 +272,79 @@ class CoreSection(UniqueSection):
     def force(self, val) -> None:
         self._force = val
 
+    @property
+    def entity_cache(self) -> bool:
+        """If True, the entities loaded from the repository are kept in an in-process cache.
+
+        Reloading an entity that did not change since it was cached then returns the cached
+        entity instead of reading it again from the repository.
+
+        The default value is True.
+        """
+        return _tpl._replace_templates(self._entity_cache)
+
+    @entity_cache.setter  # type: ignore
+    @_ConfigBlocker._check()
+    def entity_cache(self, val) -> None:
+        self._entity_cache = val
+
+    @property
+    def entity_cache_max_size(self) -> int:
+        """Maximum number of entities of each type kept in the entity cache.
+
+        When the cache is full, the least recently used entities are evicted first.
+        The default value is 10000.
+        """
+        return _tpl._replace_templates(self._entity_cache_max_size)
+
+    @entity_cache_max_size.setter  # type: ignore
+    @_ConfigBlocker._check()
+    def entity_cache_max_size(self, val) -> None:
+        self._entity_cache_max_size = val
+
+    @property
+    def retention_max_age(self) -> Optional[int]:
+        """Age, in seconds, after which finished jobs and submissions are archived.
+
+        While the Orchestrator service runs, the finished jobs and submissions created longer ago
+        are periodically moved from the repository to a compressed archive.
+        The default value is None: finished jobs and submissions are never archived because of their age.
+        """
+        return _tpl._replace_templates(self._retention_max_age)
+
+    @retention_max_age.setter  # type: ignore
+    @_ConfigBlocker._check()
+    def retention_max_age(self, val) -> None:
+        self._retention_max_age = val
+
+    @property
+    def retention_max_count(self) -> Optional[int]:
+        """Number of finished jobs of each task, and of finished submissions of each entity, to keep.
+
+        While the Orchestrator service runs, the older finished jobs and submissions are periodically
+        moved from the repository to a compressed archive.
+        The default value is None: finished jobs and submissions are never archived because of their number.
+        """
+        return _tpl._replace_templates(self._retention_max_count)
+
+    @retention_max_count.setter  # type: ignore
+    @_ConfigBlocker._check()
+    def retention_max_count(self, val) -> None:
+        self._retention_max_count = val
+
+    @property
+    def retention_interval(self) -> int:
+        """Interval, in seconds, between two applications of the retention policy.
+
+        The default value is 60.
+        """
+        return _tpl._replace_templates(self._retention_interval)
+
+    @retention_interval.setter  # type: ignore
+    @_ConfigBlocker._check()
+    def retention_interval(self, val) -> None:
+        self._retention_interval = val
+
     @property
     def core_version(self) -> str:
         """The version of the Taipy core library."""
@@ -264,6 +367,11 @@ class CoreSection(UniqueSection):
             cls._DEFAULT_MODE,
             cls._DEFAULT_VERSION_NUMBER,
             cls._DEFAULT_FORCE,
+            cls._DEFAULT_ENTITY_CACHE,
+            cls._DEFAULT_ENTITY_CACHE_MAX_SIZE,
+            cls._DEFAULT_RETENTION_MAX_AGE,
+            cls._DEFAULT_RETENTION_MAX_COUNT,
+            cls._DEFAULT_RETENTION_INTERVAL,
             cls._CURRENT_CORE_VERSION,
         )
 
@@ -277,6 +385,11 @@ class CoreSection(UniqueSection):
         self.mode = self._DEFAULT_MODE
         self.version_number = self._DEFAULT_VERSION_NUMBER
         self.force = self._DEFAULT_FORCE
+        self._entity_cache = self._DEFAULT_ENTITY_CACHE
+        self._entity_cache_max_size = self._DEFAULT_ENTITY_CACHE_MAX_SIZE
+        self._retention_max_age = self._DEFAULT_RETENTION_MAX_AGE
+        self._retention_max_count = self._DEFAULT_RETENTION_MAX_COUNT
+        self._retention_interval = self._DEFAULT_RETENTION_INTERVAL
         self._core_version = self._CURRENT_CORE_VERSION
         self._properties.clear()
 
@@ -300,6 +413,16 @@ class CoreSection(UniqueSection):
             as_dict[self._VERSION_NUMBER_KEY] = self.version_number
         if self.force is not None:
             as_dict[self._FORCE_KEY] = self.force
+        if self._entity_cache is not None:
+            as_dict[self._ENTITY_CACHE_KEY] = self._entity_cache
+        if self._entity_cache_max_size is not None:
+            as_dict[self._ENTITY_CACHE_MAX_SIZE_KEY] = self._entity_cache_max_size
+        if self._retention_max_age is not None:
+            as_dict[self._RETENTION_MAX_AGE_KEY] = self._retention_max_age
+        if self._retention_max_count is not None:
+            as_dict[self._RETENTION_MAX_COUNT_KEY] = self._retention_max_count
+        if self._retention_interval is not None:
+            as_dict[self._RETENTION_INTERVAL_KEY] = self._retention_interval
         if self._core_version is not None:
             as_dict[self._CORE_VERSION_KEY] = self._core_version
         as_dict.update(self._properties)
@@ -316,6 +439,11 @@ class CoreSection(UniqueSection):
         mode = as_dict.pop(cls._MODE_KEY, None)
         version_nb = as_dict.pop(cls._VERSION_NUMBER_KEY, None)
         force = as_dict.pop(cls._FORCE_KEY, None)
+        entity_cache = as_dict.pop(cls._ENTITY_CACHE_KEY, None)
+        entity_cache_max_size = as_dict.pop(cls._ENTITY_CACHE_MAX_SIZE_KEY, None)
+        retention_max_age = as_dict.pop(cls._RETENTION_MAX_AGE_KEY, None)
+        retention_max_count = as_dict.pop(cls._RETENTION_MAX_COUNT_KEY, None)
+        retention_interval = as_dict.pop(cls._RETENTION_INTERVAL_KEY, None)
         core_version = as_dict.pop(cls._CORE_VERSION_KEY, None)
         return CoreSection(
             root_folder,
@@ -327,6 +455,11 @@ class CoreSection(UniqueSection):
             mode,
             version_nb,
             force,
+            entity_cache,
+            entity_cache_max_size,
+            retention_max_age,
+            retention_max_count,
+            retention_interval,
             core_version,
             **as_dict,
         )
@@ -348,6 +481,11 @@ class CoreSection(UniqueSection):
         self._mode = as_dict.pop(self._MODE_KEY, self.mode)
         self._version_number = as_dict.pop(self._VERSION_NUMBER_KEY, self.version_number)
         self._force = as_dict.pop(self._FORCE_KEY, self.force)
+        self._entity_cache = as_dict.pop(self._ENTITY_CACHE_KEY, self._entity_cache)
+        self._entity_cache_max_size = as_dict.pop(self._ENTITY_CACHE_MAX_SIZE_KEY, self._entity_cache_max_size)
+        self._retention_max_age = as_dict.pop(self._RETENTION_MAX_AGE_KEY, self._retention_max_age)
+        self._retention_max_count = as_dict.pop(self._RETENTION_MAX_COUNT_KEY, self._retention_max_count)
+        self._retention_interval = as_dict.pop(self._RETENTION_INTERVAL_KEY, self._retention_interval)
 
         core_version = as_dict.pop(self._CORE_VERSION_KEY, None)
         self._check_compatibility(core_version)
@@ -386,6 +524,11 @@ class CoreSection(UniqueSection):
         mode: Optional[str] = None,
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
+        entity_cache: Optional[bool] = None,
+        entity_cache_max_size: Optional[int] = None,
+        retention_max_age: Optional[int] = None,
+        retention_max_count: Optional[int] = None,
+        retention_interval: Optional[int] = None,
         **properties,
     ) -> "CoreSection":
         """Configure the Orchestrator service.
@@ -400,9 +543,14 @@ class CoreSection(UniqueSection):
                 used in conjunction with the *root_folder* attribute. That means the storage path is
                 <root_folder><storage_folder> (The default path is "./taipy/.taipy/").
             repository_type (Optional[str]): The type of the repository to be used to store Taipy data.
+                Possible values are *"filesystem"*, *"sql"* or *"journal"*. With *"journal"*, jobs and
+                submissions are stored in append-only journals while other entities are stored as files.
                 The default value is "filesystem".
             repository_properties (Optional[Dict[str, Union[str, int]]]): A dictionary of additional properties
-                to be used by the repository.
+                to be used by the repository. With the *"filesystem"* repository type, setting the
+                *"filesystem_layout"* property to *"sharded"* spreads the entity files over hash-named sub-folders.
+                Setting the *"serializer"* property to *"orjson"* encodes and decodes the entities with the
+                orjson package, if installed, instead of the standard json module.
             read_entity_retry (Optional[int]): Number of retries to read an entity from the repository
                 before return failure. The default value is 3.
             mode (Optional[str]): Indicates the mode of the version management system.
@@ -414,6 +562,18 @@ class CoreSection(UniqueSection):
                  In development mode, the version number is ignored.
             force (Optional[bool]): If True, Taipy will override a version even if the configuration
                 has changed and run the application.
+            entity_cache (Optional[bool]): If True, the entities loaded from the repository are kept in an
+                in-process cache, so reloading an unchanged entity does not read the repository again.
+                The default value is True.
+            entity_cache_max_size (Optional[int]): Maximum number of entities of each type kept in the entity
+                cache. The least recently used entities are evicted first. The default value is 10000.
+            retention_max_age (Optional[int]): Age, in seconds, after which finished jobs and submissions are
+                moved to a compressed archive while the Orchestrator service runs. The default value is None.
+            retention_max_count (Optional[int]): Number of finished jobs of each task, and of finished submissions
+                of each entity, kept in the repository while the Orchestrator service runs. The older ones are
+                moved to a compressed archive. The default value is None.
+            retention_interval (Optional[int]): Interval, in seconds, between two applications of the retention
+                policy. The default value is 60.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
                 behavior of the `Orchestrator^` service.
 
@@ -430,6 +590,11 @@ class CoreSection(UniqueSection):
             mode=mode,
             version_number=version_number,
             force=force,
+            entity_cache=entity_cache,
+            entity_cache_max_size=entity_cache_max_size,
+            retention_max_age=retention_max_age,
+            retention_max_count=retention_max_count,
+            retention_interval=retention_interval,
             core_version=_read_version(),
             **properties,
         )
@@ -77,6 +77,12 @@ class DataNodeConfig(Section):
         _EXPOSED_TYPE_NUMPY,
     ]
 
+    # The properties to hand the data written by jobs off through shared memory, and to not persist it.
+    _HANDOFF_KEY = "handoff"
+    _TRANSIENT_KEY = "transient"
+    # The property to record a hash of the data written to the data node.
+    _FINGERPRINT_KEY = "fingerprint"
+
     _OPTIONAL_ENCODING_PROPERTY = "encoding"
     _DEFAULT_ENCODING_VALUE = "utf-8"
 
@@ -481,7 +487,14 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                If the *"handoff"* property is True, the data written by a job is handed off to the jobs
+                reading it through shared memory, and written to the storage asynchronously. If the
+                *"transient"* property is also True, the data is not written to the storage at all: it is
+                only available to the jobs of the same submission.<br/>
+                If the *"fingerprint"* property is True, a hash of the written data is recorded on each
+                write. The skippable tasks reading the data node are then skipped when the data is the one
+                they last ran with, even if it was written again since.
 
         Returns:
             The new data node configuration.
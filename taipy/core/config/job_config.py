@@ -26,15 +26,17 @@ class JobConfig(UniqueSection):
     _MODE_KEY = "mode"
     _STANDALONE_MODE = "standalone"
     _DEVELOPMENT_MODE = "development"
+    _REMOTE_MODE = "remote"
     _DEFAULT_MODE = _DEVELOPMENT_MODE
     _DEFAULT_MAX_NB_OF_WORKERS = 2
-    _MODES = [_DEVELOPMENT_MODE, _STANDALONE_MODE]
+    _MODES = [_DEVELOPMENT_MODE, _STANDALONE_MODE, _REMOTE_MODE]
 
     mode: Optional[str]
     """The task orchestration mode.
 
     By default, the "development" mode is set for testing and debugging the
-    executions of jobs. A "standalone" mode is also available.
+    executions of jobs. A "standalone" mode is also available, as well as a "remote"
+    mode, where the jobs run on worker agents started with `taipy worker`.
 
     In the Taipy Enterprise Edition, the "cluster" mode is available.
     """
@@ -56,6 +58,11 @@ class JobConfig(UniqueSection):
         """True if the config is set to standalone mode"""
         return self.mode == self._STANDALONE_MODE
 
+    @property
+    def is_remote(self) -> bool:
+        """True if the config is set to remote mode"""
+        return self.mode == self._REMOTE_MODE
+
     @property
     def is_development(self) -> bool:
         """True if the config is set to development mode"""
@@ -103,14 +110,25 @@ class JobConfig(UniqueSection):
 
         Parameters:
             mode (Optional[str]): The job execution mode.
-                Possible values are: *"standalone"* or *"development"*.
+                Possible values are: *"standalone"*, *"remote"* or *"development"*.
             max_nb_of_workers (Optional[int, str]): Parameter used only in *"standalone"* mode.
                 This indicates the maximum number of jobs able to run in parallel.<br/>
                 The default value is 2.<br/>
                 A string can be provided to dynamically set the value using an environment
                 variable. The string must follow the pattern: `ENV[&lt;env_var&gt;]` where
                 `&lt;env_var&gt;` is the name of an environment variable.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                The *"resources"* property is a dictionary of the amounts of resources the
+                *"standalone"* workers share, e.g. `{"cpu": 8, "mem_gb": 16}`. A job only starts
+                when the resources its task declares are available.<br/>
+                The *"max_nb_of_threads"* property is the maximum number of jobs of tasks configured
+                with the *"thread"* executor able to run in parallel. The default value is 4.<br/>
+                In *"remote"* mode, the *"address"* property is the *"host:port"* or *"unix:path"*
+                address the worker agents started with `taipy worker --connect <address>` connect to,
+                "localhost:5755" by default. The *"authkey"* property, required in *"remote"* mode, is the
+                key the dispatcher and the agents authenticate each other with, and the
+                *"heartbeat_interval"* property is the number of seconds between the heartbeats of the
+                agents, 5 by default.
 
         Returns:
             The new job execution configuration.
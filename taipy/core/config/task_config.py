@@ -44,6 +44,10 @@ class TaskConfig(Section):
     _FUNCTION = "function"
     _OUTPUT_KEY = "outputs"
     _IS_SKIPPABLE_KEY = "skippable"
+    _EXECUTOR_KEY = "executor"
+    _EXECUTOR_VALUE_PROCESS = "process"
+    _EXECUTOR_VALUE_THREAD = "thread"
+    _EXECUTORS = [_EXECUTOR_VALUE_PROCESS, _EXECUTOR_VALUE_THREAD]
 
     function: Optional[Callable]
     """User function taking as inputs some parameters compatible with the data type
@@ -184,7 +188,13 @@ class TaskConfig(Section):
             skippable (bool): If True, indicates that the task can be skipped if no change has
                 been made on inputs.<br/>
                 The default value is False.
-            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.<br/>
+                The *"priority"* property is an integer ordering the jobs of the same submission
+                priority, 0 by default. The *"resources"* property is a dictionary of the amounts of
+                the resources declared in the job execution configuration the task needs to run,
+                e.g. `{"cpu": 4, "mem_gb": 8}`. In *"standalone"* mode, the *"executor"* property
+                selects where the task jobs run: *"process"* (the default) for a worker process, or
+                *"thread"* for a worker thread of the orchestrator process, which suits I/O-bound tasks.
 
         Returns:
             The new task configuration.
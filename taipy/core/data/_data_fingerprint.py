@@ -0,0 +1,107 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import hashlib
+import pickle
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..config.data_node_config import DataNodeConfig
+from .data_node_id import Edit
+
+if TYPE_CHECKING:
+    from .data_node import DataNode
+
+
+class _DataFingerprint:
+    """
+    Fingerprints of the data written to the data nodes, to skip the skippable tasks whose inputs did not change.
+
+    The edit of a write to a data node configured with the *"fingerprint"* property records a hash of the
+    written data. A writer can also provide its own fingerprint, e.g. a version token of the data source,
+    with the *fingerprint* option of `DataNode.write()^` or `DataNode.track_edit()^`. The edits of the
+    outputs written by a job record the fingerprints of the inputs it read. A skippable task is skipped
+    when the fingerprints of its inputs are the ones recorded by the last edits of its outputs, even if
+    the inputs were written again since.
+    """
+
+    _EDIT_KEY = "fingerprint"
+    _INPUT_FINGERPRINTS_EDIT_KEY = "input_fingerprints"
+
+    @staticmethod
+    def _is_enabled(data_node: "DataNode") -> bool:
+        return str(data_node._properties.get(DataNodeConfig._FINGERPRINT_KEY, False)).lower() in ("true", "1")
+
+    @classmethod
+    def _add_to_edit_options(cls, data_node: "DataNode", data: Any, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the fingerprint of the written data to the edit options, unless the writer provided one."""
+        if options.get(cls._EDIT_KEY) is None and cls._is_enabled(data_node):
+            options[cls._EDIT_KEY] = cls._compute(data)
+        return options
+
+    @staticmethod
+    def _compute(data: Any) -> Optional[str]:
+        """Return a hash of the content of the data, or None if it cannot be computed."""
+        hasher = hashlib.sha256()
+        try:
+            if isinstance(data, (pd.DataFrame, pd.Series)):
+                # Pickles of equal frames may differ: the frames are hashed row by row instead.
+                hasher.update(repr((type(data).__name__, list(getattr(data, "columns", [])))).encode())
+                hasher.update(repr(data.dtypes.astype(str).tolist() if data.ndim > 1 else str(data.dtype)).encode())
+                hasher.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+            elif isinstance(data, np.ndarray) and not data.dtype.hasobject:
+                hasher.update(repr((data.dtype.str, data.shape)).encode())
+                hasher.update(np.ascontiguousarray(data).tobytes())
+            else:
+                hasher.update(pickle.dumps(data, protocol=5))
+        except Exception:
+            return None
+        return hasher.hexdigest()
+
+    @classmethod
+    def _of(cls, data_node: "DataNode") -> Optional[str]:
+        """Return the fingerprint of the current data of a data node, if known."""
+        edit = cls.__get_current_edit(data_node)
+        return edit.get(cls._EDIT_KEY) if edit else None
+
+    @classmethod
+    def _of_all(cls, data_nodes: Iterable["DataNode"]) -> Optional[Dict[str, str]]:
+        """Return the fingerprints of the current data of data nodes by id, if all of them are known."""
+        fingerprints = {}
+        for data_node in data_nodes:
+            if (fingerprint := cls._of(data_node)) is None:
+                return None
+            fingerprints[data_node.id] = fingerprint
+        return fingerprints
+
+    @classmethod
+    def _match_last_run(cls, inputs: Iterable["DataNode"], outputs: Iterable["DataNode"]) -> bool:
+        """Indicate if the outputs were last written from inputs with the current fingerprints."""
+        if (input_fingerprints := cls._of_all(inputs)) is None:
+            return False
+        for output in outputs:
+            edit = cls.__get_current_edit(output)
+            if edit is None or edit.get(cls._INPUT_FINGERPRINTS_EDIT_KEY) != input_fingerprints:
+                return False
+        return True
+
+    @staticmethod
+    def __get_current_edit(data_node: "DataNode") -> Optional[Edit]:
+        # The last edit does not describe the data if its file was modified since, e.g. outside Taipy.
+        if not data_node._edits:
+            return None
+        edit = data_node._edits[-1]
+        last_modified = data_node._get_last_modified_datetime(data_node._properties.get(data_node._PATH_KEY))
+        if last_modified and (timestamp := edit.get("timestamp")) and last_modified > timestamp:
+            return None
+        return edit
@@ -0,0 +1,251 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import hashlib
+import os
+import pathlib
+import pickle
+import shutil
+import struct
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+from taipy.common.config import Config
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from .._repository._filesystem_lock import _FileSystemLock
+from .._repository._filesystem_repository import _FileSystemRepository
+from ..config.data_node_config import DataNodeConfig
+from ..exceptions.exceptions import NoData
+from ..job.job_id import JobId
+from .data_node import DataNode
+from .data_node_id import Edit
+
+
+class _SharedMemoryHandoff:
+    """
+    Hand-off of the data written by jobs to the jobs reading it, through shared memory segments.
+
+    The data nodes configured with the *"handoff"* property are not written to their storage by the jobs.
+    The data is pickled in a shared memory segment named after the data node and the job, which the jobs
+    reading the data node load it from, as long as the job wrote the last edit of the data node. The numpy
+    buffers of the data, e.g. of a pandas DataFrame, are copied to the segment out-of-band, without being
+    serialized. The data is written to the storage asynchronously by a thread of the writing process,
+    unless the data node is also configured with the *"transient"* property. The data of a transient data node
+    is lost once its segment is released: the data node is invalidated, so that its data is written again by
+    the next submission of its task.
+
+    Until then, the edit of the data node is marked as pending persistence: the data node is read from the
+    segment, or once the segment is released, after the data is written to the storage. The persistences of
+    a data node hold a lock across processes, and only write the data of the last edit of the data node, so
+    that the storage never goes back to older data.
+
+    The segments of the jobs of a submission are released by the orchestrator once all the jobs of the
+    submission are finished. Then, the data nodes are read from their storage.
+    """
+
+    _SEGMENT_NAME_PREFIX = "taipy_"
+    # Where the shared memory segments are allocated on Linux, to check there is room for a segment.
+    _SHARED_MEMORY_DIR = "/dev/shm"
+    # How long a read waits for a pending persistence, e.g. of a writing process that died.
+    _PERSISTENCE_TIMEOUT = 60.0
+    _PERSISTENCE_POLLING_INTERVAL = 0.05
+
+    __persistence_executor: Optional[ThreadPoolExecutor] = None
+    __pending_persistences: Set[Future] = set()
+    __lock = threading.Lock()
+    __logger = _TaipyLogger._get_logger()
+
+    @staticmethod
+    def _is_enabled(data_node: DataNode) -> bool:
+        return str(data_node._properties.get(DataNodeConfig._HANDOFF_KEY, False)).lower() in ("true", "1")
+
+    @staticmethod
+    def _is_transient(data_node: DataNode) -> bool:
+        return str(data_node._properties.get(DataNodeConfig._TRANSIENT_KEY, False)).lower() in ("true", "1")
+
+    @classmethod
+    def _segment_name(cls, data_node_id: str, job_id: str) -> str:
+        # Segment names are limited to 31 characters on some platforms.
+        return cls._SEGMENT_NAME_PREFIX + hashlib.sha1(f"{data_node_id}/{job_id}".encode()).hexdigest()[:24]
+
+    @classmethod
+    def _hand_off(cls, data_node: DataNode, data: Any, job_id: JobId, **edit_options) -> bool:
+        """Hand the data written by a job off in shared memory, and track the edit of the data node.
+
+        Returns:
+            False if the data node is not handed off or the data could not be, in which case the data must be
+            written to the storage.
+        """
+        if not cls._is_enabled(data_node):
+            return False
+        buffers: List[pickle.PickleBuffer] = []
+        chunks = [memoryview(pickle.dumps(data, protocol=5, buffer_callback=buffers.append))]
+        chunks.extend(buffer.raw() for buffer in buffers)
+        layout = memoryview(struct.pack(f"<{len(chunks) + 1}Q", len(chunks), *(chunk.nbytes for chunk in chunks)))
+        size = layout.nbytes + sum(chunk.nbytes for chunk in chunks)
+        if os.path.isdir(cls._SHARED_MEMORY_DIR) and shutil.disk_usage(cls._SHARED_MEMORY_DIR).free < size:
+            cls.__logger.warning(f"Not enough shared memory to hand off the data of data node {data_node.id}.")
+            return False
+        try:
+            segment = shared_memory.SharedMemory(cls._segment_name(data_node.id, job_id), create=True, size=size)
+        except OSError as e:
+            cls.__logger.warning(f"The data of data node {data_node.id} cannot be handed off: {e}")
+            return False
+        try:
+            offset = 0
+            for chunk in [layout, *chunks]:
+                segment.buf[offset : offset + chunk.nbytes] = chunk
+                offset += chunk.nbytes
+        finally:
+            segment.close()
+
+        if cls._is_transient(data_node):
+            edit_options[DataNode._TRANSIENT_KEY] = True
+            data_node._track_write(data, job_id=job_id, **edit_options)
+            return True
+        edit_options[DataNode._PENDING_PERSISTENCE_KEY] = True
+        with cls.__persistence_lock(data_node)._exclusive():
+            data_node._track_write(data, job_id=job_id, **edit_options)
+        cls.__persist(data_node, data, job_id)
+        return True
+
+    @classmethod
+    def _read_or_raise(cls, data_node: DataNode) -> Any:
+        """Read the data of a data node from the segment of its last edit if any, from its storage otherwise."""
+        if cls._is_enabled(data_node) and data_node._edits and (job_id := data_node._edits[-1].get("job_id")):
+            try:
+                return cls.__load(cls._segment_name(data_node.id, job_id))
+            except FileNotFoundError:
+                pass
+        return data_node.read_or_raise()
+
+    @classmethod
+    def _read_pending(cls, data_node: DataNode, edit: Edit) -> Any:
+        """Read the data of a data node whose last edit is not written to the storage yet."""
+        if job_id := edit.get("job_id"):
+            try:
+                return cls.__load(cls._segment_name(data_node.id, job_id))
+            except FileNotFoundError:
+                pass
+
+        # The segment was released: the data is read once written to the storage.
+        from ._data_manager_factory import _DataManagerFactory
+
+        data_manager = _DataManagerFactory._build_manager()
+        deadline = time.monotonic() + cls._PERSISTENCE_TIMEOUT
+        current = data_node
+        while current._edits and current._edits[-1].get(DataNode._PENDING_PERSISTENCE_KEY):
+            if time.monotonic() > deadline:
+                cls.__logger.warning(f"The data of data node {data_node.id} is still not written to the storage.")
+                break
+            time.sleep(cls._PERSISTENCE_POLLING_INTERVAL)
+            if (current := data_manager._get(data_node.id)) is None:
+                break
+        return data_node._read()
+
+    @classmethod
+    def _read_transient(cls, data_node: DataNode, edit: Edit) -> Any:
+        """Read the data of a data node whose last edit is only handed off, without being written to the storage."""
+        try:
+            return cls.__load(cls._segment_name(data_node.id, edit.get("job_id", "")))
+        except FileNotFoundError:
+            raise NoData(
+                f"The data of data node {data_node.id} from config {data_node.config_id} is not available anymore."
+            ) from None
+
+    @classmethod
+    def _invalidate(cls, transient_outputs: Iterable[Tuple[str, JobId]]):
+        """Invalidate the transient data nodes handed off by the jobs, once their segments are released.
+
+        The data node is only invalidated if the job wrote its last edit.
+        """
+        from ._data_manager_factory import _DataManagerFactory
+
+        data_manager = _DataManagerFactory._build_manager()
+        for data_node_id, job_id in transient_outputs:
+            if data_node := data_manager._get(data_node_id):
+                data_node._invalidate_transient_edit(job_id)
+
+    @classmethod
+    def _release(cls, segment_names: Iterable[str]):
+        """Release the shared memory segments."""
+        for name in segment_names:
+            try:
+                segment = shared_memory.SharedMemory(name)
+            except FileNotFoundError:
+                continue
+            segment.close()
+            segment.unlink()
+
+    @classmethod
+    def _wait_for_persistence(cls, timeout: Optional[float] = None):
+        """Wait for the handed off data being written to the storage by the current process."""
+        with cls.__lock:
+            pending = list(cls.__pending_persistences)
+        wait(pending, timeout=timeout)
+
+    @staticmethod
+    def __load(name: str) -> Any:
+        segment = shared_memory.SharedMemory(name)
+        try:
+            (nb_chunks,) = struct.unpack_from("<Q", segment.buf)
+            sizes = struct.unpack_from(f"<{nb_chunks}Q", segment.buf, 8)
+            offset = 8 * (nb_chunks + 1)
+            # The chunks are copied, so that the data outlives the segment and its buffers are writable.
+            chunks = []
+            for size in sizes:
+                chunks.append(bytearray(segment.buf[offset : offset + size]))
+                offset += size
+        finally:
+            segment.close()
+        return pickle.loads(chunks[0], buffers=chunks[1:])
+
+    @staticmethod
+    def __persistence_lock(data_node: DataNode) -> _FileSystemLock:
+        lock_dir = pathlib.Path(Config.core.taipy_storage_folder) / _FileSystemRepository._LOCK_DIR_NAME
+        return _FileSystemLock(lock_dir / f"{data_node.id}.persistence.lock")
+
+    @classmethod
+    def __persist(cls, data_node: DataNode, data: Any, job_id: JobId):
+        from ._data_manager_factory import _DataManagerFactory
+
+        def persist():
+            with cls.__persistence_lock(data_node)._exclusive():
+                current = _DataManagerFactory._build_manager()._get(data_node.id)
+                if current is None:
+                    return
+                written = False
+                # The data of a later edit is the one of the storage, whatever the order of the persistences.
+                if current._edits and current._edits[-1].get("job_id") == job_id:
+                    try:
+                        current._write(data)
+                        written = True
+                    except Exception:
+                        cls.__logger.error(
+                            f"Error while persisting the data of data node {data_node.id}.", exc_info=True
+                        )
+                current._track_persistence(job_id, written)
+
+        with cls.__lock:
+            if cls.__persistence_executor is None:
+                cls.__persistence_executor = ThreadPoolExecutor(1, thread_name_prefix="Thread-Taipy-Persistence")
+            future = cls.__persistence_executor.submit(persist)
+            cls.__pending_persistences.add(future)
+        future.add_done_callback(cls.__on_persisted)
+
+    @classmethod
+    def __on_persisted(cls, future: Future):
+        with cls.__lock:
+            cls.__pending_persistences.discard(future)
@@ -30,8 +30,10 @@ from .._entity._reload import _Reloader, _self_reload, _self_setter
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..exceptions.exceptions import DataNodeIsBeingEdited, NoData
 from ..job.job_id import JobId
+from ..notification import Notifier
 from ..notification.event import Event, EventEntityType, EventOperation, _make_event
 from ..reason import DataNodeEditInProgress, DataNodeIsNotWritten
+from ._data_fingerprint import _DataFingerprint
 from ._filter import _FilterDataNode
 from .data_node_id import DataNodeId, Edit
 from .operator import JoinOperator
@@ -42,18 +44,22 @@ def _update_ready_for_reading(fct):
     @functools.wraps(fct)
     def _recompute_is_ready_for_reading(dn: "DataNode", *args, **kwargs):
         fct(dn, *args, **kwargs)
-        if dn._edit_in_progress:
-            _ReadyToRunProperty._add(dn, DataNodeEditInProgress(dn.id))
-        else:
-            _ReadyToRunProperty._remove(dn, DataNodeEditInProgress(dn.id))
-        if not dn._last_edit_date:
-            _ReadyToRunProperty._add(dn, DataNodeIsNotWritten(dn.id))
-        else:
-            _ReadyToRunProperty._remove(dn, DataNodeIsNotWritten(dn.id))
+        _compute_is_ready_for_reading(dn)
 
     return _recompute_is_ready_for_reading
 
 
+def _compute_is_ready_for_reading(dn: "DataNode"):
+    if dn._edit_in_progress:
+        _ReadyToRunProperty._add(dn, DataNodeEditInProgress(dn.id))
+    else:
+        _ReadyToRunProperty._remove(dn, DataNodeEditInProgress(dn.id))
+    if not dn._last_edit_date:
+        _ReadyToRunProperty._add(dn, DataNodeIsNotWritten(dn.id))
+    else:
+        _ReadyToRunProperty._remove(dn, DataNodeIsNotWritten(dn.id))
+
+
 class DataNode(_Entity, _Labeled):
     """Reference to a dataset.
 
@@ -107,6 +113,9 @@ class DataNode(_Entity, _Labeled):
     _REQUIRED_PROPERTIES: List[str] = []
     _MANAGER_NAME: str = "data"
     _PATH_KEY = "path"
+    # The edit option of a write whose data is not written to the storage yet.
+    _PENDING_PERSISTENCE_KEY = "pending_persistence"
+    _TRANSIENT_KEY = "transient"
     __EDIT_TIMEOUT = 30
 
     _TAIPY_PROPERTIES: Set[str] = set()
@@ -399,6 +408,14 @@ class DataNode(_Entity, _Labeled):
         """
         if not self.last_edit_date:
             raise NoData(f"Data node {self.id} from config {self.config_id} has not been written yet.")
+        if (edits := self.edits) and edits[-1].get(self._TRANSIENT_KEY):
+            from ._shared_memory_handoff import _SharedMemoryHandoff
+
+            return _SharedMemoryHandoff._read_transient(self, edits[-1])
+        if edits and edits[-1].get(self._PENDING_PERSISTENCE_KEY):
+            from ._shared_memory_handoff import _SharedMemoryHandoff
+
+            return _SharedMemoryHandoff._read_pending(self, edits[-1])
         return self._read()
 
     def read(self) -> Any:
@@ -424,12 +441,10 @@ class DataNode(_Entity, _Labeled):
             **kwargs (dict[str, any]): Extra information to attach to the edit document
                 corresponding to this write.
         """
-        from ._data_manager_factory import _DataManagerFactory
-
         self._append(data)
-        self.track_edit(job_id=job_id, **kwargs)
-        self.unlock_edit()
-        _DataManagerFactory._build_manager()._set(self)
+        self.__save_edit(self.__build_edit(job_id=job_id, **kwargs))
+        if job_id is None:
+            self.__notify_ready()
 
     def write(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
         """Write some data to this data node.
@@ -438,14 +453,44 @@ class DataNode(_Entity, _Labeled):
             data (Any): The data to write to this data node.
             job_id (JobId): An optional identifier of the writer.
             **kwargs (dict[str, any]): Extra information to attach to the edit document
-                corresponding to this write.
+                corresponding to this write.<br/>
+                The *fingerprint* option is a version token of the data, e.g. provided by its source. If
+                not provided and the data node is configured with the *"fingerprint"* property, a hash of
+                the data is recorded.
         """
-        from ._data_manager_factory import _DataManagerFactory
-
         self._write(data)
-        self.track_edit(job_id=job_id, **kwargs)
-        self.unlock_edit()
-        _DataManagerFactory._build_manager()._set(self)
+        kwargs = _DataFingerprint._add_to_edit_options(self, data, kwargs)
+        self.__save_edit(self.__build_edit(job_id=job_id, **kwargs))
+        if job_id is None:
+            self.__notify_ready()
+
+    def _track_write(self, data, job_id: Optional[JobId] = None, **kwargs: Dict[str, Any]):
+        """Track a write of data that is not written to the storage yet, e.g. handed off in shared memory."""
+        kwargs = _DataFingerprint._add_to_edit_options(self, data, kwargs)
+        self.__save_edit(self.__build_edit(timestamp=datetime.now(), job_id=job_id, **kwargs))
+
+    def _track_persistence(self, job_id: JobId, written: bool):
+        """Track the end of the persistence of the data of a write tracked with a pending persistence.
+
+        Parameters:
+            job_id (JobId): The identifier of the writer.
+            written (bool): True if the data was written to the storage, False if it was not, e.g. because
+                it was superseded by the data of a later write.
+        """
+        for edit in reversed(self._edits):
+            if edit.get("job_id") == job_id and edit.pop(self._PENDING_PERSISTENCE_KEY, None):
+                if written:
+                    # The edit dates the data of the storage, which is not more recent than the edit then.
+                    edit["timestamp"] = (
+                        self._get_last_modified_datetime(self._properties.get(self._PATH_KEY, None)) or datetime.now()
+                    )
+                break
+        self.__set_attributes(save_self=True, last_edit_date=self._edits[-1].get("timestamp"))
+
+    def _invalidate_transient_edit(self, job_id: JobId):
+        """Invalidate the data node if its last edit is a transient write of the job, whose data is lost."""
+        if self._edits and self._edits[-1].get("job_id") == job_id and self._edits[-1].get(self._TRANSIENT_KEY):
+            self.__set_attributes(save_self=True, last_edit_date=None)
 
     def track_edit(self, **options):
         """Creates and adds a new entry in the edits attribute without writing the data.
@@ -454,11 +499,7 @@ class DataNode(_Entity, _Labeled):
             options (dict[str, any]): track `timestamp`, `comments`, `job_id`. The others are user-custom, users can
                 use options to attach any information to an external edit of a data node.
         """
-        edit = {k: v for k, v in options.items() if v is not None}
-        if "timestamp" not in edit:
-            edit["timestamp"] = (
-                self._get_last_modified_datetime(self._properties.get(self._PATH_KEY, None)) or datetime.now()
-            )
+        edit = self.__build_edit(**options)
         self.last_edit_date = edit.get("timestamp")
         self._edits.append(edit)
 
@@ -479,12 +520,13 @@ class DataNode(_Entity, _Labeled):
                 and self.editor_expiration_date > datetime.now()
             ):
                 raise DataNodeIsBeingEdited(self.id, self._editor_id)
-            self.editor_id = editor_id  # type: ignore
-            self.editor_expiration_date = datetime.now() + timedelta(minutes=self.__EDIT_TIMEOUT)  # type: ignore
+            self.__set_attributes(
+                editor_id=editor_id,
+                editor_expiration_date=datetime.now() + timedelta(minutes=self.__EDIT_TIMEOUT),
+                edit_in_progress=True,
+            )
         else:
-            self.editor_id = None  # type: ignore
-            self.editor_expiration_date = None  # type: ignore
-        self.edit_in_progress = True  # type: ignore
+            self.__set_attributes(editor_id=None, editor_expiration_date=None, edit_in_progress=True)
 
     def unlock_edit(self, editor_id: Optional[str] = None):
         """Unlocks the data node modification.
@@ -503,9 +545,12 @@ class DataNode(_Entity, _Labeled):
         ):
             raise DataNodeIsBeingEdited(self.id, self._editor_id)
 
-        self.editor_id = None
-        self.editor_expiration_date = None
-        self.edit_in_progress = False
+        self._unlock_edit()
+        self.__notify_ready()
+
+    def _unlock_edit(self):
+        """Unlock the data node modification, without unblocking the jobs reading it."""
+        self.__set_attributes(editor_id=None, editor_expiration_date=None, edit_in_progress=False)
 
     def filter(self, operators: Union[List, Tuple], join_operator=JoinOperator.AND) -> Any:
         """Read and filter the data referenced by this data node.
@@ -606,6 +651,63 @@ class DataNode(_Entity, _Labeled):
 
         return last_modified_datetime
 
+    def __build_edit(self, **options) -> Edit:
+        edit = {k: v for k, v in options.items() if v is not None}
+        if "timestamp" not in edit:
+            edit["timestamp"] = (
+                self._get_last_modified_datetime(self._properties.get(self._PATH_KEY, None)) or datetime.now()
+            )
+        return edit  # type: ignore
+
+    def __notify_ready(self):
+        """Let the orchestrator unblock the jobs waiting for this data node, written or unlocked outside of jobs.
+
+        The jobs writing their outputs unblock the jobs reading them once they are finished.
+        """
+        from .._orchestrator._orchestrator_factory import _OrchestratorFactory
+
+        if not self._is_in_context and (orchestrator := _OrchestratorFactory._orchestrator) is not None:
+            orchestrator._on_data_node_ready(self.id)
+
+    def __save_edit(self, edit: Edit):
+        """Track the edit and release the edit lock with a single write of the data node."""
+        self._edits.append(edit)
+        self.__set_attributes(
+            save_self=True,
+            last_edit_date=edit.get("timestamp"),
+            editor_id=None,
+            editor_expiration_date=None,
+            edit_in_progress=False,
+        )
+
+    def __set_attributes(self, save_self: bool = False, **attributes):
+        """Set several attributes at once, with a single repository write.
+
+        The attributes are set on this data node. Unless *save_self* is True, they are also set on
+        a freshly reloaded copy of the data node, which is the one saved. As with the attribute
+        setters, no write happens in context and the update events are published on exit.
+        """
+        from ._data_manager_factory import _DataManagerFactory
+
+        events = [
+            _make_event(self, EventOperation.UPDATE, attribute_name=name, attribute_value=value)
+            for name, value in attributes.items()
+        ]
+        for name, value in attributes.items():
+            setattr(self, f"_{name}", value)
+        if self._is_in_context:
+            self._in_context_attributes_changed_collector.extend(events)
+            if save_self:
+                _DataManagerFactory._build_manager()._set(self)
+        else:
+            data_node = self if save_self else _Reloader()._reload(self._MANAGER_NAME, self)
+            for name, value in attributes.items():
+                setattr(data_node, f"_{name}", value)
+            _DataManagerFactory._build_manager()._set(data_node)
+            for event in events:
+                Notifier.publish(event)
+        _compute_is_ready_for_reading(self)
+
     @staticmethod
     def _class_map():
         def all_subclasses(cls):
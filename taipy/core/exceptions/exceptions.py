@@ -340,6 +340,23 @@ class ModeNotAvailable(Exception):
     """Raised if the mode in JobConfig is not supported."""
 
 
+class WorkerLost(RuntimeError):
+    """Raised if the remote workers running a job were lost too many times for the job to be put back to run."""
+
+    def __init__(self, job_id: str, worker_name: str):
+        self.message = f"Job {job_id} was put back to run too many times, the last worker lost being {worker_name}."
+
+
+class MissingWorkerAuthKey(Exception):
+    """Raised if the remote job execution mode is used without an authentication key."""
+
+    def __init__(self):
+        self.message = (
+            "The remote job execution mode requires an authentication key: the messages exchanged with the "
+            "workers are pickled, so anyone able to connect could run code on the orchestrator host."
+        )
+
+
 class NonExistingVersion(Exception):
     """Raised if request a Version that is not known by the Version Manager."""
 
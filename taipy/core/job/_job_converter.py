@@ -10,14 +10,15 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime
-from typing import List
+from typing import Dict, Iterable, List
 
 from .._repository._abstract_converter import _AbstractConverter
 from ..common._utils import _fcts_to_dict, _load_fct
-from ..exceptions import InvalidSubscriber
+from ..exceptions import InvalidSubscriber, ModelNotFound
 from ..job._job_model import _JobModel
 from ..job.job import Job
 from ..task._task_manager_factory import _TaskManagerFactory
+from ..task.task import Task
 
 
 class _JobConverter(_AbstractConverter):
@@ -39,12 +40,22 @@ class _JobConverter(_AbstractConverter):
 
     @classmethod
     def _model_to_entity(cls, model: _JobModel) -> Job:
-        task_manager = _TaskManagerFactory._build_manager()
-        task_repository = task_manager._repository
+        return cls._models_to_entities([model])[0]
+
+    @classmethod
+    def _models_to_entities(cls, models: Iterable[_JobModel]) -> List[Job]:
+        models = list(models)
+        tasks = _TaskManagerFactory._build_manager()._get_many(model.task_id for model in models)
+        return [cls.__to_job(model, tasks) for model in models]
+
+    @classmethod
+    def __to_job(cls, model: _JobModel, tasks: Dict[str, Task]) -> Job:
+        if (task := tasks.get(model.task_id)) is None:
+            raise ModelNotFound(Task.__name__, model.task_id)
 
         job = Job(
             id=model.id,
-            task=task_repository._load(model.task_id),
+            task=task,
             submit_id=model.submit_id,
             submit_entity_id=model.submit_entity_id,
             version=model.version,
@@ -10,7 +10,8 @@
 # specific language governing permissions and limitations under the License.
 
 import uuid
-from typing import Callable, Iterable, List, Optional, Union
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 from .._manager._manager import _Manager
 from .._repository._abstract_repository import _AbstractRepository
@@ -26,10 +27,17 @@ from .job_id import JobId
 
 class _JobManager(_Manager[Job], _VersionMixin):
     _ENTITY_NAME = Job.__name__
+    _INDEX_LATEST_ENTITIES = True
     _ID_PREFIX = "JOB_"
     _repository: _AbstractRepository
     _EVENT_ENTITY_TYPE = EventEntityType.JOB
 
+    @classmethod
+    def _refresh_references(cls, job: Job):
+        from ..task._task_manager_factory import _TaskManagerFactory
+
+        job._task = _TaskManagerFactory._build_manager()._get(job._task.id, job._task)
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[Job]:
         """
@@ -42,21 +50,34 @@ class _JobManager(_Manager[Job], _VersionMixin):
     def _create(
         cls, task: Task, callbacks: Iterable[Callable], submit_id: str, submit_entity_id: str, force=False
     ) -> Job:
-        version = _VersionManagerFactory._build_manager()._get_latest_version()
-        job = Job(
-            id=JobId(f"{Job._ID_PREFIX}_{task.config_id}_{uuid.uuid4()}"),
-            task=task,
-            submit_id=submit_id,
-            submit_entity_id=submit_entity_id,
-            force=force,
-            version=version,
-        )
-        job._on_status_change(*callbacks)
-        cls._set(job)
+        return cls._create_many([(task, callbacks, submit_id, submit_entity_id)], force=force)[0]
 
-        Notifier.publish(_make_event(job, EventOperation.CREATION))
-
-        return job
+    @classmethod
+    def _create_many(
+        cls, jobs_to_create: Iterable[Tuple[Task, Iterable[Callable], str, str]], force=False
+    ) -> List[Job]:
+        """Create several jobs from (task, callbacks, submit id, submit entity id) tuples, with batched writes."""
+        version = _VersionManagerFactory._build_manager()._get_latest_version()
+        jobs = []
+        for task, callbacks, submit_id, submit_entity_id in jobs_to_create:
+            job = Job(
+                id=JobId(f"{Job._ID_PREFIX}_{task.config_id}_{uuid.uuid4()}"),
+                task=task,
+                submit_id=submit_id,
+                submit_entity_id=submit_entity_id,
+                force=force,
+                version=version,
+            )
+            job._on_status_change(*callbacks)
+            jobs.append(job)
+        cls._set_many(jobs)
+
+        latest_entity_index = cls._latest_entity_index()
+        for job in jobs:
+            latest_entity_index._add(job._task.id, job._creation_date, job.id)  # type: ignore
+            Notifier.publish(_make_event(job, EventOperation.CREATION))
+
+        return jobs
 
     @classmethod
     def _delete(cls, job: Union[Job, JobId], force=False) -> None:
@@ -79,13 +100,30 @@ class _JobManager(_Manager[Job], _VersionMixin):
 
     @classmethod
     def _get_latest(cls, task: Task) -> Optional[Job]:
-        jobs_of_task = list(filter(lambda job: task in job, cls._get_all()))
-        if len(jobs_of_task) == 0:
-            return None
-        if len(jobs_of_task) == 1:
-            return jobs_of_task[0]
-        else:
-            return max(jobs_of_task)
+        index = cls._latest_entity_index()
+        filters = cls._build_filters_with_version(None)
+        versions = {_filter["version"] for _filter in filters}
+
+        def entries(jobs: Iterable[Job]) -> Iterable[Tuple[str, datetime, str]]:
+            return (
+                (job._task.id, job._creation_date, job.id) for job in jobs if not versions or job._version in versions
+            )
+
+        for _ in range(2):
+            job_id = index._get(  # type: ignore
+                task.id,
+                lambda: entries(cls._get_all()),
+                str(filters),
+                cls._repository._list_ids,
+                lambda new_ids: entries(cls._repository._load_many(new_ids).values()),
+            )
+            if job_id is None:
+                return None
+            if job := cls._get(job_id):
+                return job
+            # The job was deleted behind the index back.
+            index._clear()  # type: ignore
+        return None
 
     @classmethod
     def _is_deletable(cls, job: Union[Job, JobId]) -> ReasonCollection:
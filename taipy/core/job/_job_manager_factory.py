@@ -15,11 +15,17 @@ from .._manager._manager_factory import _ManagerFactory
 from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ._job_fs_repository import _JobFSRepository
+from ._job_journal_repository import _JobJournalRepository
 from ._job_manager import _JobManager
+from ._job_sql_repository import _JobSQLRepository
 
 
 class _JobManagerFactory(_ManagerFactory):
-    __REPOSITORY_MAP = {"default": _JobFSRepository}
+    __REPOSITORY_MAP = {
+        "default": _JobFSRepository,
+        "sql": _JobSQLRepository,
+        "journal": _JobJournalRepository,
+    }
 
     @classmethod
     @lru_cache
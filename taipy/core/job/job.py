@@ -465,8 +465,9 @@ class Job(_Entity, _Labeled):
         return {"task_config_id": self._task.config_id}
 
     def _unlock_edit_on_outputs(self) -> None:
+        # The jobs reading the outputs are unblocked, failed or abandoned once this job is finished.
         for dn in self.task.output.values():
-            dn.unlock_edit()
+            dn._unlock_edit()
 
     @staticmethod
     def _serialize_subscribers(subscribers: List) -> List:
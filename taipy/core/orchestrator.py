@@ -19,6 +19,7 @@ from ._cli._core_cli_factory import _CoreCLIFactory
 from ._orchestrator._dispatcher._job_dispatcher import _JobDispatcher
 from ._orchestrator._orchestrator import _Orchestrator
 from ._orchestrator._orchestrator_factory import _OrchestratorFactory
+from ._orchestrator._retention_worker import _RetentionWorker
 from ._version._version_manager_factory import _VersionManagerFactory
 from .config import CoreSection
 from .exceptions.exceptions import OrchestratorServiceIsAlreadyRunning
@@ -45,6 +46,7 @@ class Orchestrator:
 
     _orchestrator: Optional[_Orchestrator] = None
     _dispatcher: Optional[_JobDispatcher] = None
+    _retention_worker: Optional[_RetentionWorker] = None
 
     def __init__(self) -> None:
         """Initialize an Orchestrator service."""
@@ -54,7 +56,8 @@ class Orchestrator:
         """ Start the Orchestrator service.
 
         This function checks and locks the configuration, manages application's version,
-        and starts a job dispatcher.
+        and starts a job dispatcher. If a retention policy is configured, it also starts a worker
+        archiving the finished jobs and submissions.
         """
         if self.__class__._is_running:
             raise OrchestratorServiceIsAlreadyRunning
@@ -64,6 +67,7 @@ class Orchestrator:
 
         self._manage_version_and_block_config()
         self.__start_dispatcher(force_restart)
+        self.__start_retention_worker()
         self.__logger.info("Orchestrator service has been started.")
 
     def stop(self, wait: bool = True, timeout: Optional[float] = None) -> None:
@@ -80,6 +84,10 @@ class Orchestrator:
         self.__logger.info("Stopping job dispatcher...")
         if self._dispatcher:
             self._dispatcher = _OrchestratorFactory._remove_dispatcher(wait, timeout)
+        if self._retention_worker:
+            self.__logger.info("Stopping retention worker...")
+            self._retention_worker.stop(wait, timeout)
+            self._retention_worker = None
         with self.__class__.__lock_is_running:
             self.__class__._is_running = False
         with self.__class__.__lock_version_is_initialized:
@@ -131,3 +139,10 @@ class Orchestrator:
 
         if Config.job_config.is_development:
             _Orchestrator._check_and_execute_jobs_if_development_mode()
+
+    def __start_retention_worker(self):
+        if not _RetentionWorker._is_enabled():
+            return
+        self.__logger.info("Starting retention worker...")
+        self._retention_worker = _RetentionWorker()
+        self._retention_worker.start()
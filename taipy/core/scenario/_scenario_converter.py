@@ -10,12 +10,10 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Set, Union
 
 from .._repository._abstract_converter import _AbstractConverter
 from ..common import _utils
-from ..cycle._cycle_manager_factory import _CycleManagerFactory
-from ..cycle.cycle import Cycle, CycleId
 from ..data.data_node import DataNode, DataNodeId
 from ..scenario._scenario_model import _ScenarioModel
 from ..scenario.scenario import Scenario
@@ -49,7 +47,7 @@ class _ScenarioConverter(_AbstractConverter):
             subscribers=_utils._fcts_to_dict(scenario._subscribers),
             tags=list(scenario._tags),
             version=scenario._version,
-            cycle=scenario._cycle.id if scenario._cycle else None,
+            cycle=scenario._cycle_id,
             sequences=sequences if sequences else None,
         )
 
@@ -75,7 +73,8 @@ class _ScenarioConverter(_AbstractConverter):
             creation_date=datetime.fromisoformat(model.creation_date),
             is_primary=model.primary_scenario,
             tags=set(model.tags),
-            cycle=cls.__to_cycle(model.cycle),
+            # The cycle is only loaded when first accessed.
+            cycle=model.cycle,
             subscribers=[
                 _utils._Subscriber(_utils._load_fct(it["fct_module"], it["fct_name"]), it["fct_params"])
                 for it in model.subscribers
@@ -83,7 +82,3 @@ class _ScenarioConverter(_AbstractConverter):
             version=model.version,
             sequences=model.sequences,
         )
-
-    @staticmethod
-    def __to_cycle(cycle_id: Optional[CycleId] = None) -> Optional[Cycle]:
-        return _CycleManagerFactory._build_manager()._get(cycle_id) if cycle_id else None
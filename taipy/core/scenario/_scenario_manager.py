@@ -62,6 +62,11 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
 
     _repository: _AbstractRepository
 
+    @classmethod
+    def _refresh_references(cls, scenario: Scenario):
+        # The tasks and the additional data nodes are resolved at each access, unlike the cycle.
+        scenario._set_cycle_id(scenario._cycle_id)
+
     @classmethod
     def _get_all(cls, version_number: Optional[str] = None) -> List[Scenario]:
         """
@@ -242,7 +247,7 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         if scenario is None or not cls._exists(scenario_id):
             raise NonExistingScenario(scenario_id)
         callbacks = callbacks or []
-        scenario_subscription_callback = cls.__get_status_notifier_callbacks(scenario) + callbacks
+        scenario_subscription_callback = cls._get_status_notifier_callbacks(scenario) + callbacks
         if check_inputs_are_ready:
             _warn_if_inputs_not_ready(scenario.get_inputs())
 
@@ -262,7 +267,7 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         return submission
 
     @classmethod
-    def __get_status_notifier_callbacks(cls, scenario: Scenario) -> List:
+    def _get_status_notifier_callbacks(cls, scenario: Scenario) -> List:
         return [partial(c.callback, *c.params, scenario) for c in scenario.subscribers]
 
     @classmethod
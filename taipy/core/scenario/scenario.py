@@ -27,6 +27,7 @@ from .._version._version_manager_factory import _VersionManagerFactory
 from ..common._listattributes import _ListAttributes
 from ..common._utils import _Subscriber
 from ..cycle.cycle import Cycle
+from ..cycle.cycle_id import CycleId
 from ..data.data_node import DataNode
 from ..data.data_node_id import DataNodeId
 from ..exceptions.exceptions import (
@@ -115,7 +116,7 @@ class Scenario(_Entity, Submittable, _Labeled):
         scenario_id: Optional[ScenarioId] = None,
         creation_date: Optional[datetime] = None,
         is_primary: bool = False,
-        cycle: Optional[Cycle] = None,
+        cycle: Optional[Union[Cycle, CycleId]] = None,
         subscribers: Optional[List[_Subscriber]] = None,
         tags: Optional[Set[str]] = None,
         version: str = None,
@@ -129,7 +130,9 @@ class Scenario(_Entity, Submittable, _Labeled):
         self._additional_data_nodes: Union[Set[DataNodeId], Set[DataNode], Set] = additional_data_nodes or set()
 
         self._creation_date = creation_date or datetime.now()
-        self._cycle = cycle
+        # A scenario referencing its cycle by id only loads it when first accessed.
+        self.__cycle: Optional[Cycle] = None if isinstance(cycle, str) else cycle
+        self.__cycle_id: Optional[CycleId] = cycle if isinstance(cycle, str) else (cycle.id if cycle else None)
         self._primary_scenario = is_primary
         self._tags = tags or set()
         self._properties = _Properties(self, **properties)
@@ -267,6 +270,28 @@ class Scenario(_Entity, Submittable, _Labeled):
     def creation_date(self, val) -> None:
         self._creation_date = val
 
+    @property
+    def _cycle(self) -> Optional[Cycle]:
+        if self.__cycle is None and self.__cycle_id is not None:
+            from ..cycle._cycle_manager_factory import _CycleManagerFactory
+
+            self.__cycle = _CycleManagerFactory._build_manager()._get(self.__cycle_id)
+        return self.__cycle
+
+    @_cycle.setter
+    def _cycle(self, val: Optional[Cycle]):
+        self.__cycle = val
+        self.__cycle_id = val.id if val else None
+
+    @property
+    def _cycle_id(self) -> Optional[CycleId]:
+        return self.__cycle_id
+
+    def _set_cycle_id(self, cycle_id: Optional[CycleId]):
+        """Reference the cycle by id, to only load it when first accessed."""
+        self.__cycle = None
+        self.__cycle_id = cycle_id
+
     @property  # type: ignore
     @_self_reload(_MANAGER_NAME)
     def cycle(self) -> Optional[Cycle]:
@@ -322,7 +347,7 @@ class Scenario(_Entity, Submittable, _Labeled):
     @property
     def owner_id(self) -> Optional[str]:
         """The identifier of the scenario cycle."""
-        return self._cycle.id if self._cycle else None
+        return self._cycle_id
 
     @property
     def properties(self) -> _Properties:
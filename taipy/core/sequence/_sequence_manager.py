@@ -160,13 +160,13 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
         version: Optional[str] = None,
     ) -> Sequence:
         sequence_id = Sequence._new_id(sequence_name, scenario_id)
-        _tasks = cls.__get_sequence_tasks(tasks)
         properties = properties if properties else {}
         properties["name"] = sequence_name
         version = version if version else cls._get_latest_version()
+        # Tasks referenced by id are only loaded when the sequence tasks are first accessed.
         return Sequence(
             properties=properties,
-            tasks=_tasks,
+            tasks=tasks,
             sequence_id=sequence_id,
             owner_id=scenario_id,
             parent_ids={scenario_id} if scenario_id else None,
@@ -234,7 +234,7 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
             raise InvalidSequenceId(sequence_id) from None
 
     @classmethod
-    def _get(cls, sequence: Union[str, Sequence], default=None) -> Sequence:
+    def _get(cls, sequence: Union[str, Sequence], default=None, cached: bool = True) -> Sequence:
         """
         Returns a Sequence by id or reference.
         """
@@ -243,7 +243,7 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
             sequence_name, scenario_id = cls._breakdown_sequence_id(sequence_id)
 
             scenario_manager = _ScenarioManagerFactory._build_manager()
-            if scenario := scenario_manager._get(scenario_id):
+            if scenario := scenario_manager._get(scenario_id, cached=cached):
                 if sequence_entity := scenario.sequences.get(sequence_name, None):
                     return sequence_entity
             cls.__log_error_entity_not_found(sequence_id)
@@ -374,7 +374,7 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
         if sequence is None:
             raise NonExistingSequence(sequence_id)
         callbacks = callbacks or []
-        sequence_subscription_callback = cls.__get_status_notifier_callbacks(sequence) + callbacks
+        sequence_subscription_callback = cls._get_status_notifier_callbacks(sequence) + callbacks
         if check_inputs_are_ready:
             _warn_if_inputs_not_ready(sequence.get_inputs())
 
@@ -410,5 +410,5 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
         cls._logger.error(f"{cls._ENTITY_NAME} not found: {str(sequence_id)}")
 
     @staticmethod
-    def __get_status_notifier_callbacks(sequence: Sequence) -> List:
+    def _get_status_notifier_callbacks(sequence: Sequence) -> List:
         return [partial(c.callback, *c.params, sequence) for c in sequence.subscribers]
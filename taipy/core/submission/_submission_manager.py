@@ -9,8 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from datetime import datetime
 from threading import Lock
-from typing import List, Optional, Union
+from typing import Iterable, List, Optional, Tuple, Union
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
@@ -30,6 +31,7 @@ from ..task.task import Task
 
 class _SubmissionManager(_Manager[Submission], _VersionMixin):
     _ENTITY_NAME = Submission.__name__
+    _INDEX_LATEST_ENTITIES = True
     _repository: _AbstractRepository
     _EVENT_ENTITY_TYPE = EventEntityType.SUBMISSION
     __lock = Lock()
@@ -45,14 +47,27 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
 
     @classmethod
     def _create(cls, entity_id: str, entity_type: str, entity_config: Optional[str], **properties) -> Submission:
-        submission = Submission(
-            entity_id=entity_id, entity_type=entity_type, entity_config_id=entity_config, properties=properties
-        )
-        cls._set(submission)
+        return cls._create_many([(entity_id, entity_type, entity_config)], **properties)[0]
 
-        Notifier.publish(_make_event(submission, EventOperation.CREATION))
+    @classmethod
+    def _create_many(
+        cls, submissions_to_create: Iterable[Tuple[str, str, Optional[str]]], **properties
+    ) -> List[Submission]:
+        """Create several submissions from (entity id, entity type, entity config) tuples, with batched writes."""
+        submissions = [
+            Submission(
+                entity_id=entity_id, entity_type=entity_type, entity_config_id=entity_config, properties=properties
+            )
+            for entity_id, entity_type, entity_config in submissions_to_create
+        ]
+        cls._set_many(submissions)
 
-        return submission
+        latest_entity_index = cls._latest_entity_index()
+        for submission in submissions:
+            latest_entity_index._add(submission._entity_id, submission._creation_date, submission.id)  # type: ignore
+            Notifier.publish(_make_event(submission, EventOperation.CREATION))
+
+        return submissions
 
     @classmethod
     def _update_submission_status(cls, submission: Submission, job: Job) -> None:
@@ -77,6 +92,8 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
             elif job_status == Status.PENDING or job_status == Status.SUBMITTED:
                 submission._pending_jobs.add(job.id)
                 submission._blocked_jobs.discard(job.id)
+                # A running job is pending again when it is put back to run.
+                submission._running_jobs.discard(job.id)
             elif job_status == Status.RUNNING:
                 submission._running_jobs.add(job.id)
                 submission._pending_jobs.discard(job.id)
@@ -138,13 +155,30 @@ class _SubmissionManager(_Manager[Submission], _VersionMixin):
     @classmethod
     def _get_latest(cls, entity: Union[Scenario, Sequence, Task]) -> Optional[Submission]:
         entity_id = entity.id if not isinstance(entity, str) else entity
-        submissions_of_task = list(filter(lambda submission: submission.entity_id == entity_id, cls._get_all()))
-        if len(submissions_of_task) == 0:
-            return None
-        if len(submissions_of_task) == 1:
-            return submissions_of_task[0]
-        else:
-            return max(submissions_of_task)
+        index = cls._latest_entity_index()
+        filters = cls._build_filters_with_version(None)
+        versions = {_filter["version"] for _filter in filters}
+
+        def entries(submissions: Iterable[Submission]) -> Iterable[Tuple[str, datetime, str]]:
+            return (
+                (s._entity_id, s._creation_date, s.id) for s in submissions if not versions or s._version in versions
+            )
+
+        for _ in range(2):
+            submission_id = index._get(  # type: ignore
+                entity_id,
+                lambda: entries(cls._get_all()),
+                str(filters),
+                cls._repository._list_ids,
+                lambda new_ids: entries(cls._repository._load_many(new_ids).values()),
+            )
+            if submission_id is None:
+                return None
+            if submission := cls._get(submission_id):
+                return submission
+            # The submission was deleted behind the index back.
+            index._clear()  # type: ignore
+        return None
 
     @classmethod
     def _delete(cls, submission: Union[Submission, SubmissionId]) -> None:
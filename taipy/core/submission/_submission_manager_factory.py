@@ -15,11 +15,17 @@ from .._manager._manager_factory import _ManagerFactory
 from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ._submission_fs_repository import _SubmissionFSRepository
+from ._submission_journal_repository import _SubmissionJournalRepository
 from ._submission_manager import _SubmissionManager
+from ._submission_sql_repository import _SubmissionSQLRepository
 
 
 class _SubmissionManagerFactory(_ManagerFactory):
-    __REPOSITORY_MAP = {"default": _SubmissionFSRepository}
+    __REPOSITORY_MAP = {
+        "default": _SubmissionFSRepository,
+        "sql": _SubmissionSQLRepository,
+        "journal": _SubmissionJournalRepository,
+    }
 
     @classmethod
     @lru_cache
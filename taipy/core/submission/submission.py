@@ -307,6 +307,38 @@ class Submission(_Entity, _Labeled):
             SubmissionStatus.CANCELED,
         ]
 
+    def _is_finished(self) -> bool:
+        """Indicate if the submission is finished.
+
+        This function will not trigger the persistence feature unlike is_finished().
+
+        Returns:
+            True if the submission is finished.
+        """
+        return self._submission_status in [
+            SubmissionStatus.COMPLETED,
+            SubmissionStatus.FAILED,
+            SubmissionStatus.CANCELED,
+        ]
+
+    async def wait_async(self, timeout: Optional[Union[float, int]] = None) -> bool:
+        """Wait for the jobs of the submission to be finished, without blocking the running event loop.
+
+        The waiting coroutine is woken up by the status changes of the submission jobs rather than by
+        polling, so that a single event loop can wait for many submissions concurrently.
+
+        Parameters:
+            timeout (Union[float, int]): The optional maximum number of seconds to wait.<br/>
+                If not provided, the coroutine waits indefinitely.
+
+        Returns:
+            True if all the jobs of the submission are finished.
+        """
+        from .._orchestrator._orchestrator_factory import _OrchestratorFactory
+
+        orchestrator = _OrchestratorFactory._build_orchestrator()
+        return await orchestrator._wait_until_submission_finished_async(self, timeout)  # type: ignore[attr-defined]
+
     def is_deletable(self) -> ReasonCollection:
         """Indicate if the submission can be deleted.
 
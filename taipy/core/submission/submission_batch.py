@@ -0,0 +1,83 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Iterator, List, Optional, Union
+
+from ..job.job import Job
+from .submission import Submission
+
+
+class SubmissionBatch:
+    """Submissions created at once by `taipy.submit_many()^`.
+
+    The batch gives access to the submissions, in the order of the submitted entities, and to
+    all their jobs. It can be waited on until all the jobs are finished.
+
+    ??? example
+
+        ```python
+        import taipy as tp
+
+        scenarios = [tp.create_scenario(scenario_cfg) for _ in range(1_000)]
+        batch = tp.submit_many(scenarios)
+        if batch.wait(timeout=3600):
+            print(f"{len(batch)} submissions finished.")
+        ```
+    """
+
+    def __init__(self, submissions: List[Submission], jobs: List[Job]):
+        self._submissions = submissions
+        self._jobs = jobs
+
+    @property
+    def submissions(self) -> List[Submission]:
+        """The submissions of the batch, in the order of the submitted entities."""
+        return list(self._submissions)
+
+    @property
+    def jobs(self) -> List[Job]:
+        """The jobs of all the submissions of the batch."""
+        return list(self._jobs)
+
+    def __len__(self) -> int:
+        return len(self._submissions)
+
+    def __iter__(self) -> Iterator[Submission]:
+        return iter(self._submissions)
+
+    def __getitem__(self, index: int) -> Submission:
+        return self._submissions[index]
+
+    def is_finished(self) -> bool:
+        """Indicate if all the jobs of the batch are finished.
+
+        Returns:
+            True if all the jobs of the batch are finished.
+        """
+        return all(job._is_finished() for job in self._jobs)
+
+    def wait(self, timeout: Optional[Union[float, int]] = None) -> bool:
+        """Wait for all the jobs of the batch to be finished.
+
+        The waiting thread is woken up on job status changes, rather than polling every job.
+
+        Parameters:
+            timeout (Union[float, int]): The optional maximum number of seconds to wait.<br/>
+                If not provided, the method waits indefinitely.
+
+        Returns:
+            True if all the jobs of the batch are finished.
+        """
+        from .._orchestrator._orchestrator_factory import _OrchestratorFactory
+
+        orchestrator = _OrchestratorFactory._build_orchestrator()
+        orchestrator._wait_until_job_finished(self._jobs, timeout)  # type: ignore[attr-defined]
+        return self.is_finished()
@@ -9,13 +9,17 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import asyncio
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Literal, Optional, Set, Union, overload
+from functools import partial
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Literal, Optional, Set, Union, overload
 
 from taipy.common.config import Scope
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from ._entity._entity import _Entity
+from ._manager._manager import _Manager
+from ._repository._repository_stats import _RepositoryStats
 from ._version._version_manager_factory import _VersionManagerFactory
 from .common._check_instance import (
     _is_cycle,
@@ -27,6 +31,7 @@ from .common._check_instance import (
     _is_task,
 )
 from .common._warnings import _warn_no_orchestrator_service
+from .common.warn_if_inputs_not_ready import _warn_if_inputs_not_ready
 from .config.data_node_config import DataNodeConfig
 from .config.scenario_config import ScenarioConfig
 from .cycle._cycle_manager_factory import _CycleManagerFactory
@@ -39,6 +44,7 @@ from .exceptions.exceptions import DataNodeConfigIsNotGlobal, ModelNotFound, Non
 from .job._job_manager_factory import _JobManagerFactory
 from .job.job import Job
 from .job.job_id import JobId
+from .notification import EventOperation, Notifier, _make_event
 from .orchestrator import Orchestrator
 from .reason import EntityDoesNotExist, EntityIsNotSubmittableEntity, ReasonCollection
 from .scenario._scenario_manager_factory import _ScenarioManagerFactory
@@ -49,6 +55,7 @@ from .sequence.sequence import Sequence
 from .sequence.sequence_id import SequenceId
 from .submission._submission_manager_factory import _SubmissionManagerFactory
 from .submission.submission import Submission, SubmissionId
+from .submission.submission_batch import SubmissionBatch
 from .task._task_manager_factory import _TaskManagerFactory
 from .task.task import Task
 from .task.task_id import TaskId
@@ -240,7 +247,9 @@ def submit(
             for the jobs to be finished before returning.<br/>
             If not provided and *wait* is True, the function waits indefinitely.
         **properties (dict[str, any]): A key-worded variable length list of user additional arguments
-            that will be stored within the `Submission^`. It can be accessed via `Submission.properties^`.
+            that will be stored within the `Submission^`. It can be accessed via `Submission.properties^`.<br/>
+            The *"priority"* property is an integer giving the priority of the submission jobs over the
+            jobs of other submissions, 0 by default.
 
     Returns:
         The created `Submission^` containing the information about the submission.
@@ -260,6 +269,105 @@ def submit(
     return None
 
 
+async def submit_async(
+    entity: Union[Scenario, Sequence, Task],
+    force: bool = False,
+    wait: bool = True,
+    timeout: Optional[Union[float, int]] = None,
+    **properties,
+) -> Submission:
+    """Submit a scenario, sequence or task entity for execution from a coroutine.
+
+    This function is the asynchronous counterpart of `submit()^`. The entity is submitted from a
+    thread of the event loop default executor, then the jobs are waited for with
+    `Submission.wait_async()^`, so that a single event loop can drive many concurrent submissions.
+
+    ??? example
+
+        ```python
+        import asyncio
+        import taipy as tp
+
+        async def main():
+            scenarios = [tp.create_scenario(scenario_cfg) for _ in range(1_000)]
+            submissions = await asyncio.gather(*(tp.submit_async(s, timeout=3600) for s in scenarios))
+
+        asyncio.run(main())
+        ```
+
+    Parameters:
+        entity (Union[Scenario^, Sequence^, Task^]): The scenario, sequence or task to submit.
+        force (bool): If True, the execution is forced even if for skippable tasks.
+        wait (bool): Wait for the orchestrated jobs created from the submission to be finished
+            before returning. True by default.
+        timeout (Union[float, int]): The optional maximum number of seconds to wait
+            for the jobs to be finished before returning.<br/>
+            If not provided and *wait* is True, the coroutine waits indefinitely.
+        **properties (dict[str, any]): A key-worded variable length list of user additional arguments
+            that will be stored within the `Submission^`. It can be accessed via `Submission.properties^`.
+
+    Returns:
+        The created `Submission^` containing the information about the submission.
+    """
+    loop = asyncio.get_running_loop()
+    submission = await loop.run_in_executor(None, partial(submit, entity, force=force, **properties))
+    if wait and submission is not None:
+        await submission.wait_async(timeout)
+    return submission
+
+
+def submit_many(
+    entities: Iterable[Union[Scenario, Sequence, Task]],
+    force: bool = False,
+    wait: bool = False,
+    timeout: Optional[Union[float, int]] = None,
+    **properties,
+) -> SubmissionBatch:
+    """Submit several scenario, sequence or task entities for execution at once.
+
+    This function is equivalent to calling `submit()^` on every entity, but it creates all the
+    submissions and their jobs with batched repository writes, and orchestrates all the jobs
+    together. It suits the submission of many entities, e.g. in batch runs.
+
+    Parameters:
+        entities (Iterable[Union[Scenario^, Sequence^, Task^]]): The scenarios, sequences or tasks to submit.
+            The entities of other types are ignored.
+        force (bool): If True, the execution is forced even if for skippable tasks.
+        wait (bool): Wait for the orchestrated jobs created from the submissions to be finished
+            in asynchronous mode.
+        timeout (Union[float, int]): The optional maximum number of seconds to wait
+            for the jobs to be finished before returning.<br/>
+            If not provided and *wait* is True, the function waits indefinitely.
+        **properties (dict[str, any]): A key-worded variable length list of user additional arguments
+            that will be stored within every `Submission^`. The *"priority"* property is an integer
+            giving the priority of the submission jobs over the jobs of other submissions, 0 by default.
+
+    Returns:
+        The `SubmissionBatch^` of the created submissions, in the order of the entities. It can be
+            waited on until all the jobs are finished.
+    """
+    entities_to_submit = []
+    for entity in entities:
+        if isinstance(entity, Scenario):
+            callbacks = _ScenarioManagerFactory._build_manager()._get_status_notifier_callbacks(entity)
+            inputs = entity.get_inputs()
+        elif isinstance(entity, Sequence):
+            callbacks = _SequenceManagerFactory._build_manager()._get_status_notifier_callbacks(entity)
+            inputs = entity.get_inputs()
+        elif isinstance(entity, Task):
+            callbacks, inputs = [], entity.input.values()
+        else:
+            continue
+        _warn_if_inputs_not_ready(inputs)
+        entities_to_submit.append((entity, callbacks))
+
+    orchestrator = _TaskManagerFactory._build_manager()._orchestrator()
+    batch = orchestrator.submit_many(entities_to_submit, force=force, wait=wait, timeout=timeout, **properties)
+    for entity, _ in entities_to_submit:
+        Notifier.publish(_make_event(entity, EventOperation.SUBMISSION))
+    return batch
+
+
 @overload
 def exists(entity_id: TaskId) -> ReasonCollection: ...
 
@@ -407,6 +515,56 @@ def get(
     raise ModelNotFound("NOT_DETERMINED", entity_id)
 
 
+def snapshot() -> ContextManager[None]:
+    """Return a context manager reading each entity at most once.
+
+    Within the context, an entity is loaded from the repository the first time it is read. All the
+    following reads of the entity, including the ones made when accessing its properties, are served
+    from that first load until the entity is saved or deleted. This avoids reloading entities over
+    and over when many of their properties are read in a row. Fresh data is read again once the
+    context exits.
+
+    The snapshot only applies to the current thread.
+
+    Example:
+        ```python
+        with tp.snapshot():
+            labels = [(s.config_id, s.creation_date, s.tags) for s in tp.get_scenarios()]
+        ```
+
+    Returns:
+        The context manager to use in a `with` statement.
+    """
+    return _Manager._snapshot()
+
+
+def get_repository_stats(reset: bool = False) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Retrieve the statistics collected on the operations of the filesystem repositories.
+
+    The statistics are only collected when the *"collect_stats"* repository property is set to True
+    (see `Config.configure_core()^`). They are also logged when the process exits.
+
+    For each entity folder (such as "scenarios" or "data_nodes") and each repository operation (such as
+    "load", "load_all" or "get_by_configs_and_owner_ids"), the statistics hold:
+
+    - *count*: The number of calls.
+    - *total_time*, *mean_time* and *max_time*: Latencies, in seconds.
+    - *latency_histogram*: The number of calls per latency bucket.
+    - *bytes_read* and *bytes_written*: The size of the entity files read and written.
+    - *files_scanned*: The number of entity files read.
+    - *full_scans*: The number of times the whole entity folder was listed because the repository
+        index could not narrow down the files to read.
+    - *full_scan_filters*: The attributes filtered on by these full scans, with their number.
+
+    Parameters:
+        reset (bool): If True, the statistics are cleared once retrieved.
+
+    Returns:
+        The statistics, by entity folder and by operation.
+    """
+    return _RepositoryStats._get(reset)
+
+
 def get_tasks() -> List[Task]:
     """Retrieve a list of all existing tasks.
 
@@ -783,6 +941,33 @@ def get_submissions() -> List[Submission]:
     return _SubmissionManagerFactory._build_manager()._get_all()
 
 
+def get_archived_jobs() -> List[Job]:
+    """Return the jobs archived by the retention policy.
+
+    Finished jobs are moved from the repository to an archive according to the *retention_max_age*
+    and *retention_max_count* core properties (see `Config.configure_core()^`). Archived jobs are no
+    longer returned by `get_jobs()` or `get()`, and must not be modified.
+
+    Returns:
+        The list of archived jobs, from the first archived to the last.
+    """
+    return _JobManagerFactory._build_manager()._get_all_archived()
+
+
+def get_archived_submissions() -> List[Submission]:
+    """Return the submissions archived by the retention policy.
+
+    Finished submissions are moved from the repository to an archive according to the
+    *retention_max_age* and *retention_max_count* core properties (see `Config.configure_core()^`).
+    Archived submissions are no longer returned by `get_submissions()` or `get()`, and must not be
+    modified.
+
+    Returns:
+        The list of archived submissions, from the first archived to the last.
+    """
+    return _SubmissionManagerFactory._build_manager()._get_all_archived()
+
+
 def delete_job(job: Job, force: Optional[bool] = False):
     """Delete a job.
 
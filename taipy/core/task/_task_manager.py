@@ -45,6 +45,10 @@ class _TaskManager(_Manager[Task], _VersionMixin):
     _repository: _AbstractRepository
     _EVENT_ENTITY_TYPE = EventEntityType.TASK
 
+    @classmethod
+    def _refresh_references(cls, task: Task):
+        task._set_data_node_ids(*task._get_data_node_ids())
+
     @classmethod
     def _orchestrator(cls) -> Type[_AbstractOrchestrator]:
         from .._orchestrator._orchestrator_factory import _OrchestratorFactory
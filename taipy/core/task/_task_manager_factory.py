@@ -16,10 +16,11 @@ from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ._task_fs_repository import _TaskFSRepository
 from ._task_manager import _TaskManager
+from ._task_sql_repository import _TaskSQLRepository
 
 
 class _TaskManagerFactory(_ManagerFactory):
-    __REPOSITORY_MAP = {"default": _TaskFSRepository}
+    __REPOSITORY_MAP = {"default": _TaskFSRepository, "sql": _TaskSQLRepository}
 
     @classmethod
     @lru_cache
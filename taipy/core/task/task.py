@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import uuid
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from taipy.common.config.common._validate_id import _validate_id
 from taipy.common.config.common.scope import Scope
@@ -21,7 +21,7 @@ from .._entity._properties import _Properties
 from .._entity._reload import _Reloader, _self_reload, _self_setter
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..data.data_node import DataNode
-from ..exceptions import AttributeKeyAlreadyExisted
+from ..exceptions import AttributeKeyAlreadyExisted, NonExistingDataNode
 from ..notification.event import Event, EventEntityType, EventOperation, _make_event
 from ..submission.submission import Submission
 from .task_id import TaskId
@@ -119,8 +119,9 @@ class Task(_Entity, _Labeled):
         self.id = id or TaskId(self.__ID_SEPARATOR.join([self._ID_PREFIX, self.config_id, str(uuid.uuid4())]))
         self._owner_id = owner_id
         self._parent_ids = parent_ids or set()
-        self._input = {dn.config_id: dn for dn in input or []}
-        self._output = {dn.config_id: dn for dn in output or []}
+        self.__input = {dn.config_id: dn for dn in input or []}
+        self.__output = {dn.config_id: dn for dn in output or []}
+        self.__data_node_ids: Optional[Tuple[List[str], List[str]]] = None
         self._function = function
         self._version = version or _VersionManagerFactory._build_manager()._get_latest_version()
         self._skippable = skippable
@@ -180,6 +181,16 @@ class Task(_Entity, _Labeled):
         """The set of identifiers of the parent scenarios."""
         return self._parent_ids
 
+    @property
+    def _input(self) -> Dict[str, DataNode]:
+        self.__load_data_nodes()
+        return self.__input
+
+    @property
+    def _output(self) -> Dict[str, DataNode]:
+        self.__load_data_nodes()
+        return self.__output
+
     @property
     def input(self) -> Dict[str, DataNode]:
         """The dictionary of input data nodes."""
@@ -276,6 +287,30 @@ class Task(_Entity, _Labeled):
 
         return tp.get_parents(self)
 
+    def _set_data_node_ids(self, input_ids: List[str], output_ids: List[str]):
+        """Reference the input and output data nodes by id, to only load them when first accessed."""
+        self.__input, self.__output = {}, {}
+        self.__data_node_ids = (list(input_ids), list(output_ids))
+
+    def _get_data_node_ids(self) -> Tuple[List[str], List[str]]:
+        """Return the ids of the input and output data nodes, without loading them."""
+        if self.__data_node_ids is not None:
+            return self.__data_node_ids
+        return [dn.id for dn in self.__input.values()], [dn.id for dn in self.__output.values()]
+
+    def __load_data_nodes(self):
+        if self.__data_node_ids is None:
+            return
+        from ..data._data_manager_factory import _DataManagerFactory
+
+        input_ids, output_ids = self.__data_node_ids
+        data_nodes = _DataManagerFactory._build_manager()._get_many([*input_ids, *output_ids])
+        if missing_ids := [dn_id for dn_id in (*input_ids, *output_ids) if dn_id not in data_nodes]:
+            raise NonExistingDataNode(missing_ids[0])
+        self.__input = {data_nodes[dn_id].config_id: data_nodes[dn_id] for dn_id in input_ids}
+        self.__output = {data_nodes[dn_id].config_id: data_nodes[dn_id] for dn_id in output_ids}
+        self.__data_node_ids = None
+
     def get_label(self) -> str:
         """Returns the task simple label prefixed by its owner label.
 
@@ -33,6 +33,7 @@ from taipy.core import (
     is_promotable,
     is_readable,
     is_submittable,
+    snapshot,
 )
 from taipy.core import get as core_get
 from taipy.core.config import Config
@@ -72,43 +73,44 @@ class _GuiCoreScenarioAdapter(_TaipyBase):
             data = data[0]
         if isinstance(data, Scenario):
             try:
-                if scenario := core_get(data.id):
-                    return [
-                        scenario.id,
-                        scenario.is_primary,
-                        scenario.config_id,
-                        scenario.creation_date.isoformat(),
-                        scenario.cycle.get_simple_label() if scenario.cycle else "",
-                        scenario.get_simple_label(),
-                        list(scenario.tags) if scenario.tags else [],
-                        [
-                            (k, v)
-                            for k, v in scenario.properties.items()
-                            if k not in _GuiCoreScenarioAdapter.__INNER_PROPS
+                with snapshot():
+                    if scenario := core_get(data.id):
+                        return [
+                            scenario.id,
+                            scenario.is_primary,
+                            scenario.config_id,
+                            scenario.creation_date.isoformat(),
+                            scenario.cycle.get_simple_label() if scenario.cycle else "",
+                            scenario.get_simple_label(),
+                            list(scenario.tags) if scenario.tags else [],
+                            [
+                                (k, v)
+                                for k, v in scenario.properties.items()
+                                if k not in _GuiCoreScenarioAdapter.__INNER_PROPS
+                            ]
+                            if scenario.properties
+                            else [],
+                            [
+                                (
+                                    s.get_simple_label(),
+                                    [t.id for t in s.tasks.values()] if hasattr(s, "tasks") else [],
+                                    _get_reason(is_submittable(s), "Sequence not submittable"),
+                                    _get_reason(is_editable(s), "Sequence not editable"),
+                                )
+                                for s in scenario.sequences.values()
+                            ]
+                            if hasattr(scenario, "sequences") and scenario.sequences
+                            else [],
+                            {t.id: t.get_simple_label() for t in scenario.tasks.values()}
+                            if hasattr(scenario, "tasks")
+                            else {},
+                            list(scenario.properties.get("authorized_tags", [])) if scenario.properties else [],
+                            _get_reason(is_deletable(scenario), "Scenario not deletable"),
+                            _get_reason(is_promotable(scenario), "Scenario not promotable"),
+                            _get_reason(is_submittable(scenario), "Scenario not submittable"),
+                            _get_reason(is_readable(scenario), "Scenario not readable"),
+                            _get_reason(is_editable(scenario), "Scenario not editable"),
                         ]
-                        if scenario.properties
-                        else [],
-                        [
-                            (
-                                s.get_simple_label(),
-                                [t.id for t in s.tasks.values()] if hasattr(s, "tasks") else [],
-                                _get_reason(is_submittable(s), "Sequence not submittable"),
-                                _get_reason(is_editable(s), "Sequence not editable"),
-                            )
-                            for s in scenario.sequences.values()
-                        ]
-                        if hasattr(scenario, "sequences") and scenario.sequences
-                        else [],
-                        {t.id: t.get_simple_label() for t in scenario.tasks.values()}
-                        if hasattr(scenario, "tasks")
-                        else {},
-                        list(scenario.properties.get("authorized_tags", [])) if scenario.properties else [],
-                        _get_reason(is_deletable(scenario), "Scenario not deletable"),
-                        _get_reason(is_promotable(scenario), "Scenario not promotable"),
-                        _get_reason(is_submittable(scenario), "Scenario not submittable"),
-                        _get_reason(is_readable(scenario), "Scenario not readable"),
-                        _get_reason(is_editable(scenario), "Scenario not editable"),
-                    ]
             except Exception as e:
                 _warn(f"Access to scenario ({data.id if hasattr(data, 'id') else 'No_id'}) failed", e)
 
@@ -228,35 +230,36 @@ class _GuiCoreDatanodeAdapter(_TaipyBase):
             data = data[0]
         if isinstance(data, DataNode):
             try:
-                if datanode := core_get(data.id):
-                    owner = core_get(datanode.owner_id) if datanode.owner_id else None
-                    return [
-                        datanode.id,
-                        datanode.storage_type() if hasattr(datanode, "storage_type") else "",
-                        datanode.config_id,
-                        f"{datanode.last_edit_date}" if datanode.last_edit_date else "",
-                        f"{datanode.expiration_date}" if datanode.last_edit_date else "",
-                        datanode.get_simple_label(),
-                        datanode.owner_id or "",
-                        owner.get_simple_label() if owner else "GLOBAL",
-                        _EntityType.CYCLE.value
-                        if isinstance(owner, Cycle)
-                        else _EntityType.SCENARIO.value
-                        if isinstance(owner, Scenario)
-                        else -1,
-                        self.__get_data(datanode),
-                        datanode._edit_in_progress,
-                        datanode._editor_id,
-                        _get_reason(is_readable(datanode), "Data node not readable"),
-                        _get_reason(is_editable(datanode), "Data node not editable"),
-                        isinstance(datanode, _FileDataNodeMixin),
-                        f"Data unavailable: {reason.reasons}"
-                        if isinstance(datanode, _FileDataNodeMixin) and not (reason := datanode.is_downloadable())
-                        else "",
-                        f"Data unavailable: {reason.reasons}"
-                        if isinstance(datanode, _FileDataNodeMixin) and not (reason := datanode.is_uploadable())
-                        else "",
-                    ]
+                with snapshot():
+                    if datanode := core_get(data.id):
+                        owner = core_get(datanode.owner_id) if datanode.owner_id else None
+                        return [
+                            datanode.id,
+                            datanode.storage_type() if hasattr(datanode, "storage_type") else "",
+                            datanode.config_id,
+                            f"{datanode.last_edit_date}" if datanode.last_edit_date else "",
+                            f"{datanode.expiration_date}" if datanode.last_edit_date else "",
+                            datanode.get_simple_label(),
+                            datanode.owner_id or "",
+                            owner.get_simple_label() if owner else "GLOBAL",
+                            _EntityType.CYCLE.value
+                            if isinstance(owner, Cycle)
+                            else _EntityType.SCENARIO.value
+                            if isinstance(owner, Scenario)
+                            else -1,
+                            self.__get_data(datanode),
+                            datanode._edit_in_progress,
+                            datanode._editor_id,
+                            _get_reason(is_readable(datanode), "Data node not readable"),
+                            _get_reason(is_editable(datanode), "Data node not editable"),
+                            isinstance(datanode, _FileDataNodeMixin),
+                            f"Data unavailable: {reason.reasons}"
+                            if isinstance(datanode, _FileDataNodeMixin) and not (reason := datanode.is_downloadable())
+                            else "",
+                            f"Data unavailable: {reason.reasons}"
+                            if isinstance(datanode, _FileDataNodeMixin) and not (reason := datanode.is_uploadable())
+                            else "",
+                        ]
             except Exception as e:
                 _warn(f"Access to data node ({data.id if hasattr(data, 'id') else 'No_id'}) failed", e)
 
@@ -150,6 +150,36 @@ def test_migrate_fs_backup_and_restore(caplog, mocker):
         assert not subdir.diff_files and not subdir.left_only and not subdir.right_only
 
 
+def test_migrate_fs_layout(caplog):
+    _MigrateCLI.create_parser()
+
+    data_sample_path = "tests/core/_entity/data_sample"
+    data_path = "tests/core/_entity/.data"
+    shutil.copytree(data_sample_path, data_path)
+
+    with pytest.raises(SystemExit) as err:
+        with patch(
+            "sys.argv",
+            ["prog", "migrate", "--repository-type", "filesystem", data_path, "--layout", "sharded", "--skip-backup"],
+        ):
+            _MigrateCLI.handle_command()
+    assert err.value.code == 0
+    assert f"Starting to move the entity files of '{data_path}' folder to the sharded layout." in caplog.text
+    assert not any(f.endswith(".json") for f in os.listdir(os.path.join(data_path, "data_nodes")))
+
+    # Moving the files back to the flat layout restores the original folder
+    with pytest.raises(SystemExit):
+        with patch(
+            "sys.argv",
+            ["prog", "migrate", "--repository-type", "filesystem", data_path, "--layout", "flat", "--skip-backup"],
+        ):
+            _MigrateCLI.handle_command()
+    dircmp_result = filecmp.dircmp(data_path, data_sample_path)
+    assert not dircmp_result.diff_files and not dircmp_result.left_only and not dircmp_result.right_only
+    for subdir in dircmp_result.subdirs.values():
+        assert not subdir.diff_files and not subdir.left_only and not subdir.right_only
+
+
 def test_migrate_fs_non_existing_folder(caplog):
     _MigrateCLI.create_parser()
 
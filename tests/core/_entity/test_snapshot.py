@@ -0,0 +1,91 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from unittest import mock
+
+import pytest
+
+import taipy.core.taipy as tp
+from taipy.common.config import Config
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
+
+
+@pytest.fixture
+def data_node():
+    Config.configure_core(entity_cache=False)
+    dn_config = Config.configure_data_node("dn", default_data=1, foo="bar")
+    return _DataManagerFactory._build_manager()._create_and_set(dn_config, None, None)
+
+
+def test_entity_is_loaded_once_in_snapshot(data_node):
+    repository = _DataManagerFactory._build_manager()._repository
+    with mock.patch.object(repository, "_load", wraps=repository._load) as load:
+        with tp.snapshot():
+            for _ in range(3):
+                _ = (data_node.config_id, data_node.properties["foo"], data_node.last_edit_date, data_node.version)
+        assert load.call_count == 1
+
+        _ = data_node.last_edit_date
+        assert load.call_count == 2
+
+
+def test_snapshot_returns_the_same_entity(data_node):
+    with tp.snapshot():
+        assert tp.get(data_node.id) is tp.get(data_node.id)
+    assert tp.get(data_node.id) is not tp.get(data_node.id)
+
+
+def test_saved_entity_is_read_again_in_snapshot(data_node):
+    with tp.snapshot():
+        assert data_node.name is None
+        data_node.name = "new name"
+        assert data_node.name == "new name"
+        assert tp.get(data_node.id).name == "new name"
+
+        _DataManagerFactory._build_manager()._delete(data_node.id)
+        assert tp.get(data_node.id) is None
+
+
+def test_nested_snapshots_share_entities(data_node):
+    with tp.snapshot():
+        entity = tp.get(data_node.id)
+        with tp.snapshot():
+            assert tp.get(data_node.id) is entity
+        assert tp.get(data_node.id) is entity
+
+
+def test_snapshot_only_applies_to_current_thread(data_node):
+    entities = []
+
+    with tp.snapshot():
+        entity = tp.get(data_node.id)
+        thread = threading.Thread(target=lambda: entities.append(tp.get(data_node.id)))
+        thread.start()
+        thread.join()
+
+    assert entities[0] is not entity
+
+
+def test_snapshot_of_scenario_properties():
+    Config.configure_core(entity_cache=False)
+    dn_config = Config.configure_data_node("dn", default_data=1)
+    task_config = Config.configure_task("task", print, [dn_config])
+    scenario_config = Config.configure_scenario("scenario", [task_config])
+    scenario = _ScenarioManagerFactory._build_manager()._create(scenario_config)
+    repository = _ScenarioManagerFactory._build_manager()._repository
+
+    with mock.patch.object(repository, "_load", wraps=repository._load) as load:
+        with tp.snapshot():
+            _ = (scenario.config_id, scenario.creation_date, scenario.tags, scenario.properties, scenario.is_primary)
+            _ = [task.config_id for task in scenario.tasks.values()]
+        assert load.call_count == 1
@@ -0,0 +1,191 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.core._manager._entity_cache import _EntityCache
+from taipy.core._manager._manager import _Manager
+from taipy.core._repository._sql_connection import _SQLConnection
+from taipy.core.data._data_manager import _DataManager
+from taipy.core.job._job_manager import _JobManager
+from taipy.core.scenario._scenario_manager import _ScenarioManager
+from taipy.core.task._task_manager import _TaskManager
+
+from ..repository.mocks import MockConverter, MockFSRepository, MockModel, MockObj, MockSQLRepository
+
+
+class MockSQLManager(_Manager[MockObj]):
+    _ENTITY_NAME = MockObj.__name__
+    _repository = MockSQLRepository(model_type=MockModel, table_name="mock_model", converter=MockConverter)
+
+
+class MockFSManager(_Manager[MockObj]):
+    _ENTITY_NAME = MockObj.__name__
+    _repository = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+
+
+@pytest.fixture
+def sql_manager(tmp_path):
+    Config.configure_core(repository_properties={"db_location": str(tmp_path / "db.sqlite3")})
+    MockSQLManager._delete_all()
+    yield MockSQLManager
+    MockSQLManager._delete_all()
+    _SQLConnection._close_all()
+
+
+class TestEntityCache:
+    def test_get_checks_revision(self):
+        cache = _EntityCache(max_size=10)
+        entity = MockObj("uuid", "foo", version="1.0")
+        cache._put("uuid", 1, entity)
+
+        assert cache._get("uuid", 1) is entity
+        assert cache._get("uuid", 2) is None
+        assert cache._get("uuid", 1) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entities_are_evicted(self):
+        cache = _EntityCache(max_size=2)
+        cache._put("uuid-0", 0, MockObj("uuid-0", "foo", version="1.0"))
+        cache._put("uuid-1", 1, MockObj("uuid-1", "foo", version="1.0"))
+        cache._get("uuid-0", 0)
+        cache._put("uuid-2", 2, MockObj("uuid-2", "foo", version="1.0"))
+
+        assert len(cache) == 2
+        assert cache._get("uuid-1", 1) is None
+        assert cache._get("uuid-0", 0) is not None
+        assert cache._get("uuid-2", 2) is not None
+
+
+class TestManagerEntityCache:
+    def test_unchanged_entity_is_returned_from_cache(self, sql_manager):
+        sql_manager._set(MockObj("uuid", "foo", version="1.0"))
+
+        entity = sql_manager._get("uuid")
+        assert sql_manager._get("uuid") is entity
+        assert sql_manager._get("uuid", cached=False) is not entity
+
+    def test_set_invalidates_cached_entity(self, sql_manager):
+        sql_manager._set(MockObj("uuid", "foo", version="1.0"))
+        entity = sql_manager._get("uuid")
+
+        sql_manager._set(MockObj("uuid", "bar", version="1.0"))
+
+        assert sql_manager._get("uuid") is not entity
+        assert sql_manager._get("uuid").name == "bar"
+
+    def test_change_behind_the_manager_is_detected(self, sql_manager):
+        sql_manager._set(MockObj("uuid", "foo", version="1.0"))
+        entity = sql_manager._get("uuid")
+
+        # Another process saving the entity only changes its revision in the repository.
+        sql_manager._repository._save(MockObj("uuid", "bar", version="1.0"))
+
+        assert sql_manager._get("uuid").name == "bar"
+        assert entity.name == "foo"
+
+    def test_delete_invalidates_cached_entity(self, sql_manager):
+        sql_manager._set(MockObj("uuid", "foo", version="1.0"))
+        sql_manager._get("uuid")
+
+        sql_manager._delete("uuid")
+
+        assert sql_manager._get("uuid") is None
+
+    def test_cache_can_be_disabled(self, sql_manager):
+        Config.configure_core(entity_cache=False)
+        sql_manager._set(MockObj("uuid", "foo", version="1.0"))
+
+        assert sql_manager._get("uuid") is not sql_manager._get("uuid")
+        assert sql_manager._entity_cache() is None
+
+    def test_get_many(self, sql_manager):
+        for i in range(3):
+            sql_manager._set(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0"))
+        entity = sql_manager._get("uuid-0")
+
+        entities = sql_manager._get_many(["uuid-0", "uuid-1", "uuid-1", "uuid-2", "not-existed-model"])
+
+        assert sorted(entities) == ["uuid-0", "uuid-1", "uuid-2"]
+        assert entities["uuid-0"] is entity
+        assert sql_manager._get("uuid-1") is entities["uuid-1"]
+
+    def test_filesystem_entities_modified_recently_are_not_cached(self):
+        MockFSManager._set(MockObj("uuid", "foo", version="1.0"))
+        assert MockFSManager._get("uuid") is not MockFSManager._get("uuid")
+
+        path = MockFSManager._repository.dir_path / "uuid.json"
+        past = time.time() - 10
+        os.utime(path, (past, past))
+        assert MockFSManager._get("uuid") is MockFSManager._get("uuid")
+
+        MockFSManager._delete_all()
+
+    def test_entity_in_context_in_another_thread(self):
+        dn = _DataManager._create_and_set(Config.configure_pickle_data_node("dn"), None, None)
+        past = time.time() - 10
+        os.utime(_DataManager._repository.dir_path / f"{dn.id}.json", (past, past))
+        cached_dn = _DataManager._get(dn.id)
+        assert _DataManager._get(dn.id) is cached_dn
+
+        entered, exited = threading.Event(), threading.Event()
+
+        def edit_in_context():
+            with cached_dn:
+                cached_dn.name = "edited in context"
+                entered.set()
+                exited.wait(10)
+
+        thread = threading.Thread(target=edit_in_context)
+        thread.start()
+        try:
+            assert entered.wait(10)
+            # The entity in context is neither in context for the other threads nor returned by the cache.
+            assert not cached_dn._is_in_context
+            assert _DataManager._get(dn.id) is not cached_dn
+            assert _DataManager._get(dn.id).name is None
+            cached_dn.validity_period = timedelta(days=1)
+            assert _DataManager._get(dn.id).validity_period == timedelta(days=1)
+        finally:
+            exited.set()
+            thread.join()
+
+        assert _DataManager._get(dn.id).name == "edited in context"
+        assert _DataManager._get(dn.id).validity_period == timedelta(days=1)
+
+    def test_entities_held_by_cached_entities_are_resolved_again(self):
+        input_cfg = Config.configure_pickle_data_node("input")
+        task_cfg = Config.configure_task("task", print, input_cfg, Config.configure_pickle_data_node("output"))
+        scenario = _ScenarioManager._create(Config.configure_scenario("scenario", [task_cfg]))
+        job = _JobManager._create(scenario.task, [print], "submit_id", scenario.id)
+        past = time.time() - 10
+        for manager in (_ScenarioManager, _TaskManager, _JobManager, _DataManager):
+            for path in manager._repository.dir_path.glob("*.json"):
+                os.utime(path, (past, past))
+        cached_job = _JobManager._get(job.id)
+        cached_task = _TaskManager._get(scenario.task.id)
+        assert _JobManager._get(job.id) is cached_job
+        assert cached_job._task is cached_task
+        assert cached_task._input["input"]._last_edit_date is None
+
+        # Another process writing the input data node changes its revision, but neither the task nor the job ones.
+        _DataManager._get(scenario.input.id, cached=False).write("data")
+
+        assert _JobManager._get(job.id) is cached_job
+        assert cached_job._task is cached_task
+        assert cached_task._input["input"]._last_edit_date is not None
+        assert _ScenarioManager._get(scenario.id) is _ScenarioManager._get(scenario.id)
@@ -40,7 +40,10 @@ class MockStandaloneDispatcher(_StandaloneJobDispatcher):
         super(_StandaloneJobDispatcher, self).__init__(orchestrator)
         self._executor: Executor = MockProcessPoolExecutor()
         self._nb_available_workers = 1
+        self._thread_executor: Executor = MockProcessPoolExecutor()
+        self._nb_available_threads = 1
         self._nb_available_workers_lock = Lock()
+        self._installed_config_hash = None
 
         self.dispatch_calls: List = []
         self.update_job_status_from_future_calls: List = []
@@ -15,6 +15,7 @@ import freezegun
 
 from taipy.common.config import Config
 from taipy.core._orchestrator._dispatcher import _JobDispatcher
+from taipy.core._orchestrator._dispatcher._task_function_wrapper import _TaskFunctionWrapper
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.task._task_manager import _TaskManager
 
@@ -23,6 +24,10 @@ def nothing(*args):
     pass
 
 
+def double(nb):
+    return nb * 2
+
+
 def _create_task_from_config(task_cfg):
     return _TaskManager()._bulk_get_or_create([task_cfg])[0]
 
@@ -100,3 +105,45 @@ def test_need_to_run_skippable_task_but_input_edited_after_output():
     with freezegun.freeze_time(output_edit_time + timedelta(minutes=30)):  # 30 min after output_edit_time
         task.data_nodes["input"].write("Yellow !")
         assert dispatcher._needs_to_run(task)  # output data is written but validity period expired
+
+
+def test_need_to_run_skippable_task_with_same_input_fingerprint():
+    input_cfg = Config.configure_data_node("input", default_data=1, fingerprint=True)
+    output_cfg = Config.configure_data_node("output")
+    task_cfg = Config.configure_task("name", double, [input_cfg], [output_cfg], skippable=True)
+    task = _create_task_from_config(task_cfg)
+    dispatcher = _JobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    task.data_nodes["input"].write(21)
+    assert dispatcher._needs_to_run(task)
+    _TaskFunctionWrapper("job_id", task)()
+    assert task.data_nodes["output"].read() == 42
+    assert not dispatcher._needs_to_run(task)
+
+    task.data_nodes["input"].write(21)  # input data is written again with the same data
+    assert task.data_nodes["input"].last_edit_date > task.data_nodes["output"].last_edit_date
+    assert not dispatcher._needs_to_run(task)
+
+    task.data_nodes["input"].write(12)  # input data is written with different data
+    assert dispatcher._needs_to_run(task)
+
+
+def test_need_to_run_skippable_task_with_provided_input_fingerprint():
+    input_cfg = Config.configure_data_node("input", default_data=1)
+    output_cfg = Config.configure_data_node("output")
+    task_cfg = Config.configure_task("name", double, [input_cfg], [output_cfg], skippable=True)
+    task = _create_task_from_config(task_cfg)
+    dispatcher = _JobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    task.data_nodes["input"].write(21, fingerprint="v1")
+    _TaskFunctionWrapper("job_id", task)()
+    assert task.data_nodes["output"].edits[-1]["input_fingerprints"] == {task.data_nodes["input"].id: "v1"}
+
+    task.data_nodes["input"].write(21, fingerprint="v1")
+    assert not dispatcher._needs_to_run(task)
+
+    task.data_nodes["input"].write(21, fingerprint="v2")
+    assert dispatcher._needs_to_run(task)
+
+    task.data_nodes["input"].write(21)  # no fingerprint: the edit dates are compared
+    assert dispatcher._needs_to_run(task)
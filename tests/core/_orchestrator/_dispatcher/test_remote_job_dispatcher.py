@@ -0,0 +1,296 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import multiprocessing
+import os
+from functools import partial
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+from typing import cast
+from unittest.mock import patch
+
+import pytest
+
+from taipy._entrypoint import _entrypoint
+from taipy.common.config import Config
+from taipy.core._orchestrator._dispatcher import _RemoteJobDispatcher
+from taipy.core._orchestrator._dispatcher._remote_protocol import _RemoteProtocol
+from taipy.core._orchestrator._dispatcher._remote_worker_agent import _RemoteWorkerAgent
+from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.config.job_config import JobConfig
+from taipy.core.data._data_manager import _DataManager
+from taipy.core.exceptions.exceptions import MissingWorkerAuthKey
+from taipy.core.job.status import Status
+from taipy.core.task.task import Task
+from tests.core.utils import assert_true_after_time
+
+
+AUTHKEY = "test-authkey"
+
+
+def wait_and_double(event, nb: int):
+    event.wait()
+    return nb * 2
+
+
+def record_run_and_double(event, runs, finished_runs, nb: int):
+    runs.append(os.getpid())
+    event.wait()
+    finished_runs.append(os.getpid())
+    return nb * 2
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+
+
+def _run_worker_agent(address: str, capacity: int, name: str):
+    _RemoteWorkerAgent(address, capacity=capacity, authkey=AUTHKEY, name=name).run()
+
+
+def _start_worker_agent(address: str, name: str, capacity: int = 1):
+    # Not daemonic, as the agent starts a pool of processes.
+    process = multiprocessing.get_context("spawn").Process(target=_run_worker_agent, args=(address, capacity, name))
+    process.start()
+    return process
+
+
+def _create_tasks(function, nb_tasks: int):
+    tasks = []
+    for i in range(nb_tasks):
+        input_cfg = Config.configure_pickle_data_node(f"remote_input_{i}", default_data=i)
+        output_cfg = Config.configure_pickle_data_node(f"remote_output_{i}")
+        dns = _DataManager._bulk_get_or_create([input_cfg, output_cfg])
+        tasks.append(Task(f"remote_task_{i}", {}, function, [dns[input_cfg]], [dns[output_cfg]]))
+    return tasks
+
+
+def _build_remote_dispatcher(heartbeat_interval: float = 0.2) -> _RemoteJobDispatcher:
+    Config.configure_job_executions(
+        mode=JobConfig._REMOTE_MODE, address="localhost:0", authkey=AUTHKEY, heartbeat_interval=heartbeat_interval
+    )
+    return cast(_RemoteJobDispatcher, _OrchestratorFactory._build_dispatcher(force_restart=True))
+
+
+def _connect_fake_worker(dispatcher: _RemoteJobDispatcher, capacity: int = 1):
+    address, family = _RemoteProtocol._parse_address(dispatcher.address)
+    connection = Client(address, family, authkey=AUTHKEY.encode())
+    connection.send((_RemoteProtocol.HELLO, "fake", capacity))
+    assert connection.recv() == (_RemoteProtocol.WELCOME, dispatcher._heartbeat_interval)
+    assert_true_after_time(lambda: len(dispatcher.workers) == 1, time=10)
+    return connection
+
+
+def test_parse_and_format_address():
+    assert _RemoteProtocol._parse_address("example.com:5755") == (("example.com", 5755), "AF_INET")
+    assert _RemoteProtocol._parse_address(":5755") == (("localhost", 5755), "AF_INET")
+    assert _RemoteProtocol._parse_address("unix:/tmp/taipy.sock") == ("/tmp/taipy.sock", "AF_UNIX")
+    assert _RemoteProtocol._format_address(("example.com", 5755)) == "example.com:5755"
+    assert _RemoteProtocol._format_address("/tmp/taipy.sock") == "unix:/tmp/taipy.sock"
+    with pytest.raises(ValueError):
+        _RemoteProtocol._parse_address("example.com")
+
+
+def test_remote_mode_requires_authkey():
+    Config.configure_job_executions(mode=JobConfig._REMOTE_MODE, address="localhost:0")
+    with pytest.raises(MissingWorkerAuthKey):
+        _OrchestratorFactory._build_dispatcher(force_restart=True)
+    with pytest.raises(MissingWorkerAuthKey):
+        _RemoteWorkerAgent("localhost:5755")
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+
+
+def test_worker_without_authkey_is_refused():
+    dispatcher = _build_remote_dispatcher()
+    address, family = _RemoteProtocol._parse_address(dispatcher.address)
+    with pytest.raises(AuthenticationError):
+        Client(address, family, authkey=b"wrong-authkey")
+
+    # Without a key, the client does not answer the challenge of the dispatcher.
+    connection = Client(address, family)
+    try:
+        with pytest.raises(Exception):
+            connection.send((_RemoteProtocol.HELLO, "intruder", 1))
+            connection.recv()
+    finally:
+        connection.close()
+    assert not dispatcher.workers
+
+
+def test_workers_are_stopped_with_the_dispatcher():
+    dispatcher = _build_remote_dispatcher(heartbeat_interval=60)
+    connection = _connect_fake_worker(dispatcher)
+    try:
+        _OrchestratorFactory._remove_dispatcher()
+        assert connection.poll(10)
+        assert connection.recv() == (_RemoteProtocol.STOP,)
+    finally:
+        connection.close()
+
+
+@pytest.mark.orchestrator_dispatcher
+def test_jobs_run_on_several_workers():
+    event = multiprocessing.Manager().Event()
+    tasks = _create_tasks(partial(wait_and_double, event), 3)
+    dispatcher = _build_remote_dispatcher()
+    workers = [_start_worker_agent(dispatcher.address, f"worker_{i}") for i in range(2)]
+    try:
+        assert_true_after_time(lambda: len(dispatcher.workers) == 2, time=30)
+        submissions = [_OrchestratorFactory._orchestrator.submit_task(task) for task in tasks]
+        jobs = [submission._jobs[0] for submission in submissions]
+
+        # Each worker runs a job at a time.
+        assert_true_after_time(lambda: sum(job.is_running() for job in jobs) == 2, time=30)
+        assert all(len(worker.jobs) == 1 for worker in dispatcher.workers)
+        assert not dispatcher._can_execute()
+
+        event.set()
+        assert_true_after_time(lambda: all(job.is_completed() for job in jobs), time=30)
+        assert [_DataManager._get(task.output[f"remote_output_{i}"].id).read() for i, task in enumerate(tasks)] == [
+            0,
+            2,
+            4,
+        ]
+    finally:
+        for worker in workers:
+            worker.terminate()
+            worker.join()
+
+
+@pytest.mark.orchestrator_dispatcher
+def test_jobs_of_a_lost_worker_run_on_another_worker():
+    event = multiprocessing.Manager().Event()
+    task = _create_tasks(partial(wait_and_double, event), 2)[1]
+    dispatcher = _build_remote_dispatcher()
+    workers = [_start_worker_agent(dispatcher.address, "lost_worker")]
+    try:
+        assert_true_after_time(lambda: len(dispatcher.workers) == 1, time=30)
+        job = _OrchestratorFactory._orchestrator.submit_task(task)._jobs[0]
+        assert_true_after_time(job.is_running, time=30)
+
+        workers[0].kill()
+        assert_true_after_time(lambda: not dispatcher.workers and job.is_pending(), time=30)
+        assert dispatcher._nb_requeues[job.id] == 1
+
+        workers.append(_start_worker_agent(dispatcher.address, "other_worker"))
+        event.set()
+        assert_true_after_time(job.is_completed, time=30)
+        assert _DataManager._get(task.output["remote_output_1"].id).read() == 2
+        assert job.id not in dispatcher._nb_requeues
+    finally:
+        for worker in workers:
+            worker.terminate()
+            worker.join()
+
+
+@pytest.mark.orchestrator_dispatcher
+def test_jobs_of_a_lost_connection_run_once_on_the_reconnected_worker():
+    manager = multiprocessing.Manager()
+    event, runs, finished_runs = manager.Event(), manager.list(), manager.list()
+    task = _create_tasks(partial(record_run_and_double, event, runs, finished_runs), 2)[1]
+    dispatcher = _build_remote_dispatcher()
+    worker = _start_worker_agent(dispatcher.address, "reconnected_worker")
+    try:
+        assert_true_after_time(lambda: len(dispatcher.workers) == 1, time=30)
+        job = _OrchestratorFactory._orchestrator.submit_task(task)._jobs[0]
+        assert_true_after_time(lambda: job.is_running() and len(runs) == 1, time=30)
+
+        # The connection is lost while the agent stays alive.
+        dispatcher._remove_worker(dispatcher.workers[0])
+        assert dispatcher._nb_requeues[job.id] == 1
+        assert_true_after_time(lambda: not _is_process_alive(runs[0]), time=30)
+
+        assert_true_after_time(lambda: len(dispatcher.workers) == 1 and len(runs) == 2, time=30)
+        event.set()
+        assert_true_after_time(job.is_completed, time=30)
+        assert _DataManager._get(task.output["remote_output_1"].id).read() == 2
+        assert list(finished_runs) == [runs[1]]
+        assert worker.is_alive()
+    finally:
+        worker.terminate()
+        worker.join()
+
+
+def test_worker_missing_heartbeats_is_removed():
+    task = _create_tasks(wait_and_double, 1)[0]
+    dispatcher = _build_remote_dispatcher(heartbeat_interval=2)
+    connection = _connect_fake_worker(dispatcher)
+    try:
+        job = _OrchestratorFactory._orchestrator.submit_task(task)._jobs[0]
+        assert connection.poll(10)
+        kind, job_id, _, config_as_string, config_hash = connection.recv()
+        assert (kind, job_id) == (_RemoteProtocol.JOB, job.id)
+        assert config_as_string is not None
+        assert config_hash == dispatcher.workers[0].config_hash
+
+        # The fake worker sends no heartbeat.
+        assert_true_after_time(lambda: not dispatcher.workers, time=10)
+        assert job.status == Status.PENDING
+        assert dispatcher._nb_requeues[job.id] == 1
+    finally:
+        connection.close()
+
+
+def test_job_fails_when_put_back_too_many_times():
+    task = _create_tasks(wait_and_double, 1)[0]
+    dispatcher = _build_remote_dispatcher(heartbeat_interval=60)
+    connection = _connect_fake_worker(dispatcher)
+    with patch.object(_RemoteJobDispatcher, "_MAX_NB_OF_REQUEUES", 0):
+        job = _OrchestratorFactory._orchestrator.submit_task(task)._jobs[0]
+        assert connection.poll(10)
+        connection.recv()
+        connection.close()
+
+        assert_true_after_time(job.is_failed, time=10)
+    assert "WorkerLost" in job.stacktrace[0]
+
+
+def test_worker_reporting_results_and_capacity():
+    task = _create_tasks(wait_and_double, 1)[0]
+    dispatcher = _build_remote_dispatcher(heartbeat_interval=60)
+    connection = _connect_fake_worker(dispatcher)
+    try:
+        connection.send((_RemoteProtocol.HEARTBEAT, 3))
+        assert_true_after_time(lambda: dispatcher.workers[0].nb_available_slots == 3, time=10)
+
+        job = _OrchestratorFactory._orchestrator.submit_task(task)._jobs[0]
+        assert connection.poll(10)
+        connection.recv()
+        assert dispatcher.workers[0].nb_available_slots == 2
+        connection.send((_RemoteProtocol.RESULT, job.id, []))
+        assert_true_after_time(job.is_completed, time=10)
+        assert dispatcher.workers[0].nb_available_slots == 3
+    finally:
+        connection.close()
+
+
+def test_worker_cli():
+    argv = ["prog", "worker", "--connect", "example.com:5755", "--capacity", "4"]
+    with patch("sys.argv", argv), patch.dict("os.environ", {"TAIPY_WORKER_AUTHKEY": "key"}):
+        with patch.object(_RemoteWorkerAgent, "run") as run, patch.object(_RemoteWorkerAgent, "__init__") as init:
+            init.return_value = None
+            with pytest.raises(SystemExit):
+                _entrypoint()
+    init.assert_called_once_with("example.com:5755", capacity=4, authkey="key", name=None)
+    run.assert_called_once_with()
+
+
+def test_worker_cli_requires_authkey():
+    with patch("sys.argv", ["prog", "worker", "--connect", "example.com:5755"]), patch.dict("os.environ", clear=True):
+        with patch.object(_RemoteWorkerAgent, "run") as run:
+            with pytest.raises(SystemExit) as error:
+                _entrypoint()
+    assert error.value.code == 1
+    run.assert_not_called()
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import hashlib
 from concurrent.futures import Future, ProcessPoolExecutor
 from unittest import mock
 from unittest.mock import call
@@ -69,7 +70,9 @@ def test_dispatch_job():
     assert submit_first_call[0].job_id == job.id
     assert submit_first_call[0].task == task
     assert submit_first_call[1] == ()
-    assert submit_first_call[2]["config_as_string"] == _TomlSerializer()._serialize(Config._applied_config)
+    config_as_string = _TomlSerializer()._serialize(Config._applied_config)
+    assert submit_first_call[2]["config_as_string"] == config_as_string
+    assert submit_first_call[2]["config_hash"] == hashlib.sha256(config_as_string.encode()).hexdigest()
 
     # test that the job status is updated after execution on future
     assert len(dispatcher.update_job_status_from_future_calls) == 1
@@ -77,9 +80,40 @@ def test_dispatch_job():
     assert dispatcher.update_job_status_from_future_calls[0][1] == dispatcher._executor.f[0]
 
 
+def test_dispatch_job_with_the_config_installed_in_workers():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    dispatcher = MockStandaloneDispatcher(_OrchestratorFactory._build_orchestrator())
+    _, dispatcher._installed_config_hash = dispatcher._get_serialized_config()
+
+    dispatcher._dispatch(job)
+
+    # The workers already have the config, so the job only carries its hash.
+    submit_call = dispatcher._executor.submit_called[-1]
+    assert submit_call[2] == {"config_hash": dispatcher._installed_config_hash}
+
+
+def test_serialized_config_is_computed_once_per_config_revision():
+    with mock.patch("taipy.common.config._serializer._toml_serializer._TomlSerializer._serialize") as mck:
+        mck.return_value = "config"
+        _StandaloneJobDispatcher._serialized_config = None
+        _, config_hash = _StandaloneJobDispatcher._get_serialized_config()
+        assert _StandaloneJobDispatcher._get_serialized_config() == ("config", config_hash)
+        assert mck.call_count == 1
+
+        Config.configure_core(custom_property="custom_property")
+        mck.return_value = "new config"
+        _, new_config_hash = _StandaloneJobDispatcher._get_serialized_config()
+        assert mck.call_count == 2
+        assert new_config_hash != config_hash
+
+
 def test_can_execute():
     dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
     assert dispatcher._nb_available_workers == 2
+    assert dispatcher._nb_available_threads == 4
+    assert dispatcher._can_execute()
+    dispatcher._nb_available_threads = 0
     assert dispatcher._can_execute()
     dispatcher._nb_available_workers = 0
     assert not dispatcher._can_execute()
@@ -87,6 +121,41 @@ def test_can_execute():
     assert not dispatcher._can_execute()
     dispatcher._nb_available_workers = 1
     assert dispatcher._can_execute()
+    dispatcher._nb_available_workers = 0
+    dispatcher._nb_available_threads = 1
+    assert dispatcher._can_execute()
+
+
+def test_can_dispatch_on_the_executor_of_the_task():
+    process_task = Task("process_config_id", {}, nothing, [], [])
+    thread_task = Task("thread_config_id", {"executor": "thread"}, nothing, [], [])
+    process_job = Job(JobId("process_job"), process_task, "s_id", process_task.id)
+    thread_job = Job(JobId("thread_job"), thread_task, "s_id", thread_task.id)
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
+
+    dispatcher._nb_available_workers = 0
+    assert not dispatcher._can_dispatch(process_job)
+    assert dispatcher._can_dispatch(thread_job)
+
+    dispatcher._nb_available_workers = 1
+    dispatcher._nb_available_threads = 0
+    assert dispatcher._can_dispatch(process_job)
+    assert not dispatcher._can_dispatch(thread_job)
+
+
+def test_dispatch_job_in_thread():
+    task = Task("config_id", {"executor": "thread"}, nothing, [], [])
+    _TaskManagerFactory._build_manager()._set(task)
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    job.running()
+    dispatcher._dispatch(job)
+
+    assert_true_after_time(job.is_completed, msg="The job did not complete in a thread.")
+    assert dispatcher._nb_available_threads == 4
+    assert dispatcher._nb_available_workers == 2
 
 
 def test_update_job_status_from_future():
@@ -124,3 +193,25 @@ def test_run():
         assert_true_after_time(lambda: mck.call_count == 4, time=5, msg="The 4 jobs were not dequeued.")
         dispatcher.stop()
         mck.assert_has_calls([call(job_1), call(job_2), call(job_3), call(job_4)])
+
+
+def test_jobs_only_run_with_the_resources_they_need():
+    Config.configure_job_executions(resources={"cpu": 4})
+    task = Task("config_id", {"resources": {"cpu": 3, "gpu": 1}}, nothing, [], [])
+    big_task = Task("big_config_id", {"resources": {"cpu": 10}}, nothing, [], [])
+    job = Job(JobId("job"), task, "s_id", task.id)
+    big_job = Job(JobId("big_job"), big_task, "s_id", big_task.id)
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    # Undeclared resources are not accounted for.
+    assert dispatcher._get_required_resources(job) == {"cpu": 3}
+    assert dispatcher._has_resources_for(job)
+    assert dispatcher._has_resources_for(big_job)
+
+    dispatcher._acquire_resources(job)
+    assert not dispatcher._has_resources_for(job)
+    assert not dispatcher._has_resources_for(big_job)
+
+    dispatcher._release_resources(job)
+    assert dispatcher._available_resources == {"cpu": 4}
+    assert dispatcher._has_resources_for(big_job)
@@ -11,6 +11,7 @@
 
 import random
 import string
+from unittest import mock
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
@@ -128,3 +129,19 @@ def test_can_execute_task_with_a_modified_config():
     res = _TaskFunctionWrapper("job_id", task_asserting_cfg_is_correct).execute(config_as_string=cfg_as_str)
 
     assert len(res) == 0  # no exception raised so the asserts in the fct passed
+
+
+def test_config_is_reloaded_only_when_its_hash_changes():
+    task = _create_task(lambda n, m: n * m)
+    cfg_as_str = _TomlSerializer()._serialize(Config._applied_config)
+
+    with mock.patch.object(_TaskFunctionWrapper, "_install_config", wraps=_TaskFunctionWrapper._install_config) as mck:
+        _TaskFunctionWrapper("job_id", task).execute(config_as_string=cfg_as_str, config_hash="hash")
+        _TaskFunctionWrapper("job_id", task).execute(config_as_string=cfg_as_str, config_hash="hash")
+        _TaskFunctionWrapper("job_id", task).execute(config_hash="hash")
+        assert mck.call_count == 1
+        assert _TaskFunctionWrapper._config_hash == "hash"
+
+        _TaskFunctionWrapper("job_id", task).execute(config_as_string=cfg_as_str, config_hash="new_hash")
+        assert mck.call_count == 2
+        assert _TaskFunctionWrapper._config_hash == "new_hash"
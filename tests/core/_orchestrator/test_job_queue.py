@@ -0,0 +1,127 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import random
+from queue import Empty
+from threading import Timer
+
+import pytest
+
+from taipy.core._orchestrator._job_queue import _JobQueue
+from taipy.core.job.job import Job
+from taipy.core.job.job_id import JobId
+from taipy.core.task.task import Task
+
+
+def nothing(*args):
+    return
+
+
+def create_job(id, submit_id, task=None):
+    return Job(JobId(id), task or Task("config_id", {}, nothing, [], []), submit_id, "entity_id")
+
+
+def dequeue_all(queue):
+    return [queue.get_nowait().id for _ in range(queue.qsize())]
+
+
+def test_jobs_are_dequeued_by_priority_then_in_order():
+    queue = _JobQueue()
+    queue.put(create_job("low", "s1"))
+    queue.put(create_job("task_priority", "s1"), (0, 5))
+    queue.put(create_job("low_bis", "s1"))
+    queue.put(create_job("submission_priority", "s2"), (1, 0))
+
+    assert dequeue_all(queue) == ["submission_priority", "task_priority", "low", "low_bis"]
+    assert queue.empty()
+
+
+def test_submissions_share_the_queue():
+    queue = _JobQueue()
+    for i in range(3):
+        queue.put(create_job(f"batch_{i}", "batch"))
+    queue.put(create_job("interactive", "interactive"))
+
+    assert queue.get_nowait().id == "batch_0"
+    # The batch submission had a job dequeued, the interactive one had none.
+    assert dequeue_all(queue) == ["interactive", "batch_1", "batch_2"]
+
+
+def test_get_only_returns_accepted_jobs():
+    queue = _JobQueue()
+    queue.put(create_job("big", "s1"), (0, 1))
+    queue.put(create_job("small", "s1"))
+
+    assert queue.get_nowait().id == "big"
+    queue.put(create_job("big_bis", "s1"), (0, 1))
+    assert queue.get(block=False, accept=lambda job: not job.id.startswith("big")).id == "small"
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01, accept=lambda job: False)
+    assert queue.qsize() == 1
+
+
+def test_get_waits_for_a_job():
+    queue = _JobQueue()
+    job = create_job("job", "s1")
+    Timer(0.05, queue.put, [job]).start()
+
+    assert queue.get(timeout=5) == job
+
+
+def test_remove():
+    queue = _JobQueue()
+    jobs = [create_job(f"job_{i}", f"s{i % 2}") for i in range(4)]
+    for job in jobs:
+        queue.put(job)
+
+    queue._remove([jobs[0], jobs[3]])
+
+    assert queue.qsize() == 2
+    assert sorted(dequeue_all(queue)) == ["job_1", "job_2"]
+    with pytest.raises(Empty):
+        queue.get_nowait()
+
+
+def test_dequeue_order_with_interleaved_operations():
+    rng = random.Random(42)
+    queue = _JobQueue()
+    # Reference model: (priority, put order, job id, submission id) of the queued jobs.
+    queued = []
+    nb_dequeued = {}
+    for i in range(500):
+        if queued and rng.random() < 0.4:
+            if rng.random() < 0.2:
+                removed = rng.choice(queued)
+                queued.remove(removed)
+                queue._remove([create_job(removed[2], removed[3])])
+                continue
+            first_put = {}
+            for priority, order, _, submit_id in queued:
+                first_put.setdefault((priority, submit_id), order)
+            expected = min(
+                queued,
+                key=lambda e: (
+                    (-e[0][0], -e[0][1]),
+                    nb_dequeued.get(e[3], 0),
+                    first_put[(e[0], e[3])],
+                    e[1],
+                ),
+            )
+            assert queue.get_nowait().id == expected[2]
+            queued.remove(expected)
+            nb_dequeued[expected[3]] = nb_dequeued.get(expected[3], 0) + 1
+            if not any(e[3] == expected[3] for e in queued):
+                del nb_dequeued[expected[3]]
+        else:
+            priority, submit_id = (rng.randint(0, 1), rng.randint(0, 2)), f"s{rng.randint(0, 4)}"
+            queue.put(create_job(f"job_{i}", submit_id), priority)
+            queued.append((priority, i, f"job_{i}", submit_id))
+        assert queue.qsize() == len(queued)
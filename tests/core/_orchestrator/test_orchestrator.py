@@ -9,12 +9,16 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import asyncio
 import multiprocessing
+import os
 import random
 import string
 from functools import partial
-from time import sleep
+from threading import Timer
+from time import monotonic, sleep
 from typing import cast
+from unittest import mock
 
 import pytest
 
@@ -25,6 +29,7 @@ from taipy.core._orchestrator._orchestrator import _Orchestrator
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.config.job_config import JobConfig
 from taipy.core.data._data_manager import _DataManager
+from taipy.core.job._job_manager import _JobManager
 from taipy.core.scenario.scenario import Scenario
 from taipy.core.submission._submission_manager import _SubmissionManager
 from taipy.core.submission.submission_status import SubmissionStatus
@@ -48,6 +53,11 @@ def mult_by_2(n):
     return n * 2
 
 
+def sleep_and_mult_by_2(n):
+    sleep(0.01)
+    return n * 2
+
+
 @pytest.mark.orchestrator_dispatcher
 def test_submit_task_multithreading_multiple_task():
     Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
@@ -294,6 +304,131 @@ def test_blocked_submittable():
     assert dispatcher._nb_available_workers == 2  # No more process used.
 
 
+def test_wait_until_job_finished_is_woken_up_on_status_change(mocker):
+    mocker.patch.object(_Orchestrator, "_MAX_WAIT", 10)
+    task = _create_task(mult_by_2)
+    job = _Orchestrator._lock_dn_output_and_create_job(task, "submit_id", task.id)
+    job.pending()
+
+    Timer(0.1, job.completed).start()
+    start = monotonic()
+    _Orchestrator._wait_until_job_finished(job, timeout=5)
+
+    assert job.is_completed()
+    assert monotonic() - start < 1
+
+
+@pytest.mark.orchestrator_dispatcher
+def test_submit_chain_of_tasks_and_wait():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_configs = [Config.configure_data_node(f"chain_{i}", default_data=1 if i == 0 else None) for i in range(6)]
+    _OrchestratorFactory._build_dispatcher(force_restart=True)
+    dns = _DataManager._bulk_get_or_create(dn_configs)
+    tasks = {
+        Task(f"double_{i}", {}, mult_by_2, [dns[dn_configs[i]]], [dns[dn_configs[i + 1]]])
+        for i in range(len(dn_configs) - 1)
+    }
+    scenario = Scenario("scenario_config", tasks, {})
+
+    submission = _Orchestrator.submit(scenario, wait=True, timeout=60)
+
+    assert all(job.is_completed() for job in submission._jobs)
+    assert _DataManager._get(dns[dn_configs[-1]].id).read() == 32
+
+
+@pytest.mark.orchestrator_dispatcher
+def test_wait_for_a_long_chain_of_short_tasks():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_configs = [Config.configure_data_node(f"chain_{i}", default_data=1 if i == 0 else None) for i in range(21)]
+    _OrchestratorFactory._build_dispatcher(force_restart=True)
+    dns = _DataManager._bulk_get_or_create(dn_configs)
+    tasks = [
+        Task(f"double_{i}", {}, sleep_and_mult_by_2, [dns[dn_configs[i]]], [dns[dn_configs[i + 1]]])
+        for i in range(len(dn_configs) - 1)
+    ]
+    scenario = Scenario("scenario_config", set(tasks), {})
+    # The processes of the dispatcher are started by a first submission.
+    _Orchestrator.submit(scenario, wait=True, timeout=60)
+
+    start = monotonic()
+    submission = _Orchestrator.submit(scenario, wait=True, timeout=60)
+
+    assert monotonic() - start < 2
+    assert all(job.is_completed() for job in submission._jobs)
+    assert _DataManager._get(dns[dn_configs[-1]].id).read() == 2**20
+
+
+def test_submit_chain_of_tasks_handing_data_off():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_configs = [
+        Config.configure_data_node(f"chain_{i}", default_data=1 if i == 0 else None, handoff=0 < i < 3, transient=True)
+        for i in range(4)
+    ]
+    _OrchestratorFactory._build_dispatcher(force_restart=True)
+    dns = _DataManager._bulk_get_or_create(dn_configs)
+    tasks = {
+        Task(f"double_{i}", {}, mult_by_2, [dns[dn_configs[i]]], [dns[dn_configs[i + 1]]])
+        for i in range(len(dn_configs) - 1)
+    }
+    scenario = Scenario("scenario_config", tasks, {})
+
+    submission = _Orchestrator.submit(scenario, wait=True, timeout=60)
+
+    assert all(job.is_completed() for job in submission._jobs)
+    assert _DataManager._get(dns[dn_configs[-1]].id).read() == 8
+    # The transient data handed off was not written to the storage.
+    assert not os.path.exists(_DataManager._get(dns[dn_configs[1]].id).path)
+    assert_true_after_time(lambda: submission.id not in _Orchestrator._handoffs_by_submission)
+
+
+
+def test_submit_many():
+    dn_configs = [Config.configure_data_node(f"many_{i}", default_data=1 if i == 0 else None) for i in range(3)]
+    dns = _DataManager._bulk_get_or_create(dn_configs)
+    tasks = [
+        Task(f"double_{i}", {}, mult_by_2, [dns[dn_configs[i]]], [dns[dn_configs[i + 1]]])
+        for i in range(len(dn_configs) - 1)
+    ]
+    scenarios = [Scenario(f"scenario_{i}", set(tasks), {}) for i in range(3)]
+    _OrchestratorFactory._build_dispatcher()
+
+    with mock.patch.object(_JobManager, "_set_many", wraps=_JobManager._set_many) as set_many_jobs:
+        with mock.patch.object(_SubmissionManager, "_create_many", wraps=_SubmissionManager._create_many) as create:
+            batch = _Orchestrator.submit_many([(scenario, None) for scenario in scenarios] + [(tasks[0], None)])
+            assert set_many_jobs.call_count == 1
+            assert create.call_count == 1
+
+    assert len(batch) == 4
+    assert [submission.entity_id for submission in batch] == [*(scenario.id for scenario in scenarios), tasks[0].id]
+    assert len(batch.jobs) == 7
+    assert batch.wait(timeout=10)
+    for submission in batch:
+        assert submission.submission_status == SubmissionStatus.COMPLETED
+        assert [job for job in batch.jobs if job.submit_id == submission.id] == submission._jobs
+    assert _DataManager._get(dns[dn_configs[-1]].id).read() == 4
+
+
+@pytest.mark.orchestrator_dispatcher
+def test_wait_async_for_many_submissions():
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    m = multiprocessing.Manager()
+    lock = m.Lock()
+    tasks = [_create_task(multiply if i else partial(lock_multiply, lock)) for i in range(10)]
+    _OrchestratorFactory._build_dispatcher(force_restart=True)
+
+    async def wait_for_all(submissions, timeout):
+        return await asyncio.gather(*(submission.wait_async(timeout) for submission in submissions))
+
+    with lock:
+        submissions = [_Orchestrator.submit_task(task) for task in tasks]
+        assert asyncio.run(wait_for_all(submissions[1:], timeout=30)) == [True] * 9
+        assert asyncio.run(wait_for_all(submissions[:1], timeout=0.2)) == [False]
+    assert asyncio.run(wait_for_all(submissions[:1], timeout=30)) == [True]
+
+    assert all(submission._jobs[0].is_completed() for submission in submissions)
+    assert not _Orchestrator._job_status_listeners
+
+
 # ################################  UTIL METHODS    ##################################
 def _create_task(function, nb_outputs=1):
     output_dn_config_id = "".join(random.choice(string.ascii_lowercase) for _ in range(10))
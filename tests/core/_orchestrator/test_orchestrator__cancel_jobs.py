@@ -68,7 +68,7 @@ def test_cancel_job_with_subsequent_blocked_jobs():
     job2.blocked()
     job3.blocked()
     job2bis.blocked()
-    orchestrator.blocked_jobs = [job2, job3, job2bis]
+    orchestrator._add_blocked_jobs([job2, job3, job2bis])
 
     orchestrator.cancel_job(job1)
 
@@ -94,7 +94,7 @@ def test_cancel_job_with_subsequent_jobs_and_parallel_jobs():
     job2.pending()
     job3.blocked()
     job2bis.pending()
-    cast(_Orchestrator, orchestrator).blocked_jobs = [job3]
+    orchestrator._add_blocked_jobs([job3])
 
     orchestrator.cancel_job(job2)
 
@@ -118,7 +118,7 @@ def test_cancel_blocked_job_with_subsequent_blocked_jobs():
     job2.blocked()
     job3.blocked()
     job2bis.blocked()
-    orchestrator.blocked_jobs = [job2, job3, job2bis]
+    orchestrator._add_blocked_jobs([job2, job3, job2bis])
 
     orchestrator.cancel_job(job1)
 
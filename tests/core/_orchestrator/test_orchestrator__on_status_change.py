@@ -57,9 +57,7 @@ def test_on_status_change_on_running_job_does_nothing():
     job_2_to_be_unblocked = create_job("to_be_unblocked", Status.BLOCKED)
     job_3_blocked = create_job("3_blocked", Status.BLOCKED)
     job_4_running = create_job("running_job", Status.RUNNING)
-    orchestrator.blocked_jobs.append(job_1_blocked)
-    orchestrator.blocked_jobs.append(job_2_to_be_unblocked)
-    orchestrator.blocked_jobs.append(job_3_blocked)
+    orchestrator._add_blocked_jobs([job_1_blocked, job_2_to_be_unblocked, job_3_blocked])
 
     with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
         orchestrator._on_status_change(job_4_running)
@@ -76,25 +74,31 @@ def test_on_status_change_on_running_job_does_nothing():
         assert orchestrator.jobs_to_run.qsize() == 0
 
 
+def _create_blocked_jobs_and_finished_job(status):
+    scenario = create_scenario()
+    job_1_blocked = create_job_from_task("1_blocked", scenario.t3)
+    job_2_to_be_unblocked = create_job_from_task("to_be_unblocked", scenario.t2)
+    job_3_blocked = create_job_from_task("3_blocked", scenario.t3)
+    finished_job = create_job_from_task("finished_job", scenario.t1)
+    for job in [job_1_blocked, job_2_to_be_unblocked, job_3_blocked]:
+        job.status = Status.BLOCKED
+    finished_job.status = status
+    _OrchestratorFactory._build_orchestrator()._add_blocked_jobs([job_1_blocked, job_2_to_be_unblocked, job_3_blocked])
+    return job_1_blocked, job_2_to_be_unblocked, job_3_blocked, finished_job
+
+
 def test_on_status_change_on_completed_job():
     orchestrator = _OrchestratorFactory._build_orchestrator()
-    job_1_blocked = create_job("1_blocked", Status.BLOCKED)
-    job_2_to_be_unblocked = create_job("to_be_unblocked", Status.BLOCKED)
-    job_3_blocked = create_job("3_blocked", Status.BLOCKED)
-    job_4_completed = create_job("completed_job", Status.COMPLETED)
-    orchestrator.blocked_jobs.append(job_1_blocked)
-    orchestrator.blocked_jobs.append(job_2_to_be_unblocked)
-    orchestrator.blocked_jobs.append(job_3_blocked)
-
-    def mck_is_blocked(job):
-        if job.id == "to_be_unblocked":
-            return False
-        return True
+    job_1_blocked, job_2_to_be_unblocked, job_3_blocked, job_4_completed = _create_blocked_jobs_and_finished_job(
+        Status.COMPLETED
+    )
 
     with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
-        mck.side_effect = mck_is_blocked
+        mck.return_value = False
         orchestrator._on_status_change(job_4_completed)
 
+        # Only the jobs reading an output of the completed job are checked
+        mck.assert_called_once_with(job_2_to_be_unblocked)
         assert job_1_blocked in orchestrator.blocked_jobs
         assert job_1_blocked.is_blocked()
         assert job_2_to_be_unblocked not in orchestrator.blocked_jobs
@@ -109,25 +113,17 @@ def test_on_status_change_on_completed_job():
 
 def test_on_status_change_on_skipped_job():
     orchestrator = _OrchestratorFactory._build_orchestrator()
-    job_1_blocked = create_job("1_blocked", Status.BLOCKED)
-    job_2_to_be_unblocked = create_job("to_be_unblocked", Status.BLOCKED)
-    job_3_blocked = create_job("3_blocked", Status.BLOCKED)
-    job_4_skipped = create_job("skipped_job", Status.SKIPPED)
-    orchestrator.blocked_jobs.append(job_1_blocked)
-    orchestrator.blocked_jobs.append(job_2_to_be_unblocked)
-    orchestrator.blocked_jobs.append(job_3_blocked)
-
-    def mck_is_blocked(job):
-        if job.id == "to_be_unblocked":
-            return False
-        return True
+    job_1_blocked, job_2_to_be_unblocked, job_3_blocked, job_4_skipped = _create_blocked_jobs_and_finished_job(
+        Status.SKIPPED
+    )
 
     with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
-        mck.side_effect = mck_is_blocked
+        mck.return_value = False
 
         orchestrator._on_status_change(job_4_skipped)
 
         # Assert that when the status is skipped, the unblock jobs mechanism is executed
+        mck.assert_called_once_with(job_2_to_be_unblocked)
         assert job_1_blocked in orchestrator.blocked_jobs
         assert job_1_blocked.is_blocked()
         assert job_2_to_be_unblocked not in orchestrator.blocked_jobs
@@ -140,6 +136,71 @@ def test_on_status_change_on_skipped_job():
         assert orchestrator.jobs_to_run.get() == job_2_to_be_unblocked
 
 
+def test_on_status_change_unblocks_job_once_all_its_inputs_are_ready():
+    # t1 --> dn_1 --> t_join <-- dn_3 <-- t4
+    dn_1_cfg = Config.configure_pickle_data_node("dn_1")
+    dn_3_cfg = Config.configure_pickle_data_node("dn_3")
+    t1_cfg = Config.configure_task("t1", nothing, [], [dn_1_cfg])
+    t4_cfg = Config.configure_task("t4", nothing, [], [dn_3_cfg])
+    t_join_cfg = Config.configure_task("t_join", nothing, [dn_1_cfg, dn_3_cfg], [])
+    scenario = taipy.create_scenario(Config.configure_scenario("join_cfg", [t1_cfg, t4_cfg, t_join_cfg]))
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    j1 = create_job_from_task("j1", scenario.t1)
+    j4 = create_job_from_task("j4", scenario.t4)
+    j_join = create_job_from_task("j_join", scenario.t_join)
+    orchestrator._orchestrate_job_to_run_or_block([j_join])
+    assert j_join.is_blocked()
+
+    scenario.dn_1.write(1)
+    j1.status = Status.COMPLETED
+    orchestrator._on_status_change(j1)
+    assert j_join.is_blocked()
+    assert orchestrator.jobs_to_run.qsize() == 0
+
+    scenario.dn_3.write(3)
+    j4.status = Status.COMPLETED
+    orchestrator._on_status_change(j4)
+    assert j_join.is_pending()
+    assert orchestrator.blocked_jobs == []
+    assert orchestrator.jobs_to_run.get() == j_join
+
+
+def test_writing_an_input_outside_of_jobs_unblocks_the_jobs_reading_it():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    job_1_blocked, job_2_blocked, job_3_blocked, _ = _create_blocked_jobs_and_finished_job(Status.RUNNING)
+    dn_0 = job_1_blocked._task.dn_0
+    dn_0.lock_edit()
+
+    with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
+        mck.return_value = False
+        # dn_0 is not the output of any job: it becomes ready when written, e.g. by a user.
+        dn_0.write(0)
+
+        # Only the jobs reading the written data node are checked
+        assert sorted(call.args[0].id for call in mck.call_args_list) == ["1_blocked", "3_blocked"]
+    assert job_1_blocked.is_pending()
+    assert job_3_blocked.is_pending()
+    assert orchestrator.blocked_jobs == [job_2_blocked]
+    assert job_2_blocked.is_blocked()
+    assert orchestrator.jobs_to_run.qsize() == 2
+
+
+def test_unlocking_an_input_unblocks_the_jobs_reading_it():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario = create_scenario()
+    scenario.dn_0.write(0)
+    scenario.dn_0.lock_edit()
+    job = create_job_from_task("blocked", scenario.t3)
+    orchestrator._orchestrate_job_to_run_or_block([job])
+    assert job.is_blocked()
+
+    scenario.dn_0.unlock_edit()
+
+    assert job.is_pending()
+    assert orchestrator.blocked_jobs == []
+    assert orchestrator.jobs_to_run.get() == job
+
+
 def test_on_status_change_on_failed_job():
     orchestrator = _OrchestratorFactory._build_orchestrator()
     scenario = create_scenario()
@@ -149,8 +210,7 @@ def test_on_status_change_on_failed_job():
     j2.status = Status.BLOCKED
     j3 = create_job_from_task("j3", scenario.t3)
     j3.status = Status.BLOCKED
-    orchestrator.blocked_jobs.append(j2)
-    orchestrator.blocked_jobs.append(j3)
+    orchestrator._add_blocked_jobs([j2, j3])
 
     orchestrator._on_status_change(j1)
 
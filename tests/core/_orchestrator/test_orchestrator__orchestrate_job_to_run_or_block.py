@@ -77,3 +77,22 @@ def test_orchestrate_job_to_run_or_block__no_job_doesnot_raise_error():
     orchestrator = _OrchestratorFactory._build_orchestrator()
 
     orchestrator._orchestrate_job_to_run_or_block([])
+
+
+def test_orchestrate_job_to_run_or_block_with_priorities():
+    inp = Config.configure_data_node("inp", default_data=1)
+    t1 = Config.configure_task("my_task_1", nothing, [inp], [])
+    t2 = Config.configure_task("my_task_2", nothing, [inp], [], priority=1)
+    scenario = taipy.create_scenario(Config.configure_scenario("scenario", [t1, t2]))
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    job_manager = _JobManagerFactory._build_manager()
+    batch_job_1 = job_manager._create(scenario.my_task_1, [nothing], "batch", "e_id")
+    batch_job_2 = job_manager._create(scenario.my_task_2, [nothing], "batch", "e_id")
+    interactive_job = job_manager._create(scenario.my_task_1, [nothing], "interactive", "e_id")
+
+    orchestrator._orchestrate_job_to_run_or_block([batch_job_1, batch_job_2])
+    orchestrator._orchestrate_job_to_run_or_block([interactive_job], submission_priority=10)
+
+    assert orchestrator.jobs_to_run.get() == interactive_job
+    assert orchestrator.jobs_to_run.get() == batch_job_2
+    assert orchestrator.jobs_to_run.get() == batch_job_1
@@ -0,0 +1,126 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import taipy.core.taipy as tp
+from taipy.common.config import Config
+from taipy.core._orchestrator._retention_worker import _RetentionWorker
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.job.job import Job
+from taipy.core.job.job_id import JobId
+from taipy.core.job.status import Status
+from taipy.core.submission._submission_manager_factory import _SubmissionManagerFactory
+from taipy.core.submission.submission import Submission
+from taipy.core.submission.submission_status import SubmissionStatus
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+from taipy.core.task.task import Task
+
+
+@pytest.fixture(autouse=True)
+def clean_archives():
+    yield
+    _JobManagerFactory._build_manager()._archive()._clear()
+    _SubmissionManagerFactory._build_manager()._archive()._clear()
+
+
+def _submit(task: Task, index: int, creation_date: datetime, status=Status.COMPLETED) -> Submission:
+    job = Job(JobId(f"JOB_{task.config_id}_{index}"), task, f"SUBMISSION_{index}", task.id)
+    job._status = status
+    job._creation_date = creation_date
+    _JobManagerFactory._build_manager()._set(job)
+    submission = Submission(
+        task.id, Task._ID_PREFIX, task.config_id, f"SUBMISSION_{index}", [job], creation_date=creation_date
+    )
+    submission._submission_status = (
+        SubmissionStatus.COMPLETED if status == Status.COMPLETED else SubmissionStatus.RUNNING
+    )
+    _SubmissionManagerFactory._build_manager()._set(submission)
+    return submission
+
+
+def test_retention_is_disabled_by_default():
+    assert not _RetentionWorker._is_enabled()
+
+    Config.configure_core(retention_max_count=2)
+    assert _RetentionWorker._is_enabled()
+
+
+def test_retention_interval():
+    assert _RetentionWorker().interval == 60
+
+    Config.configure_core(retention_max_count=2, retention_interval=5)
+    assert _RetentionWorker().interval == 5
+    assert _RetentionWorker(interval=0.1).interval == 0.1
+
+
+def test_archive_submissions_and_jobs_beyond_max_count():
+    Config.configure_core(retention_max_count=2)
+    task = Task("task", {}, print, id="TASK_task")
+    _TaskManagerFactory._build_manager()._set(task)
+    now = datetime.now()
+    for i in range(5):
+        _submit(task, i, now - timedelta(minutes=10 - i))
+    _submit(task, 5, now - timedelta(hours=1), status=Status.RUNNING)
+
+    worker = _RetentionWorker()
+    assert worker._archive_expired_entities(now) == (3, 3)
+
+    assert sorted(s.id for s in tp.get_submissions()) == ["SUBMISSION_3", "SUBMISSION_4", "SUBMISSION_5"]
+    assert sorted(j.id for j in tp.get_jobs()) == ["JOB_task_3", "JOB_task_4", "JOB_task_5"]
+    assert sorted(s.id for s in tp.get_archived_submissions()) == ["SUBMISSION_0", "SUBMISSION_1", "SUBMISSION_2"]
+    archived_jobs = tp.get_archived_jobs()
+    assert sorted(j.id for j in archived_jobs) == ["JOB_task_0", "JOB_task_1", "JOB_task_2"]
+    assert all(j.task.id == task.id and j.is_completed() for j in archived_jobs)
+
+    assert worker._archive_expired_entities(now) == (0, 0)
+
+
+def test_archive_entities_beyond_max_age():
+    Config.configure_core(retention_max_age=3600)
+    task = Task("task", {}, print, id="TASK_task")
+    _TaskManagerFactory._build_manager()._set(task)
+    now = datetime.now()
+    _submit(task, 0, now - timedelta(days=1))
+    _submit(task, 1, now - timedelta(minutes=1))
+    orphan_job = Job(JobId("JOB_task_orphan"), task, "SUBMISSION_deleted", task.id)
+    orphan_job._status = Status.FAILED
+    orphan_job._creation_date = now - timedelta(days=2)
+    _JobManagerFactory._build_manager()._set(orphan_job)
+
+    assert _RetentionWorker()._archive_expired_entities(now) == (1, 2)
+
+    assert [s.id for s in tp.get_submissions()] == ["SUBMISSION_1"]
+    assert [j.id for j in tp.get_jobs()] == ["JOB_task_1"]
+    assert sorted(j.id for j in tp.get_archived_jobs()) == ["JOB_task_0", "JOB_task_orphan"]
+
+
+def test_finished_entities_are_only_loaded_once(mocker):
+    Config.configure_core(retention_max_count=2)
+    task = Task("task", {}, print, id="TASK_task")
+    _TaskManagerFactory._build_manager()._set(task)
+    now = datetime.now()
+    for i in range(3):
+        _submit(task, i, now - timedelta(minutes=10 - i))
+    _submit(task, 3, now - timedelta(minutes=5), status=Status.RUNNING)
+    worker = _RetentionWorker()
+    assert worker._archive_expired_entities(now) == (1, 1)
+
+    load_many = mocker.spy(_SubmissionManagerFactory._build_manager()._repository, "_load_many")
+    _submit(task, 4, now - timedelta(minutes=1))
+    assert worker._archive_expired_entities(now) == (1, 1)
+
+    # Only the new submission and the running one are loaded, then the expired one is archived as stored.
+    assert sorted(load_many.call_args_list[0].args[0]) == ["SUBMISSION_3", "SUBMISSION_4"]
+    assert load_many.call_args_list[1].args[0] == ["SUBMISSION_1"]
+    assert sorted(s.id for s in tp.get_submissions()) == ["SUBMISSION_2", "SUBMISSION_3", "SUBMISSION_4"]
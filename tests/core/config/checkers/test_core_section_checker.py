@@ -51,3 +51,27 @@ class TestCoreSectionChecker:
         assert len(Config._collector.warnings) == 1
         assert Config._collector.warnings[0].field == CoreSection._REPOSITORY_TYPE_KEY
         assert Config._collector.warnings[0].value == 1
+
+    def test_check_filesystem_layout(self):
+        Config.configure_core(repository_properties={"filesystem_layout": "sharded"})
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.warnings) == 0
+
+        Config.configure_core(repository_properties={"filesystem_layout": "any"})
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.warnings) == 1
+        assert Config._collector.warnings[0].field == CoreSection._REPOSITORY_PROPERTIES_KEY
+
+    def test_check_serializer(self):
+        Config.configure_core(repository_properties={"serializer": "orjson"})
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.warnings) == 0
+
+        Config.configure_core(repository_properties={"serializer": "any"})
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.warnings) == 1
+        assert Config._collector.warnings[0].field == CoreSection._REPOSITORY_PROPERTIES_KEY
@@ -32,12 +32,24 @@ class TestJobConfigChecker:
         Config.check()
         assert len(Config._collector.errors) == 0
 
+        Config.configure_job_executions(mode=JobConfig._REMOTE_MODE, address="localhost:5755")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "An authentication key is required in remote mode." in caplog.text
+
+        Config.configure_job_executions(mode=JobConfig._REMOTE_MODE, address="localhost:5755", authkey="key")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
         Config.configure_job_executions(mode="foo", max_nb_of_workers=2)
         with pytest.raises(SystemExit):
             Config._collector = IssueCollector()
             Config.check()
         assert len(Config._collector.errors) == 1
-        expected_error_message = "Job execution mode must be either development, standalone."
+        expected_error_message = "Job execution mode must be either development, standalone, remote."
         assert expected_error_message in caplog.text
 
         Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
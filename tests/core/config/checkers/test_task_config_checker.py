@@ -311,3 +311,17 @@ class TestTaskConfigChecker:
         Config.check()
         assert len(Config._collector.errors) == 0
         assert len(Config._collector.warnings) == 2
+
+    def test_check_executor(self, caplog):
+        Config.configure_task("thread_task", print, executor="thread")
+        Config.configure_task("process_task", print, executor="process")
+        Config._collector = IssueCollector()
+        Config.check()
+        assert len(Config._collector.errors) == 0
+
+        Config.configure_task("wrong_task", print, executor="gpu")
+        with pytest.raises(SystemExit):
+            Config._collector = IssueCollector()
+            Config.check()
+        assert len(Config._collector.errors) == 1
+        assert "executor field of TaskConfig `wrong_task` must be either process, thread." in caplog.text
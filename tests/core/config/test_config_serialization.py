@@ -121,6 +121,9 @@ read_entity_retry = "0:int"
 mode = "development"
 version_number = ""
 force = "False:bool"
+entity_cache = "True:bool"
+entity_cache_max_size = "10000:int"
+retention_interval = "60:int"
 core_version = "{CoreSection._CURRENT_CORE_VERSION}"
 
 [DATA_NODE.default]
@@ -287,7 +290,10 @@ def test_read_write_json_configuration_file():
 "read_entity_retry": "0:int",
 "mode": "development",
 "version_number": "",
-"force": "False:bool","""
+"force": "False:bool",
+"entity_cache": "True:bool",
+"entity_cache_max_size": "10000:int",
+"retention_interval": "60:int","""
         + f"""
 "core_version": "{CoreSection._CURRENT_CORE_VERSION}"
 """
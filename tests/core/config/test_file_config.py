@@ -38,6 +38,9 @@ read_entity_retry = "0:int"
 mode = "development"
 version_number = ""
 force = "False:bool"
+entity_cache = "True:bool"
+entity_cache_max_size = "10000:int"
+retention_interval = "60:int"
 core_version = "{CoreSection._CURRENT_CORE_VERSION}"
 
 [DATA_NODE.default]
@@ -13,7 +13,6 @@ import os
 import pickle
 import shutil
 from datetime import datetime
-from queue import Queue
 from unittest.mock import patch
 
 import pandas as pd
@@ -25,6 +24,7 @@ from taipy.common.config import Config
 from taipy.common.config.checker._checker import _Checker
 from taipy.common.config.common.frequency import Frequency
 from taipy.common.config.common.scope import Scope
+from taipy.core._orchestrator._job_queue import _JobQueue
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core._version._version import _Version
 from taipy.core._version._version_manager_factory import _VersionManagerFactory
@@ -383,8 +383,12 @@ def init_orchestrator():
         if _OrchestratorFactory._orchestrator is None:
             _OrchestratorFactory._build_orchestrator()
         _OrchestratorFactory._build_dispatcher(force_restart=True)
-        _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
+        _OrchestratorFactory._orchestrator.jobs_to_run = _JobQueue()
         _OrchestratorFactory._orchestrator.blocked_jobs = []
+        _OrchestratorFactory._orchestrator._blocked_jobs_by_input = {}
+        _OrchestratorFactory._orchestrator._unready_inputs_by_job = {}
+        _OrchestratorFactory._orchestrator._blocked_job_priorities = {}
+        _OrchestratorFactory._orchestrator._handoffs_by_submission = {}
 
     return _init_orchestrator
 
@@ -27,6 +27,7 @@ from taipy.core.data.data_node_id import DataNodeId
 from taipy.core.data.in_memory import InMemoryDataNode
 from taipy.core.exceptions.exceptions import DataNodeIsBeingEdited, NoData
 from taipy.core.job.job_id import JobId
+from taipy.core.notification import EventEntityType, Notifier
 from taipy.core.task.task import Task
 
 from .utils import FakeDataNode
@@ -692,6 +693,40 @@ class TestDataNode:
         assert last_edit["env"] == "staging"
         assert last_edit["timestamp"] == date
 
+    def test_write_and_lock_save_the_data_node_once(self):
+        dn_config = Config.configure_data_node("A")
+        data_node = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+        repository = _DataManagerFactory._build_manager()._repository
+
+        with mock.patch.object(repository, "_save", wraps=repository._save) as save:
+            data_node.lock_edit("editor")
+            assert save.call_count == 1
+            data_node.write("data", job_id=JobId("job_1"))
+            assert save.call_count == 2
+            data_node.lock_edit()
+            data_node.unlock_edit()
+            assert save.call_count == 4
+
+        data_node = _DataManagerFactory._build_manager()._get(data_node.id)
+        assert data_node.read() == "data"
+        assert data_node.job_ids == ["job_1"]
+        assert not data_node.edit_in_progress
+        assert data_node.editor_id is None
+        assert data_node.editor_expiration_date is None
+
+    def test_write_publishes_attribute_update_events(self):
+        dn_config = Config.configure_data_node("A")
+        data_node = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+        register_id, register_queue = Notifier.register(entity_type=EventEntityType.DATA_NODE)
+
+        data_node.write("data")
+
+        attribute_names = []
+        while not register_queue.empty():
+            attribute_names.append(register_queue.get().attribute_name)
+        assert attribute_names == ["last_edit_date", "editor_id", "editor_expiration_date", "edit_in_progress"]
+        Notifier.unregister(register_id)
+
     def test_label(self):
         a_date = datetime.now()
         dn = DataNode(
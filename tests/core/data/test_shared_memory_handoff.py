@@ -0,0 +1,222 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from taipy.common.config import Config
+from taipy.core import taipy
+from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data._shared_memory_handoff import _SharedMemoryHandoff
+from taipy.core.data.pickle import PickleDataNode
+from taipy.core.exceptions.exceptions import NoData
+from taipy.core.job.job_id import JobId
+
+
+def _segment_exists(name: str) -> bool:
+    try:
+        shared_memory.SharedMemory(name).close()
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _create_data_node(**properties):
+    dn_config = Config.configure_pickle_data_node("handed_off", **properties)
+    return _DataManagerFactory._build_manager()._create_and_set(dn_config, None, None)
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"a": np.arange(1_000), "b": np.random.rand(1_000)})
+
+
+def test_hand_off_disabled_by_default(data):
+    dn = _create_data_node()
+
+    assert not _SharedMemoryHandoff._hand_off(dn, data, JobId("job_id"))
+    assert not _segment_exists(_SharedMemoryHandoff._segment_name(dn.id, "job_id"))
+
+
+def test_hand_off_and_read(data):
+    dn = _create_data_node(handoff=True)
+    segment_name = _SharedMemoryHandoff._segment_name(dn.id, "job_id")
+
+    try:
+        assert _SharedMemoryHandoff._hand_off(dn, data, JobId("job_id"))
+        dn = _DataManagerFactory._build_manager()._get(dn.id)
+        assert dn.job_ids == ["job_id"]
+        assert dn.is_ready_for_reading
+
+        read_data = _SharedMemoryHandoff._read_or_raise(dn)
+        assert_frame_equal(read_data, data)
+        # The read data does not refer to the segment memory.
+        read_data.loc[0, "a"] = -1
+
+        _SharedMemoryHandoff._wait_for_persistence()
+        assert_frame_equal(dn.read(), data)
+    finally:
+        _SharedMemoryHandoff._release([segment_name])
+    assert not _segment_exists(segment_name)
+
+
+def test_transient_data_is_not_persisted(data):
+    dn = _create_data_node(handoff=True, transient=True)
+    segment_name = _SharedMemoryHandoff._segment_name(dn.id, "job_id")
+
+    try:
+        assert _SharedMemoryHandoff._hand_off(dn, data, JobId("job_id"))
+        _SharedMemoryHandoff._wait_for_persistence()
+        assert not os.path.exists(dn.path)
+        assert_frame_equal(_SharedMemoryHandoff._read_or_raise(dn), data)
+    finally:
+        _SharedMemoryHandoff._release([segment_name])
+
+
+def test_read_from_the_storage_once_released(data):
+    dn = _create_data_node(handoff=True)
+    assert _SharedMemoryHandoff._hand_off(dn, data, JobId("job_id"))
+    _SharedMemoryHandoff._wait_for_persistence()
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(dn, "_read", lambda: "from storage")
+        assert isinstance(_SharedMemoryHandoff._read_or_raise(dn), pd.DataFrame)
+        _SharedMemoryHandoff._release([_SharedMemoryHandoff._segment_name(dn.id, "job_id")])
+        assert _SharedMemoryHandoff._read_or_raise(dn) == "from storage"
+
+
+def _block_persistence(monkeypatch, data_node_id: str) -> threading.Event:
+    persistence_allowed = threading.Event()
+    write = PickleDataNode._write
+
+    def blocked_write(self, data):
+        if self.id == data_node_id:
+            persistence_allowed.wait(10)
+        write(self, data)
+
+    monkeypatch.setattr(PickleDataNode, "_write", blocked_write)
+    return persistence_allowed
+
+
+def test_read_waits_for_the_persistence_once_released(data, monkeypatch):
+    dn = _create_data_node(handoff=True)
+    persistence_allowed = _block_persistence(monkeypatch, dn.id)
+    assert _SharedMemoryHandoff._hand_off(dn, data, JobId("job_id"))
+    assert dn.edits[-1]["pending_persistence"]
+    _SharedMemoryHandoff._release([_SharedMemoryHandoff._segment_name(dn.id, "job_id")])
+
+    read_data = []
+    reader = threading.Thread(target=lambda: read_data.append(dn.read()))
+    reader.start()
+    reader.join(timeout=0.5)
+    assert reader.is_alive()
+
+    persistence_allowed.set()
+    reader.join()
+    assert_frame_equal(read_data[0], data)
+    assert "pending_persistence" not in dn.edits[-1]
+
+
+def test_persistence_of_superseded_data_is_skipped(data, monkeypatch):
+    other_dn = _create_data_node(handoff=True)
+    dn = _create_data_node(handoff=True)
+    # The persistence of the data of dn waits for the one of other_dn.
+    persistence_allowed = _block_persistence(monkeypatch, other_dn.id)
+    segment_names = [_SharedMemoryHandoff._segment_name(dn_id, "job_id") for dn_id in (dn.id, other_dn.id)]
+
+    try:
+        assert _SharedMemoryHandoff._hand_off(other_dn, data, JobId("job_id"))
+        assert _SharedMemoryHandoff._hand_off(dn, data, JobId("job_id"))
+        _DataManagerFactory._build_manager()._get(dn.id).write("later data")
+
+        persistence_allowed.set()
+        _SharedMemoryHandoff._wait_for_persistence()
+        assert dn.read() == "later data"
+        assert all("pending_persistence" not in edit for edit in dn.edits)
+    finally:
+        _SharedMemoryHandoff._release(segment_names)
+
+
+def double(df):
+    return df * 2
+
+
+def add_one(df):
+    return df + 1
+
+
+def _configure_handoff_scenario(skippable: bool = False):
+    input_cfg = Config.configure_pickle_data_node("raw")
+    intermediate_cfg = Config.configure_pickle_data_node("intermediate", handoff=True, transient=True)
+    output_cfg = Config.configure_pickle_data_node("result")
+    task_1_cfg = Config.configure_task("double", double, input_cfg, intermediate_cfg, skippable=skippable)
+    task_2_cfg = Config.configure_task("add_one", add_one, intermediate_cfg, output_cfg)
+    return Config.configure_scenario("scenario", [task_1_cfg, task_2_cfg])
+
+
+def test_submission_hands_off_intermediate_data(data):
+    scenario_cfg = _configure_handoff_scenario()
+
+    _OrchestratorFactory._build_dispatcher()
+    scenario = taipy.create_scenario(scenario_cfg)
+    scenario.raw.write(data)
+    submission = taipy.submit(scenario)
+
+    assert_frame_equal(scenario.result.read(), data * 2 + 1)
+    assert submission.id not in _OrchestratorFactory._orchestrator._handoffs_by_submission
+    intermediate_job = next(job for job in submission.jobs if job.task.config_id == "double")
+    assert not _segment_exists(_SharedMemoryHandoff._segment_name(scenario.intermediate.id, intermediate_job.id))
+    assert not os.path.exists(scenario.intermediate.path)
+
+
+def test_transient_data_node_is_invalidated_once_released(data):
+    dn = _create_data_node(handoff=True, transient=True)
+    assert _SharedMemoryHandoff._hand_off(dn, data, JobId("job_id"))
+    _SharedMemoryHandoff._release([_SharedMemoryHandoff._segment_name(dn.id, "job_id")])
+
+    with pytest.raises(NoData):
+        dn.read_or_raise()
+    assert dn.is_valid
+
+    _SharedMemoryHandoff._invalidate([(dn.id, JobId("other_job_id"))])
+    assert _DataManagerFactory._build_manager()._get(dn.id).is_valid
+    _SharedMemoryHandoff._invalidate([(dn.id, JobId("job_id"))])
+    dn = _DataManagerFactory._build_manager()._get(dn.id)
+    assert not dn.is_valid
+    with pytest.raises(NoData):
+        dn.read_or_raise()
+
+
+def test_skippable_task_writes_a_released_transient_data_node_again(data):
+    scenario_cfg = _configure_handoff_scenario(skippable=True)
+
+    _OrchestratorFactory._build_dispatcher()
+    scenario = taipy.create_scenario(scenario_cfg)
+    scenario.raw.write(data)
+    taipy.submit(scenario)
+    assert_frame_equal(scenario.result.read(), data * 2 + 1)
+    assert not scenario.intermediate.is_valid
+    assert scenario.intermediate.read() is None
+
+    scenario.raw.write(data + 1)
+    submission = taipy.submit(scenario)
+
+    assert all(job.is_completed() for job in submission.jobs)
+    assert_frame_equal(scenario.result.read(), (data + 1) * 2 + 1)
+    with pytest.raises(NoData):
+        scenario.intermediate.read_or_raise()
@@ -29,6 +29,7 @@ from taipy.core.data._data_manager_factory import _DataManagerFactory
 from taipy.core.data.in_memory import InMemoryDataNode
 from taipy.core.exceptions.exceptions import JobNotDeletedException
 from taipy.core.job._job_manager import _JobManager
+from taipy.core.job.job import Job
 from taipy.core.job.job_id import JobId
 from taipy.core.job.status import Status
 from taipy.core.scenario.scenario import Scenario
@@ -109,6 +110,42 @@ def test_get_latest_job():
     assert _JobManager._get_latest(task_2).id == job_2.id
 
 
+def test_get_latest_job_does_not_load_all_jobs_again(mocker):
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+
+    task = _create_task(multiply, name="get_latest_job_indexed")
+    job_1 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+    assert _JobManager._get_latest(task).id == job_1.id
+
+    get_all = mocker.spy(_JobManager, "_get_all")
+    sleep(0.01)  # Comparison is based on time, precision on Windows is not enough important
+    job_2 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+    assert _JobManager._get_latest(task).id == job_2.id
+    assert get_all.call_count == 0
+
+    _JobManager._delete(job_2)
+    assert _JobManager._get_latest(task).id == job_1.id
+    _JobManager._delete(job_1)
+    assert _JobManager._get_latest(task) is None
+
+
+def test_get_latest_job_sees_jobs_saved_by_other_processes():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+
+    task = _create_task(multiply, name="get_latest_job_other_processes")
+    job_1 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+    assert _JobManager._get_latest(task).id == job_1.id
+
+    # Saving through the repository bypasses the manager, as another process would.
+    sleep(0.01)  # Comparison is based on time, precision on Windows is not enough important
+    job_2 = Job(JobId("job_saved_by_another_process"), task, job_1.submit_id, task.id)
+    _JobManager._repository._save(job_2)
+    assert _JobManager._get_latest(task).id == job_2.id
+
+    _JobManager._repository._delete(job_2.id)
+    assert _JobManager._get_latest(task).id == job_1.id
+
+
 def test_get_job_unknown():
     assert _JobManager._get(JobId("Unknown")) is None
 
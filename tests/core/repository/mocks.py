@@ -17,6 +17,8 @@ from typing import Any, Dict, Optional
 from taipy.common.config import Config
 from taipy.core._repository._abstract_converter import _AbstractConverter
 from taipy.core._repository._filesystem_repository import _FileSystemRepository
+from taipy.core._repository._journal_repository import _JournalRepository
+from taipy.core._repository._sql_repository import _SQLRepository
 from taipy.core._version._version_manager import _VersionManager
 
 
@@ -72,3 +74,17 @@ class MockFSRepository(_FileSystemRepository):
     @property
     def _storage_folder(self) -> pathlib.Path:
         return pathlib.Path(Config.core.storage_folder)  # type: ignore
+
+
+class MockSQLRepository(_SQLRepository):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MockJournalRepository(_JournalRepository):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    @property
+    def _storage_folder(self) -> pathlib.Path:
+        return pathlib.Path(Config.core.storage_folder)  # type: ignore
@@ -0,0 +1,111 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+
+import pytest
+
+from taipy.core._repository._filesystem_index import _FileSystemIndex
+
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+
+
+@pytest.fixture
+def repository():
+    r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    r._delete_all()
+    yield r
+    r._delete_all()
+
+
+def _read_files_spy(mocker):
+    return mocker.spy(MockFSRepository, "_FileSystemRepository__read_file")
+
+
+class TestFileSystemIndex:
+    def test_filtered_load_only_reads_matching_files(self, repository, mocker):
+        for i in range(10):
+            repository._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0" if i < 2 else "2.0"))
+
+        read_file = _read_files_spy(mocker)
+        entities = repository._load_all([{"version": "1.0"}])
+
+        assert sorted(e.id for e in entities) == ["uuid-0", "uuid-1"]
+        assert read_file.call_count == 2
+
+    def test_unindexed_filter_falls_back_to_scan(self, repository, mocker):
+        for i in range(5):
+            repository._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0"))
+
+        read_file = _read_files_spy(mocker)
+        entities = repository._load_all([{"name": "Foo3"}])
+
+        assert [e.id for e in entities] == ["uuid-3"]
+        assert read_file.call_count == 5
+
+    def test_delete_keeps_index_up_to_date(self, repository):
+        for i in range(4):
+            repository._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0" if i % 2 else "2.0"))
+
+        repository._delete("uuid-1")
+        assert [e.id for e in repository._load_all([{"version": "1.0"}])] == ["uuid-3"]
+
+        repository._delete_by("version", "2.0")
+        assert [e.id for e in repository._load_all()] == ["uuid-3"]
+        assert repository._index._get_candidates([{"version": "2.0"}]) == set()
+
+    def test_delete_by_version_only_reads_its_files(self, repository, mocker):
+        for i in range(10):
+            repository._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0" if i < 3 else "2.0"))
+
+        read_file = _read_files_spy(mocker)
+        append = mocker.spy(repository._index, "_FileSystemIndex__append")
+        repository._delete_by("version", "1.0")
+
+        assert read_file.call_count == 3
+        assert append.call_count == 1
+        assert sorted(f.stem for f in repository.dir_path.iterdir()) == [f"uuid-{i}" for i in range(3, 10)]
+
+    def test_index_is_persisted(self, repository, mocker):
+        mocker.patch.object(_FileSystemIndex, "_RACY_WINDOW_NS", -1)
+        for i in range(5):
+            repository._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0" if i < 3 else "2.0"))
+        assert repository._load_all([{"version": "2.0"}])
+
+        other_repository = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        loader = mocker.spy(other_repository._index, "_loader")
+
+        entities = other_repository._load_all([{"version": "1.0"}])
+
+        assert sorted(e.id for e in entities) == ["uuid-0", "uuid-1", "uuid-2"]
+        assert loader.call_count == 0
+
+    def test_index_is_rebuilt_when_stale(self, repository):
+        repository._save(MockObj("uuid-0", "Foo0", version="1.0"))
+        assert len(repository._load_all([{"version": "1.0"}])) == 1
+
+        # A file written behind the repository back
+        with open(repository.dir_path / "uuid-1.json", "w") as f:
+            json.dump({"id": "uuid-1", "name": "Foo1", "version": "1.0"}, f)
+        assert sorted(e.id for e in repository._load_all([{"version": "1.0"}])) == ["uuid-0", "uuid-1"]
+
+        # A file removed behind the repository back
+        (repository.dir_path / "uuid-0.json").unlink()
+        assert [e.id for e in repository._load_all([{"version": "1.0"}])] == ["uuid-1"]
+
+    def test_index_is_rebuilt_when_missing(self, repository):
+        for i in range(3):
+            repository._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0"))
+        repository._index.journal_path.unlink()
+
+        other_repository = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        assert len(other_repository._load_all([{"version": "1.0"}])) == 3
+        assert other_repository._index.journal_path.exists()
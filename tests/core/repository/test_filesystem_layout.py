@@ -0,0 +1,82 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.core._repository._filesystem_layout import (
+    _FileSystemLayout,
+    _get_layout,
+    _relocate_files,
+    _ShardedFileSystemLayout,
+)
+
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+
+
+@pytest.fixture
+def sharded_repository():
+    Config.configure_core(repository_properties={"filesystem_layout": "sharded"})
+    r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    r._delete_all()
+    yield r
+    r._delete_all()
+
+
+class TestShardedFileSystemLayout:
+    def test_get_layout(self):
+        assert isinstance(_get_layout("sharded"), _ShardedFileSystemLayout)
+        assert type(_get_layout("flat")) is _FileSystemLayout
+        assert type(_get_layout(None)) is _FileSystemLayout
+        assert type(_get_layout("unknown")) is _FileSystemLayout
+
+    def test_entity_files_are_stored_in_shards(self, sharded_repository):
+        for i in range(20):
+            sharded_repository._save(MockObj(f"uuid-{i}", f"foo-{i}", version="1.0"))
+
+        path = sharded_repository.dir_path / _ShardedFileSystemLayout._shard("uuid-3") / "uuid-3.json"
+        assert path.is_file()
+        assert not any(f.is_file() for f in sharded_repository.dir_path.iterdir())
+        assert len(list(sharded_repository.dir_path.iterdir())) > 1
+
+        assert sharded_repository._exists("uuid-3")
+        assert sharded_repository._load("uuid-3").name == "foo-3"
+        assert len(sharded_repository._load_all()) == 20
+        assert len(sharded_repository._load_all(filters=[{"version": "1.0"}])) == 20
+        assert [obj.id for obj in sharded_repository._search("name", "foo-3")] == ["uuid-3"]
+
+        sharded_repository._delete("uuid-3")
+        assert not path.exists()
+        assert len(sharded_repository._load_all()) == 19
+
+    def test_index_detects_file_added_to_a_shard(self, sharded_repository):
+        sharded_repository._save(MockObj("uuid-0", "foo", version="1.0"))
+        assert len(sharded_repository._load_all(filters=[{"version": "1.0"}])) == 1
+
+        path = sharded_repository._layout._get_path(sharded_repository.dir_path, "uuid-1")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"id": "uuid-1", "name": "bar", "version": "1.0"}))
+
+        assert len(sharded_repository._load_all(filters=[{"version": "1.0"}])) == 2
+
+    def test_relocate_files(self, sharded_repository):
+        for i in range(20):
+            sharded_repository._save(MockObj(f"uuid-{i}", f"foo-{i}", version="1.0"))
+        dir_path = sharded_repository.dir_path
+
+        assert _relocate_files(dir_path, _FileSystemLayout()) == 20
+        assert sorted(f.name for f in dir_path.iterdir()) == sorted(f"uuid-{i}.json" for i in range(20))
+
+        assert _relocate_files(dir_path, _ShardedFileSystemLayout()) == 20
+        assert _relocate_files(dir_path, _ShardedFileSystemLayout()) == 0
+        assert sorted(obj.id for obj in sharded_repository._load_all()) == sorted(f"uuid-{i}" for i in range(20))
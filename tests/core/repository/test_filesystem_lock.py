@@ -0,0 +1,78 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.core._repository._filesystem_lock import _FCNTL_AVAILABLE, _FileSystemLock, _write_atomically
+
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+
+
+@pytest.fixture
+def repository():
+    r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    r._delete_all()
+    yield r
+    r._delete_all()
+
+
+class TestFileSystemLock:
+    def test_write_atomically(self, tmp_path):
+        path = tmp_path / "entity.json"
+        _write_atomically(path, b"first")
+        _write_atomically(path, b"second", fsync=True)
+
+        assert path.read_bytes() == b"second"
+        assert [f.name for f in tmp_path.iterdir()] == ["entity.json"]
+
+    @pytest.mark.skipif(not _FCNTL_AVAILABLE, reason="fcntl is not available")
+    def test_exclusive_lock_excludes_readers(self, tmp_path):
+        lock = _FileSystemLock(tmp_path / "locks" / "entity.lock")
+        events = []
+
+        def read():
+            with lock._shared():
+                events.append("read")
+
+        with lock._exclusive():
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(timeout=0.2)
+            events.append("written")
+        reader.join()
+
+        assert events == ["written", "read"]
+
+    def test_readers_never_see_partial_files(self, repository):
+        Config.configure_core(repository_properties={"filesystem_fsync": True})
+        repository._save(MockObj("uuid", "foo-0"))
+        stop = threading.Event()
+
+        def write():
+            i = 0
+            while not stop.is_set():
+                i += 1
+                repository._save(MockObj("uuid", f"foo-{i}"))
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(200):
+                assert repository._load("uuid").name.startswith("foo-")
+                assert len(repository._load_all()) == 1
+        finally:
+            stop.set()
+            writer.join()
+
+        assert [f.name for f in repository.dir_path.iterdir()] == ["uuid.json"]
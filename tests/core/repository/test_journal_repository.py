@@ -0,0 +1,164 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import threading
+
+import pytest
+
+from taipy import Config
+from taipy.core.data._data_fs_repository import _DataFSRepository
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.exceptions.exceptions import ModelNotFound
+from taipy.core.job._job_journal_repository import _JobJournalRepository
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.submission._submission_journal_repository import _SubmissionJournalRepository
+from taipy.core.submission._submission_manager_factory import _SubmissionManagerFactory
+
+from .mocks import MockConverter, MockJournalRepository, MockModel, MockObj
+
+_FACTORIES = [_DataManagerFactory, _JobManagerFactory, _SubmissionManagerFactory]
+
+
+def _new_repository():
+    return MockJournalRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+
+
+def _read_records(repository):
+    return [
+        json.loads(line)
+        for segment in sorted(repository.dir_path.iterdir())
+        for line in segment.read_text(encoding="UTF-8").splitlines()
+    ]
+
+
+@pytest.fixture
+def repository():
+    r = _new_repository()
+    r._delete_all()
+    yield r
+    r._delete_all()
+
+
+@pytest.fixture
+def journal_managers():
+    Config.configure_core(repository_type="journal")
+    for factory in _FACTORIES:
+        factory._build_manager.cache_clear()
+        factory._build_repository.cache_clear()
+    yield
+    Config.configure_core(repository_type="filesystem")
+    for factory in _FACTORIES:
+        factory._build_manager.cache_clear()
+        factory._build_repository.cache_clear()
+
+
+class TestJournalRepository:
+    def test_save_only_appends_changes(self, repository):
+        repository._save(MockObj("uuid", "foo", version="1.0"))
+        repository._save(MockObj("uuid", "bar", version="1.0"))
+        repository._save(MockObj("uuid", "bar", version="1.0"))
+
+        assert _read_records(repository) == [
+            {"id": "uuid", "model": {"id": "uuid", "name": "foo", "version": "1.0"}},
+            {"id": "uuid", "set": {"name": "bar"}},
+        ]
+        assert repository._load("uuid").name == "bar"
+
+    def test_delete_appends_a_record(self, repository):
+        repository._save(MockObj("uuid", "foo", version="1.0"))
+        repository._delete("uuid")
+
+        assert _read_records(repository)[-1] == {"id": "uuid", "deleted": True}
+        assert not repository._exists("uuid")
+        with pytest.raises(ModelNotFound):
+            repository._load("uuid")
+        with pytest.raises(ModelNotFound):
+            repository._delete("uuid")
+
+    def test_records_of_other_processes_are_replayed(self, repository):
+        other_repository = _new_repository()
+        repository._save(MockObj("uuid-0", "foo", version="1.0"))
+        assert other_repository._load("uuid-0").name == "foo"
+
+        other_repository._save(MockObj("uuid-0", "bar", version="1.0"))
+        other_repository._save(MockObj("uuid-1", "baz", version="1.0"))
+        repository._save(MockObj("uuid-2", "qux", version="1.0"))
+
+        assert repository._load("uuid-0").name == "bar"
+        assert sorted(obj.name for obj in repository._load_all()) == ["bar", "baz", "qux"]
+        assert sorted(obj.name for obj in other_repository._load_all()) == ["bar", "baz", "qux"]
+
+    def test_incomplete_record_is_ignored(self, repository):
+        repository._save(MockObj("uuid", "foo", version="1.0"))
+        segment = next(repository.dir_path.iterdir())
+        with segment.open("a", encoding="UTF-8") as f:
+            f.write('{"id": "uuid", "set": {"na')
+
+        assert repository._load("uuid").name == "foo"
+        assert _new_repository()._load("uuid").name == "foo"
+
+    def test_revision_changes_on_save(self, repository):
+        repository._save(MockObj("uuid", "foo", version="1.0"))
+        revision = repository._revision("uuid")
+
+        assert repository._revision("uuid") == revision
+        repository._save(MockObj("uuid", "bar", version="1.0"))
+        assert repository._revision("uuid") != revision
+        assert repository._revision("not-existed-model") is None
+
+    def test_compaction(self, repository, monkeypatch):
+        monkeypatch.setattr(MockJournalRepository, "_COMPACTION_THRESHOLD", 10)
+        for i in range(30):
+            repository._save(MockObj(f"uuid-{i % 3}", f"foo-{i}", version="1.0"))
+        repository._delete("uuid-2")
+
+        segments = list(repository.dir_path.iterdir())
+        assert len(segments) == 1
+        assert segments[0].name != "segment-00000001.log"
+        assert len(_read_records(repository)) < 14
+        assert {obj.id: obj.name for obj in repository._load_all()} == {"uuid-0": "foo-27", "uuid-1": "foo-28"}
+        assert {obj.id: obj.name for obj in _new_repository()._load_all()} == {"uuid-0": "foo-27", "uuid-1": "foo-28"}
+
+    def test_concurrent_appends_and_compactions(self, repository, monkeypatch):
+        # Each repository instance stands for a process, with its own view of the journal.
+        monkeypatch.setattr(MockJournalRepository, "_COMPACTION_THRESHOLD", 5)
+
+        def write(writer: int):
+            writer_repository = _new_repository()
+            for i in range(100):
+                writer_repository._save(MockObj(f"uuid-{writer}-{i % 2}", f"foo-{i}", version="1.0"))
+
+        writers = [threading.Thread(target=write, args=(writer,)) for writer in range(3)]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join()
+
+        expected = {f"uuid-{writer}-{i}": f"foo-{98 + i}" for writer in range(3) for i in range(2)}
+        assert {obj.id: obj.name for obj in repository._load_all()} == expected
+        assert {obj.id: obj.name for obj in _new_repository()._load_all()} == expected
+
+    def test_load_all_with_filters(self, repository):
+        for i in range(10):
+            repository._save(MockObj(f"uuid-{i}", f"foo-{i % 2}", version=f"{i % 3}.0"))
+
+        assert len(repository._load_all([{"name": "foo-0"}])) == 5
+        assert len(repository._load_all([{"name": "foo-0", "version": "0.0"}])) == 2
+        assert len(repository._load_all([{"version": "1.0"}, {"version": "2.0"}])) == 6
+
+        repository._delete_by("version", "0.0")
+        assert len(repository._load_all()) == 6
+
+    def test_journal_repository_type_only_applies_to_jobs_and_submissions(self, journal_managers):
+        assert isinstance(_JobManagerFactory._build_manager()._repository, _JobJournalRepository)
+        assert isinstance(_SubmissionManagerFactory._build_manager()._repository, _SubmissionJournalRepository)
+        assert isinstance(_DataManagerFactory._build_manager()._repository, _DataFSRepository)
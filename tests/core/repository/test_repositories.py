@@ -18,7 +18,7 @@ import pytest
 
 from taipy.core.exceptions.exceptions import ModelNotFound
 
-from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+from .mocks import MockConverter, MockFSRepository, MockJournalRepository, MockModel, MockObj, MockSQLRepository
 
 
 class TestRepositoriesStorage:
@@ -42,6 +42,8 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+            (MockJournalRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_save_and_fetch_model(self, mock_repo, params):
@@ -56,6 +58,8 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+            (MockJournalRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_exists(self, mock_repo, params):
@@ -70,6 +74,8 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+            (MockJournalRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_get_all(self, mock_repo, params):
@@ -93,6 +99,54 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+            (MockJournalRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_load_many(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+
+        for i in range(50):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i}"))
+
+        loaded = r._load_many(["uuid-1", "uuid-3", "uuid-1", "not-existed-model"])
+        assert sorted(loaded) == ["uuid-1", "uuid-3"]
+        assert loaded["uuid-3"].name == "Foo3"
+
+        loaded = r._load_many(f"uuid-{i}" for i in range(50))
+        assert len(loaded) == 50
+        assert all(loaded[f"uuid-{i}"].name == f"Foo{i}" for i in range(50))
+        assert r._load_many([]) == {}
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+            (MockJournalRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_list_ids(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+        assert r._list_ids() == set()
+
+        for i in range(5):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i}"))
+        r._delete("uuid-2")
+        assert r._list_ids() == {"uuid-0", "uuid-1", "uuid-3", "uuid-4"}
+
+        # Entities saved by another repository instance, as another process would, are listed.
+        mock_repo(**params)._save(MockObj("uuid-5", "Foo5"))
+        assert r._list_ids() == {"uuid-0", "uuid-1", "uuid-3", "uuid-4", "uuid-5"}
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+            (MockJournalRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_all(self, mock_repo, params):
@@ -114,6 +168,8 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+            (MockJournalRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_many(self, mock_repo, params):
@@ -134,6 +190,8 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+            (MockJournalRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_search(self, mock_repo, params):
@@ -153,6 +211,8 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+            (MockJournalRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
         ],
     )
     @pytest.mark.parametrize("export_path", ["tmp"])
@@ -0,0 +1,68 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import pytest
+
+import taipy.core.taipy as tp
+from taipy.common.config import Config
+from taipy.core._repository._repository_stats import _RepositoryStats
+
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+
+
+@pytest.fixture
+def repository():
+    r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    r._delete_all()
+    _RepositoryStats._reset()
+    yield r
+    Config.configure_core(repository_properties={"collect_stats": False})
+    r._delete_all()
+    _RepositoryStats._reset()
+
+
+class TestRepositoryStats:
+    def test_stats_are_not_collected_by_default(self, repository):
+        repository._save(MockObj("uuid", "foo"))
+        repository._load("uuid")
+
+        assert tp.get_repository_stats() == {}
+
+    def test_stats_are_collected_per_operation(self, repository):
+        Config.configure_core(repository_properties={"collect_stats": True})
+        for i in range(3):
+            repository._save(MockObj(f"uuid-{i}", f"foo-{i}", version="1.0"))
+        repository._load("uuid-0")
+        repository._load_all([{"version": "1.0"}])
+        repository._search("name", "foo-1")
+
+        stats = tp.get_repository_stats()["mock_model"]
+
+        assert stats["save"]["count"] == 3
+        assert stats["save"]["bytes_written"] > 0
+        assert stats["load"]["count"] == 1
+        assert stats["load"]["files_scanned"] == 1
+        assert stats["load"]["bytes_read"] > 0
+        assert sum(stats["load"]["latency_histogram"].values()) == 1
+        assert stats["load_all"]["files_scanned"] == 3
+        assert stats["load_all"]["full_scans"] == 0
+        # The search is accounted for once, along with the files read by the _load_all it calls.
+        assert stats["search"]["count"] == 1
+        assert stats["search"]["files_scanned"] == 3
+        assert stats["search"]["full_scan_filters"] == {"<no filter>": 1}
+        assert stats["load_all"]["count"] == 1
+
+    def test_reset_stats(self, repository):
+        Config.configure_core(repository_properties={"collect_stats": True})
+        repository._save(MockObj("uuid", "foo"))
+
+        assert tp.get_repository_stats(reset=True)["mock_model"]["save"]["count"] == 1
+        assert tp.get_repository_stats() == {}
@@ -0,0 +1,75 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.core._repository._serializer import _get_serializer, _OrjsonSerializer, _Serializer
+
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+
+orjson = pytest.importorskip("orjson")
+
+_DOCUMENT = {
+    "id": "uuid",
+    "creation_date": datetime(2024, 1, 2, 3, 4, 5, 6),
+    "validity_period": timedelta(days=1, seconds=2),
+    "nested": {"dates": [datetime(2024, 1, 1)], "none": None, "name": "é"},
+    "values": [1, 2.5, True],
+}
+
+
+@pytest.fixture
+def orjson_repository():
+    Config.configure_core(repository_properties={"serializer": "orjson"})
+    r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+    r._delete_all()
+    yield r
+    r._delete_all()
+
+
+class TestSerializer:
+    def test_get_serializer(self):
+        assert type(_get_serializer(None)) is _Serializer
+        assert type(_get_serializer("json")) is _Serializer
+        assert type(_get_serializer("unknown")) is _Serializer
+        assert isinstance(_get_serializer("orjson"), _OrjsonSerializer)
+
+    @pytest.mark.parametrize("serializer", [_Serializer(), _OrjsonSerializer()])
+    def test_round_trip(self, serializer):
+        content = serializer._dumps(_DOCUMENT)
+        assert isinstance(content, bytes)
+        assert serializer._loads(content) == _DOCUMENT
+        assert serializer._loads(content.decode("UTF-8")) == _DOCUMENT
+
+    def test_serializers_read_each_other(self):
+        json_serializer, orjson_serializer = _Serializer(), _OrjsonSerializer()
+        assert orjson_serializer._loads(json_serializer._dumps(_DOCUMENT, indent=0)) == _DOCUMENT
+        assert json_serializer._loads(orjson_serializer._dumps(_DOCUMENT)) == _DOCUMENT
+
+    def test_orjson_falls_back_on_json(self):
+        document = {"big": 2**70, "keys": {1: "one"}}
+        content = _OrjsonSerializer()._dumps(document)
+        assert _OrjsonSerializer()._loads(content) == {"big": 2**70, "keys": {"1": "one"}}
+
+    def test_repository_reads_entities_written_with_json(self, orjson_repository):
+        Config.configure_core(repository_properties={})
+        orjson_repository._save(MockObj("uuid-0", "foo", version="1.0"))
+        Config.configure_core(repository_properties={"serializer": "orjson"})
+        orjson_repository._save(MockObj("uuid-1", "bar", version="1.0"))
+
+        assert b'"name":"bar"' in (orjson_repository.dir_path / "uuid-1.json").read_bytes()
+        assert orjson_repository._load("uuid-0").name == "foo"
+        assert orjson_repository._load("uuid-1").name == "bar"
+        assert len(orjson_repository._load_all(filters=[{"version": "1.0"}])) == 2
+        assert [obj.id for obj in orjson_repository._search("name", "bar")] == ["uuid-1"]
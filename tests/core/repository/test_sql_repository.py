@@ -0,0 +1,154 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+
+import pytest
+
+from taipy import Config, Scope
+from taipy.core._repository._sql_connection import _SQLConnection
+from taipy.core._version._version_manager_factory import _VersionManagerFactory
+from taipy.core.cycle._cycle_manager_factory import _CycleManagerFactory
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data._data_sql_repository import _DataSQLRepository
+from taipy.core.exceptions.exceptions import ModelNotFound
+from taipy.core.job._job_manager_factory import _JobManagerFactory
+from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
+from taipy.core.scenario._scenario_sql_repository import _ScenarioSQLRepository
+from taipy.core.submission._submission_manager_factory import _SubmissionManagerFactory
+from taipy.core.task._task_manager_factory import _TaskManagerFactory
+
+from .mocks import MockConverter, MockModel, MockObj, MockSQLRepository
+
+_FACTORIES = [
+    _CycleManagerFactory,
+    _DataManagerFactory,
+    _JobManagerFactory,
+    _ScenarioManagerFactory,
+    _SubmissionManagerFactory,
+    _TaskManagerFactory,
+    _VersionManagerFactory,
+]
+
+
+@pytest.fixture
+def repository():
+    r = MockSQLRepository(model_type=MockModel, table_name="mock_model", converter=MockConverter)
+    r._delete_all()
+    yield r
+    r._delete_all()
+
+
+@pytest.fixture
+def sql_managers(tmp_path):
+    Config.configure_core(repository_type="sql", repository_properties={"db_location": str(tmp_path / "db.sqlite3")})
+    for factory in _FACTORIES:
+        factory._build_manager.cache_clear()
+        factory._build_repository.cache_clear()
+    yield
+    _SQLConnection._close_all()
+    Config.configure_core(repository_type="filesystem", repository_properties={})
+    for factory in _FACTORIES:
+        factory._build_manager.cache_clear()
+        factory._build_repository.cache_clear()
+
+
+class TestSQLRepository:
+    def test_database_is_in_wal_mode(self, repository):
+        with repository._connection() as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_filtered_load_all(self, repository):
+        for i in range(6):
+            repository._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0" if i < 2 else "2.0"))
+
+        assert sorted(e.id for e in repository._load_all([{"version": "1.0"}])) == ["uuid-0", "uuid-1"]
+        assert [e.id for e in repository._load_all([{"version": "2.0", "name": "Foo4"}])] == ["uuid-4"]
+        assert len(repository._load_all([{"version": "1.0"}, {"name": "Foo5"}])) == 3
+        assert len(repository._load_all([{}])) == 6
+
+    def test_save_many_upserts(self, repository):
+        repository._save_many([MockObj(f"uuid-{i}", f"Foo{i}", version="1.0") for i in range(3)])
+        repository._save_many([MockObj("uuid-0", "Bar", version="2.0"), MockObj("uuid-3", "Foo3", version="1.0")])
+
+        assert len(repository._load_all()) == 4
+        assert repository._load("uuid-0").name == "Bar"
+        assert [e.id for e in repository._load_all([{"version": "2.0"}])] == ["uuid-0"]
+
+    def test_delete(self, repository):
+        for i in range(4):
+            repository._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0" if i % 2 else "2.0"))
+
+        repository._delete("uuid-1")
+        with pytest.raises(ModelNotFound):
+            repository._delete("uuid-1")
+        with pytest.raises(ModelNotFound):
+            repository._load("uuid-1")
+
+        repository._delete_by("version", "2.0")
+        assert [e.id for e in repository._load_all()] == ["uuid-3"]
+
+    def test_db_location_property(self, tmp_path):
+        db_location = tmp_path / "custom" / "taipy.db"
+        Config.configure_core(repository_properties={"db_location": str(db_location)})
+        r = MockSQLRepository(model_type=MockModel, table_name="mock_model", converter=MockConverter)
+
+        r._save(MockObj("uuid", "foo", version="1.0"))
+
+        assert os.path.exists(db_location)
+        assert r._load("uuid").name == "foo"
+        _SQLConnection._close_all()
+
+
+class TestSQLManagers:
+    def test_sql_repositories_are_used(self, sql_managers):
+        assert isinstance(_DataManagerFactory._build_manager()._repository, _DataSQLRepository)
+        assert isinstance(_ScenarioManagerFactory._build_manager()._repository, _ScenarioSQLRepository)
+
+    def test_get_by_configs_and_owner_ids(self, sql_managers):
+        dn_config_1 = Config.configure_data_node("dn_1", scope=Scope.SCENARIO)
+        dn_config_2 = Config.configure_data_node("dn_2", scope=Scope.GLOBAL)
+        data_manager = _DataManagerFactory._build_manager()
+
+        data_nodes = data_manager._bulk_get_or_create([dn_config_1, dn_config_2], scenario_id="SCENARIO_id")
+        assert len(data_manager._get_all()) == 2
+
+        found = data_manager._repository._get_by_configs_and_owner_ids(
+            [(dn_config_1, "SCENARIO_id"), (dn_config_2, None), (dn_config_1, "other_scenario")]
+        )
+        assert found == {
+            (dn_config_1, "SCENARIO_id"): data_nodes[dn_config_1],
+            (dn_config_2, None): data_nodes[dn_config_2],
+        }
+        assert data_manager._repository._get_by_config_and_owner_id("dn_2", None) == data_nodes[dn_config_2]
+        assert data_manager._repository._get_by_config_and_owner_id("dn_2", "SCENARIO_id") is None
+
+    def test_create_scenario(self, sql_managers):
+        dn_config = Config.configure_data_node("dn", default_data=1)
+        task_config = Config.configure_task("task", print, [dn_config])
+        scenario_config = Config.configure_scenario("scenario", [task_config])
+        scenario_manager = _ScenarioManagerFactory._build_manager()
+
+        scenario = scenario_manager._create(scenario_config)
+
+        assert scenario_manager._get(scenario.id) == scenario
+        assert len(_TaskManagerFactory._build_manager()._get_all()) == 1
+        assert len(_DataManagerFactory._build_manager()._get_all()) == 1
+
+    def test_versions(self, sql_managers):
+        version_manager = _VersionManagerFactory._build_manager()
+
+        development_version = version_manager._get_development_version()
+        assert version_manager._get_latest_version() == development_version
+
+        version_manager._set_experiment_version("1.0")
+        assert version_manager._get_latest_version() == "1.0"
+        assert version_manager._get_development_version() == development_version
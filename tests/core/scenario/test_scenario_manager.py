@@ -276,6 +276,36 @@ def test_get_all_on_multiple_versions_environment():
     assert len(_ScenarioManager._get_all_by(filters=[{"version": "2.0", "config_id": "config_id_6"}])) == 1
 
 
+def test_get_all_only_loads_scenarios():
+    dn_config = Config.configure_data_node("dn", default_data=1)
+    task_config = Config.configure_task("task", print, [dn_config])
+    scenario_config = Config.configure_scenario(
+        "sc", [task_config], sequences={"sequence": [task_config]}, frequency=Frequency.DAILY
+    )
+    scenario = _ScenarioManager._create(scenario_config)
+
+    task_repository, cycle_repository, data_repository = (
+        _TaskManager._repository,
+        _CycleManager._repository,
+        _DataManager._repository,
+    )
+    with patch.object(task_repository, "_load") as load_task, patch.object(task_repository, "_load_many") as load_tasks:
+        with patch.object(cycle_repository, "_load") as load_cycle:
+            with patch.object(data_repository, "_load_many") as load_data_nodes:
+                scenarios = _ScenarioManager._get_all()
+                _ = [(sc.owner_id, sc._cycle_id, list(sc._get_sequences())) for sc in scenarios]
+    assert len(scenarios) == 1
+    load_task.assert_not_called()
+    load_tasks.assert_not_called()
+    load_cycle.assert_not_called()
+    load_data_nodes.assert_not_called()
+
+    loaded_scenario = scenarios[0]
+    assert loaded_scenario._cycle == scenario.cycle
+    assert loaded_scenario.tasks["task"].input["dn"].id == scenario.tasks["task"].input["dn"].id
+    assert loaded_scenario.sequences["sequence"].tasks["task"].id == scenario.tasks["task"].id
+
+
 def test_create_scenario_does_not_modify_config():
     creation_date_1 = datetime.now()
     name_1 = "name_1"
@@ -117,6 +117,22 @@ def test_get_latest_submission():
     assert submission_manager._get_latest(task_2) == submission_4
 
 
+def test_get_latest_submission_does_not_load_all_submissions_again(mocker):
+    task = Task("task_config_1", {}, print, id="task_id_1")
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    submission_1 = submission_manager._create(task.id, task._ID_PREFIX, task.config_id)
+    assert submission_manager._get_latest(task) == submission_1
+
+    get_all = mocker.spy(submission_manager, "_get_all")
+    sleep(0.01)  # Comparison is based on time, precision on Windows is not enough important
+    submission_2 = submission_manager._create(task.id, task._ID_PREFIX, task.config_id)
+    assert submission_manager._get_latest(task) == submission_2
+    assert get_all.call_count == 0
+
+    submission_manager._hard_delete(submission_2.id)
+    assert submission_manager._get_latest(task) == submission_1
+
+
 def test_delete_submission():
     submission_manager = _SubmissionManagerFactory._build_manager()
 
@@ -10,10 +10,12 @@
 # specific language governing permissions and limitations under the License.
 
 import os
+from unittest import mock
 
 import pytest
 
 from taipy.core.data._data_fs_repository import _DataFSRepository
+from taipy.core.data._data_manager_factory import _DataManagerFactory
 from taipy.core.exceptions import ModelNotFound
 from taipy.core.task._task_fs_repository import _TaskFSRepository
 from taipy.core.task.task import Task, TaskId
@@ -62,6 +64,24 @@ class TestTaskFSRepository:
 
         assert len(data_nodes) == 10
 
+    def test_data_nodes_are_loaded_on_first_access(self, data_node):
+        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+        data_repository._save(data_node)
+        task = Task("task_config_id", {}, print, [data_node], [data_node])
+
+        for i in range(10):
+            task.id = TaskId(f"task-{i}")
+            task_repository._save(task)
+
+        data_manager = _DataManagerFactory._build_manager()
+        with mock.patch.object(data_manager._repository, "_load_many", wraps=data_manager._repository._load_many) as m:
+            tasks = task_repository._load_all()
+            m.assert_not_called()
+
+            assert tasks[0].input[data_node.config_id].id == data_node.id
+            assert tasks[0].output[data_node.config_id].id == data_node.id
+            m.assert_called_once()
+
     def test_load_all_with_filters(self, data_node):
         task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
         data_repository._save(data_node)
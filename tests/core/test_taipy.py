@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import asyncio
 import datetime
 from unittest import mock
 
@@ -340,6 +341,30 @@ class TestTaipy:
             tp.submit(task, True, True, 60)
             mck.assert_called_once_with(task, force=True, wait=True, timeout=60)
 
+    def test_submit_many(self, scenario, sequence, task):
+        with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator.submit_many") as mck, mock.patch(
+            "taipy.core.taipy._warn_if_inputs_not_ready"
+        ):
+            tp.submit_many([scenario, sequence, task, "not_an_entity"], True, True, 60, priority=1)
+            mck.assert_called_once_with(
+                [(scenario, []), (sequence, []), (task, [])], force=True, wait=True, timeout=60, priority=1
+            )
+
+    def test_submit_async(self, scenario):
+        submission = mock.MagicMock()
+        submission.wait_async = mock.AsyncMock(return_value=True)
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._submit") as mck:
+            mck.return_value = submission
+            assert asyncio.run(tp.submit_async(scenario, True, timeout=60, priority=1)) is submission
+            mck.assert_called_once_with(scenario, force=True, wait=False, timeout=None, priority=1)
+            submission.wait_async.assert_awaited_once_with(60)
+
+            mck.reset_mock()
+            submission.wait_async.reset_mock()
+            assert asyncio.run(tp.submit_async(scenario, wait=False)) is submission
+            mck.assert_called_once_with(scenario, force=False, wait=False, timeout=None)
+            submission.wait_async.assert_not_awaited()
+
     def test_warning_no_core_service_running(self, scenario):
         _OrchestratorFactory._remove_dispatcher()
 
@@ -13,7 +13,6 @@ import os
 import shutil
 import uuid
 from datetime import datetime, timedelta
-from queue import Queue
 
 import pandas as pd
 import pytest
@@ -23,6 +22,7 @@ from taipy.common.config import Config
 from taipy.common.config.common.frequency import Frequency
 from taipy.common.config.common.scope import Scope
 from taipy.core import Cycle, DataNodeId, Job, JobId, Scenario, Sequence, Task
+from taipy.core._orchestrator._job_queue import _JobQueue
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.cycle._cycle_manager import _CycleManager
 from taipy.core.data.pickle import PickleDataNode
@@ -335,7 +335,11 @@ def init_orchestrator():
         if _OrchestratorFactory._orchestrator is None:
             _OrchestratorFactory._build_orchestrator()
         _OrchestratorFactory._build_dispatcher(force_restart=True)
-        _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
+        _OrchestratorFactory._orchestrator.jobs_to_run = _JobQueue()
         _OrchestratorFactory._orchestrator.blocked_jobs = []
+        _OrchestratorFactory._orchestrator._blocked_jobs_by_input = {}
+        _OrchestratorFactory._orchestrator._unready_inputs_by_job = {}
+        _OrchestratorFactory._orchestrator._blocked_job_priorities = {}
+        _OrchestratorFactory._orchestrator._handoffs_by_submission = {}
 
     return _init_orchestrator